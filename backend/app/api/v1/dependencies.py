@@ -1,12 +1,11 @@
 from fastapi import Depends, HTTPException, status 
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials 
-from sqlmodel import select 
 from sqlmodel.ext.asyncio.session import AsyncSession 
 
-from app.core.security import verify_access_token 
 from app.db.session import get_session 
 from app.db.models.user import User 
-from app.schemas.token import TokenPayload 
+from app.services.auth_cache import get_user_cached, verify_access_token_cached 
+from app.services.token_service import is_family_revoked 
 
 resuable_oauth2 = HTTPBearer(
     scheme_name="Authorization"
@@ -21,10 +20,13 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    token_data = verify_access_token(token.credentials, credentials_exception) 
+    # Both lookups are served from memory for tokens and users seen recently;
+    # the session only opens a connection on a user cache miss.
+    token_data = verify_access_token_cached(token.credentials, credentials_exception) 
+    if is_family_revoked(token_data.fam): 
+        raise credentials_exception 
 
-    user_result = await session.execute(select(User).where(User.id == int(token_data.sub)))
-    user = user_result.scalar_one_or_none() 
+    user = await get_user_cached(session, int(token_data.sub)) 
 
     if user is None: 
         raise credentials_exception 
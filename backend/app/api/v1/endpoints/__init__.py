@@ -5,3 +5,4 @@ from .market_price_predict import router as market_price_predict
 from .disease_detect import router as disease_detect
 from .pest_detect import router as pest_detect
 from .get_schemes import router as get_schemes
+from .metrics import router as metrics
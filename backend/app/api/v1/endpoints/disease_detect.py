@@ -1,7 +1,17 @@
+import asyncio 
 from fastapi import APIRouter, UploadFile, File, HTTPException, status 
 from app.schemas.disease_detect import DetectionResponse 
-from app.services.disease_detect_service import detect_image, get_llm_response
-from app.utils.helpers import save_upload_file 
+from app.core.config import settings 
+from app.services.disease_detect_service import (
+    detect_image_bytes,
+    disease_model,
+    disease_result_cache,
+    get_disease_advice,
+    result_version,
+)
+from app.utils.cache import ResultCache 
+from app.utils.helpers import read_upload_file, persist_upload 
+from app.utils.inference_pool import inference_pool 
 
 router = APIRouter() 
 
@@ -9,15 +19,30 @@ router = APIRouter()
 async def detect(file: UploadFile = File(...)):
     
     try: 
-        path = await save_upload_file(file) 
+        data = await read_upload_file(file) 
     except HTTPException as he: 
         raise he 
+
+    if settings.UPLOAD_PERSIST: 
+        await asyncio.to_thread(persist_upload, data, file.filename) 
+
+    cache_key = ResultCache.key_for(data, result_version()) 
+    cached = await disease_result_cache.aget(cache_key) 
+    if cached is not None: 
+        return DetectionResponse(**cached) 
     
-    try:
-        counts = detect_image(path) 
-    except Exception as e: 
-        raise HTTPException(status_code=500, detail=str(e)) 
+    await disease_model.ensure() 
+    async with inference_pool.admission(): 
+        try:
+            counts = await inference_pool.run("disease.detect", detect_image_bytes, data) 
+        except Exception as e: 
+            raise HTTPException(status_code=500, detail=str(e)) 
     
-    llm_response = get_llm_response(counts)
+    llm_response = await get_disease_advice(counts)
+    response = DetectionResponse(class_counts=counts, llm_response=llm_response)
+
+    # Unparseable LLM output is not worth pinning in the cache.
+    if not (isinstance(llm_response, dict) and "raw" in llm_response): 
+        await disease_result_cache.aset(cache_key, response.model_dump()) 
     
-    return DetectionResponse(class_counts=counts, llm_response=llm_response) 
\ No newline at end of file
+    return response 
\ No newline at end of file
@@ -1,14 +1,35 @@
-from fastapi import APIRouter, HTTPException, status 
-from app.services.schemes import get_schemes 
+from fastapi import APIRouter, Header, HTTPException, Response, status 
+from app.services.scheme_catalog import scheme_catalog 
 from app.schemas.scheme import SchemesResponse
 
 router = APIRouter() 
 
+def _etag_matches(if_none_match: str | None, etag: str) -> bool: 
+    if not if_none_match: 
+        return False 
+    if if_none_match.strip() == "*": 
+        return True 
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")] 
+    return etag in candidates 
+
 @router.get("/", response_model=SchemesResponse, status_code=status.HTTP_202_ACCEPTED) 
-async def get_schemes_enpoint(): 
-    try: 
-        schemes = get_schemes() 
-    except Exception as e : 
-        raise HTTPException(status_code=500, detail=str(e)) 
-    
-    return schemes
\ No newline at end of file
+async def get_schemes_enpoint(if_none_match: str | None = Header(default=None)): 
+    snapshot = await scheme_catalog.ensure_loaded() 
+    if snapshot is None: 
+        raise HTTPException(status_code=503, detail=f"Schemes catalog unavailable: {scheme_catalog.last_error}") 
+
+    headers = {
+        "ETag": snapshot.etag,
+        "Cache-Control": "public, max-age=300",
+        "X-Catalog-Version": str(snapshot.version),
+        "X-Catalog-Fetched-At": snapshot.fetched_at,
+    }
+    if _etag_matches(if_none_match, snapshot.etag): 
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers) 
+
+    return Response(
+        content=snapshot.body,
+        status_code=status.HTTP_202_ACCEPTED,
+        media_type="application/json",
+        headers=headers,
+    )
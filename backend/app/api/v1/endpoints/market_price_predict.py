@@ -1,21 +1,153 @@
-from fastapi import APIRouter, HTTPException, status 
-from fastapi.responses import JSONResponse 
-from app.schemas.market_price import MarketPriceInput
-from app.services.market_price_service import predict_market_price
+import itertools 
+import json 
+from datetime import date, timedelta 
+from typing import List 
+
+from fastapi import APIRouter, HTTPException, Query, status 
+from fastapi.responses import JSONResponse, StreamingResponse 
+from app.core.config import settings 
+from app.schemas.market_price import (
+    MarketPriceInput,
+    MarketPriceBatchResponse,
+    MarketPriceGridRequest,
+    MarketPriceForecastPoint,
+    MarketPriceForecastResponse,
+)
+from app.services.market_price_service import market_model, predict_market_prices, grid_size, iter_grid
+from app.services.market_forecast_store import market_forecast_store, make_key
+from app.utils.inference_pool import inference_pool 
 
 router = APIRouter() 
 
+async def _predict(stage: str, inputs: List[MarketPriceInput]) -> List[float]: 
+    """Predicts `inputs` in the inference pool: 429 when busy, 500 if the model fails, 400 for bad input."""
+    async with inference_pool.admission(): 
+        try:
+            return await inference_pool.run(stage, predict_market_prices, inputs) 
+        except RuntimeError as e:
+            raise HTTPException(status_code=500, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=400, detail=f"Prediction failed: {e}") 
+
 @router.get("/", status_code=status.HTTP_202_ACCEPTED)
 async def predict_price(input_data: MarketPriceInput):
     
-    try:
-        predicted_price = predict_market_price(input_data)
-        return JSONResponse(
-            status_code=status.HTTP_202_ACCEPTED,
-            content={"predicted_price": predicted_price}
+    await market_model.ensure() 
+    predicted_prices = await _predict("market.single", [input_data]) 
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content={"predicted_price": predicted_prices[0]}
+    )
+    
+@router.post("/batch", response_model=MarketPriceBatchResponse, status_code=status.HTTP_202_ACCEPTED)
+async def predict_price_batch(inputs: List[MarketPriceInput]):
+    """Predicts a list of inputs in one model call; prices are returned in request order."""
+    if len(inputs) > settings.MARKET_PRICE_MAX_BATCH: 
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Batch size {len(inputs)} exceeds the limit of {settings.MARKET_PRICE_MAX_BATCH}; use /grid for larger requests",
+        )
+
+    await market_model.ensure() 
+    predicted_prices = await _predict("market.batch", inputs) 
+    return MarketPriceBatchResponse(predicted_prices=predicted_prices) 
+
+def _grid_lines(chunk: List[MarketPriceInput], prices: List[float]) -> str: 
+    lines = [
+        json.dumps({
+            "date": item.date.isoformat(),
+            "district": item.district,
+            "commodity": item.commodity,
+            "predicted_price": price,
+        })
+        for item, price in zip(chunk, prices)
+    ]
+    return "\n".join(lines) + "\n" 
+
+@router.post("/grid", status_code=status.HTTP_202_ACCEPTED)
+async def predict_price_grid(grid: MarketPriceGridRequest):
+    """
+    Predicts every (date, district, commodity) combination of the grid.
+
+    Results are streamed as NDJSON, one {date, district, commodity,
+    predicted_price} object per line, in date, district, commodity order. The grid is predicted in chunks of
+    MARKET_PRICE_MAX_BATCH rows so memory stays flat for large grids.
+
+    The first chunk is predicted before the response starts, so a busy pool
+    (429) or an invalid grid (400) is reported with its status code. If a
+    later chunk fails, the stream ends with one {"error", "status_code"} line
+    (and has fewer than X-Total-Rows rows).
+    """
+    total = grid_size(grid) 
+    if total > settings.MARKET_PRICE_MAX_GRID: 
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Grid of {total} combinations exceeds the limit of {settings.MARKET_PRICE_MAX_GRID}",
         )
-    except RuntimeError as e:
-        raise HTTPException(status_code=500, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Prediction failed: {e}") 
-    
\ No newline at end of file
+
+    await market_model.ensure() 
+    rows = iter_grid(grid) 
+    first_chunk = list(itertools.islice(rows, settings.MARKET_PRICE_MAX_BATCH)) 
+    first_prices = await _predict("market.grid", first_chunk) 
+
+    async def stream_rows(): 
+        chunk, prices = first_chunk, first_prices 
+        while chunk: 
+            yield _grid_lines(chunk, prices) 
+            chunk = list(itertools.islice(rows, settings.MARKET_PRICE_MAX_BATCH)) 
+            if not chunk: 
+                break 
+            try: 
+                prices = await _predict("market.grid", chunk) 
+            except HTTPException as e: 
+                yield json.dumps({"error": e.detail, "status_code": e.status_code}) + "\n" 
+                return 
+
+    return StreamingResponse(
+        stream_rows(),
+        status_code=status.HTTP_202_ACCEPTED,
+        media_type="application/x-ndjson",
+        headers={"X-Total-Rows": str(total)},
+    )
+
+@router.get("/forecast", response_model=MarketPriceForecastResponse, status_code=status.HTTP_202_ACCEPTED)
+async def predict_price_forecast(
+    state: str,
+    district: str,
+    commodity: str,
+    variety: str,
+    grade: str,
+    market: str = "",
+    start_date: date | None = None,
+    days: int = Query(7, ge=1),
+):
+    """
+    Daily prices for one commodity in one district over the next `days` days.
+
+    Served from the nightly precomputed store when the whole range is
+    covered; otherwise all dates are predicted in one batched model call.
+    """
+    if days > settings.MARKET_FORECAST_MAX_DAYS: 
+        raise HTTPException(status_code=400, detail=f"days must be at most {settings.MARKET_FORECAST_MAX_DAYS}")
+
+    start = start_date or date.today() 
+    dates = [start + timedelta(days=d) for d in range(days)] 
+
+    source = "precomputed" 
+    prices = market_forecast_store.lookup(make_key(state, district, commodity, variety, grade), start, days) 
+    if prices is None: 
+        source = "model" 
+        inputs = [
+            MarketPriceInput(
+                date=d, state=state, district=district, market=market,
+                commodity=commodity, variety=variety, grade=grade,
+            )
+            for d in dates
+        ]
+        await market_model.ensure() 
+        prices = await _predict("market.forecast", inputs) 
+
+    return MarketPriceForecastResponse(
+        source=source,
+        prices=[MarketPriceForecastPoint(date=d, predicted_price=p) for d, p in zip(dates, prices)],
+    )
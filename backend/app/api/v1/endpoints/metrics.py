@@ -0,0 +1,43 @@
+from fastapi import APIRouter 
+from app.schemas.metrics import InferenceMetricsResponse, CacheMetricsResponse, MemoryMetricsResponse, DbPoolMetrics 
+from app.services.metrics_service import get_inference_metrics, get_cache_metrics, get_memory_metrics, get_db_metrics
+from app.utils.api_models import ApiResponse
+
+router = APIRouter() 
+
+@router.get('/inference', response_model=ApiResponse[InferenceMetricsResponse])
+def inference_metrics():
+    data = get_inference_metrics()
+    return ApiResponse(
+        status_code=200,
+        data=InferenceMetricsResponse(**data)
+    ).to_response()
+
+
+@router.get('/cache', response_model=ApiResponse[CacheMetricsResponse])
+def cache_metrics():
+    data = get_cache_metrics()
+    return ApiResponse(
+        status_code=200,
+        data=CacheMetricsResponse(**data)
+    ).to_response()
+
+
+@router.get('/memory', response_model=ApiResponse[MemoryMetricsResponse])
+def memory_metrics():
+    """Memory of the worker serving the request; uss is what it does not share with other workers."""
+    data = get_memory_metrics()
+    return ApiResponse(
+        status_code=200,
+        data=MemoryMetricsResponse(**data)
+    ).to_response()
+
+
+@router.get('/db', response_model=ApiResponse[DbPoolMetrics])
+def db_metrics():
+    """Connection pool of this worker; utilization near 1 means requests are waiting for connections."""
+    data = get_db_metrics()
+    return ApiResponse(
+        status_code=200,
+        data=DbPoolMetrics(**data)
+    ).to_response()
@@ -1,22 +1,24 @@
-from fastapi import APIRouter, File, UploadFile, HTTPException, status
+from fastapi import APIRouter, File, UploadFile, HTTPException, Response, status
 from app.services.pest_detect_service import PredictService 
 from app.schemas.pest_detect import PestResposne 
-from app.utils.pests import pests 
-from app.utils.pest_name import pest_name
 
 router = APIRouter() 
 
-@router.post("/", status_code=status.HTTP_202_ACCEPTED) 
+@router.post("/", response_model=PestResposne, status_code=status.HTTP_202_ACCEPTED) 
 async def detect_pest(file: UploadFile = File(...)):
     content = await file.read() 
     try: 
-        pest_name_pred, pest_data, images = PredictService.get_pest_info(content) 
+        # Already in the PestResposne shape, with the pest details pre-serialized.
+        body = await PredictService.get_pest_response_async(content) 
 
-        return PestResposne(
-            pest=pest_name_pred,
-            data = pest_data, 
-            images=images
+        return Response(
+            content=body,
+            status_code=status.HTTP_202_ACCEPTED,
+            media_type="application/json",
             ) 
 
+    except HTTPException: 
+        # 429 from admission control, 503 while the model is unavailable
+        raise 
     except Exception as e: 
         raise HTTPException(status_code=500, detail=str(e))
@@ -8,18 +8,12 @@ from app.schemas.user import (
     UserCreateResponse,
     LoginRequest
 )
-from app.schemas.token import Token, RefreshTokenRequest, TokenPayload 
+from app.schemas.token import Token, RefreshTokenRequest 
 
-from app.services import user_service
+from app.services import user_service, token_service
 
 from app.db.session import get_session
 from app.utils.api_models import ApiResponse, ApiError
-from app.core.security import (
-    create_access_token,
-    create_refresh_token,
-    verify_refresh_token
-)
-
 from app.api.v1.dependencies import get_current_active_user
 from app.db.models.user import User
 
@@ -33,10 +27,7 @@ async def register_user(
     try:
         new_user = await user_service.create_user(session=session, user_in=user_in)
 
-        access_token = create_access_token(subject=new_user.id)
-        refresh_token = create_refresh_token(subject=new_user.id)
-
-        token_data = Token(access_token=access_token, refresh_token=refresh_token)
+        token_data = token_service.issue_tokens(new_user.id)
         user_public_data = UserPublic(id=new_user.id, email=new_user.email, createdAt=new_user.createdAt)
         response_data = UserCreateResponse(user=user_public_data, tokens=token_data)
 
@@ -79,35 +70,15 @@ async def login_for_access_token(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    access_token = create_access_token(subject=user.id)
-    refresh_token = create_refresh_token(subject=user.id)
-
-    token_data = Token(access_token=access_token, refresh_token=refresh_token)
+    token_data = token_service.issue_tokens(user.id)
     return ApiResponse(status_code=status.HTTP_200_OK, data=token_data, message="Login successful")
 
 
 @router.post("/refresh", response_model=ApiResponse[Token])
-async def refresh_access_token(
-    refresh_request: RefreshTokenRequest,
-    session: AsyncSession = Depends(get_session)
-):
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate refresh token",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
+async def refresh_access_token(refresh_request: RefreshTokenRequest):
+    # Rotation is checked against the in-memory revocation store, not the database.
     try:
-        token_data: TokenPayload = verify_refresh_token(refresh_request.refresh_token, credentials_exception)
-
-        user = await user_service.get_user_by_id(session=session, user_id=int(token_data.sub))
-
-        if not user:
-            raise credentials_exception
-
-        new_access_token = create_access_token(subject=user.id)
-        new_refresh_token = create_refresh_token(subject=user.id)
-
-        new_token_data = Token(access_token=new_access_token, refresh_token=new_refresh_token)
+        new_token_data = token_service.rotate_refresh_token(refresh_request.refresh_token)
         return ApiResponse(status_code=status.HTTP_200_OK, data=new_token_data, message="Token refreshed successfully")
 
     except HTTPException as http_exc:
@@ -115,7 +86,18 @@ async def refresh_access_token(
     
     except Exception as e:
         print(f"Error refreshing token: {e}")
-        raise credentials_exception
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate refresh token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+@router.post("/logout", response_model=ApiResponse[None])
+async def logout(refresh_request: RefreshTokenRequest):
+    """Ends the session: its refresh tokens and the access tokens issued with them stop working."""
+    token_service.revoke_refresh_token(refresh_request.refresh_token)
+    return ApiResponse(status_code=status.HTTP_200_OK, data=None, message="Logged out successfully")
 
 
 @router.get("/me", response_model=ApiResponse[UserPublic]) 
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query, Response
 from app.services.weather_service import fetch_weather_data
 from app.schemas.weather import WeatherResponse
 import logging
@@ -7,24 +7,36 @@ router = APIRouter()
 logger = logging.getLogger(__name__)
 
 @router.get("/", response_model=WeatherResponse)
-async def get_weather(location: str):
+async def get_weather(
+    location: str,
+    days: int | None = Query(None, ge=1, le=15, description="Number of forecast days, starting today"),
+    hours: bool = Query(True, description="Include hourly forecasts"),
+    fields: str | None = Query(
+        None,
+        description="Comma-separated field mask: current, forecast, forecast.day, forecast.astro, forecast.hour",
+    ),
+):
     """
     Fetch weather data for a given location.
 
     Args:
         location (str): The location to fetch weather data for (e.g., "Delhi").
+        days (int | None): Limit the forecast to this many days.
+        hours (bool): Set to false to drop hourly data.
+        fields (str | None): Only return these parts of the response; the rest is null.
 
     Returns:
-        WeatherResponse: The weather data in the defined schema.
+        WeatherResponse: The weather data in the defined schema, pre-serialized
+        by the service (see app/utils/weather_mapper.py).
 
     Raises:
         HTTPException: If the request fails or the location is invalid.
     """
     logger.info(f"Received request for weather data: location='{location}'")
     try:
-        weather_data = await fetch_weather_data(location)
+        weather_data = await fetch_weather_data(location, days=days, hours=hours, fields=fields)
         logger.debug(f"Returning weather data for '{location}'")
-        return weather_data
+        return Response(content=weather_data, media_type="application/json")
     except HTTPException as e:
         logger.warning(f"HTTPException: Status={e.status_code}, Detail={e.detail}")
         raise e
@@ -1,6 +1,7 @@
 # app/core/config.py
 print("DEBUG: Starting config.py execution") 
 import os
+from pydantic import Field
 from pydantic_settings import BaseSettings
 from dotenv import load_dotenv
 print("DEBUG: Imports successful in config.py")
@@ -16,20 +17,142 @@ except Exception as e:
     print(f"ERROR: Exception during load_dotenv: {e}") 
 
 
+# Number of classes of the pest classifier (class ids "1".."40").
+PEST_NUM_CLASSES = 40
+
 print("DEBUG: Defining Settings class") 
 class Settings(BaseSettings):
     PROJECT_NAME: str = "Weather App API"
     API_V1_STR: str = "/api/v1"
 
     DATABASE_URL: str | None = os.getenv("DATABASE_URL")
+    # Async engine tuning (see app/db/engine.py). Pool settings are ignored for SQLite.
+    DB_ECHO: bool = os.getenv("DB_ECHO", "false").lower() == "true"
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT_SECONDS: float = float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "10"))
+    DB_POOL_RECYCLE_SECONDS: int = int(os.getenv("DB_POOL_RECYCLE_SECONDS", "1800"))
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+    # asyncpg prepared statement cache; set to 0 behind PgBouncer in transaction mode.
+    DB_STATEMENT_CACHE_SIZE: int = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "100"))
+    # asyncpg ssl mode ("require", "verify-full", ...); empty disables ssl.
+    DB_SSL: str = os.getenv("DB_SSL", "require")
+    # Schema handling at startup: check | migrate | create | skip (see app/db/migrate.py).
+    DB_SCHEMA_MODE: str = os.getenv("DB_SCHEMA_MODE", "migrate")
     
     ACCESS_TOKEN_SECRET: str = os.getenv("ACCESS_TOKEN_SECRET", "your_access_secret")
     REFRESH_TOKEN_SECRET: str = os.getenv("REFRESH_TOKEN_SECRET", "your_refresh_secret")
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRY_MINUTES: int = int(os.getenv("ACCESS_TOKEN_EXPIRY_MINUTES", "30"))
     REFRESH_TOKEN_EXPIRE_DAYS: int = int(os.getenv("REFRESH_TOKEN_EXPIRY_DAYS", "7"))
+    # Password hashing runs on its own bounded thread pool (bcrypt releases the GIL).
+    # Changing BCRYPT_ROUNDS rehashes each user's password on their next login.
+    BCRYPT_ROUNDS: int = int(os.getenv("BCRYPT_ROUNDS", "12"))
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+    PASSWORD_HASH_MAX_PENDING: int = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "32"))
+    # Refresh token rotation: used tokens and logged-out sessions are appended to
+    # this file, shared by all workers of the host. An empty value keeps them in
+    # process memory only, which is only safe with a single worker.
+    TOKEN_REVOCATION_PATH: str = os.getenv("TOKEN_REVOCATION_PATH", os.path.join(os.getcwd(), "cache", "token_revocations.log"))
+    TOKEN_REVOCATION_BLOOM_BITS: int = int(os.getenv("TOKEN_REVOCATION_BLOOM_BITS", str(1 << 20)))
+    # Auth fast path: decoded access tokens are cached until they expire and user
+    # principals for a short TTL, so authenticated requests skip the DB lookup.
+    AUTH_USER_CACHE_TTL_SECONDS: int = int(os.getenv("AUTH_USER_CACHE_TTL_SECONDS", "60"))
+    AUTH_USER_CACHE_MAX_ENTRIES: int = int(os.getenv("AUTH_USER_CACHE_MAX_ENTRIES", "10000"))
+    AUTH_TOKEN_CACHE_MAX_ENTRIES: int = int(os.getenv("AUTH_TOKEN_CACHE_MAX_ENTRIES", "10000"))
 
     WEATHER_API_KEY: str | None = os.getenv("WEATHER_API_KEY")
+    WEATHER_MAX_CONNECTIONS: int = int(os.getenv("WEATHER_MAX_CONNECTIONS", "32"))
+    WEATHER_CACHE_MAX_ENTRIES: int = int(os.getenv("WEATHER_CACHE_MAX_ENTRIES", "2048"))
+    WEATHER_CACHE_TTL_SECONDS: int = int(os.getenv("WEATHER_CACHE_TTL_SECONDS", "600"))
+    WEATHER_CACHE_STALE_SECONDS: int = int(os.getenv("WEATHER_CACHE_STALE_SECONDS", "1800"))
+    WEATHER_VALIDATE_RESPONSES: bool = os.getenv("WEATHER_VALIDATE_RESPONSES", "false").lower() == "true"
+
+    # Shared async Groq client. GROQ_BASE_URL can point at a local stub.
+    GROQ_API_KEY: str | None = os.getenv("GROQ_API_KEY")
+    GROQ_BASE_URL: str | None = os.getenv("GROQ_BASE_URL")
+    LLM_TIMEOUT_SECONDS: float = float(os.getenv("LLM_TIMEOUT_SECONDS", "120"))
+    LLM_MAX_CONCURRENCY: int = int(os.getenv("LLM_MAX_CONCURRENCY", "8"))
+    LLM_MAX_RETRIES: int = int(os.getenv("LLM_MAX_RETRIES", "2"))
+
+    # Models are loaded on first use. With MODEL_WARMUP they are also loaded in the
+    # background at startup; MODEL_WARMUP_MODELS limits which ones (comma separated, empty = all).
+    MODEL_WARMUP: bool = os.getenv("MODEL_WARMUP", "true").lower() == "true"
+    MODEL_WARMUP_MODELS: str = os.getenv("MODEL_WARMUP_MODELS", "")
+    # Memory-map weight files where the format allows it, so workers share the pages.
+    MODEL_MMAP_WEIGHTS: bool = os.getenv("MODEL_MMAP_WEIGHTS", "true").lower() == "true"
+
+    # Pest classifier backend: "torch" (fp32), "int8" (dynamically quantized, CPU) or
+    # "onnx" (ONNX Runtime, needs onnxruntime and an export: python export_models.py pest)
+    PEST_BACKEND: str = os.getenv("PEST_BACKEND", "torch")
+    PEST_ONNX_PATH: str = os.getenv("PEST_ONNX_PATH", os.path.join(os.getcwd(), "ml_models", "pest_model.onnx"))
+    PEST_ONNX_THREADS: int = int(os.getenv("PEST_ONNX_THREADS", "0"))
+
+    # Disease detector backend: "torch" (best.pt), "onnx" or "openvino" (exports made
+    # with python export_models.py disease, at the same DISEASE_IMGSZ)
+    DISEASE_BACKEND: str = os.getenv("DISEASE_BACKEND", "torch")
+    # Network input size. Unset: best.pt runs at the size it was trained at and
+    # exports at the export default (640), since their input shape is static.
+    DISEASE_IMGSZ: int | None = int(os.getenv("DISEASE_IMGSZ", "0")) or None
+    DISEASE_ONNX_PATH: str = os.getenv("DISEASE_ONNX_PATH", os.path.join(os.getcwd(), "ml_models", "best.onnx"))
+    DISEASE_OPENVINO_PATH: str = os.getenv("DISEASE_OPENVINO_PATH", os.path.join(os.getcwd(), "ml_models", "best_openvino_model"))
+
+    # Decode pest uploads at reduced size (JPEG draft mode) instead of full resolution
+    PEST_FAST_DECODE: bool = os.getenv("PEST_FAST_DECODE", "true").lower() == "true"
+
+    # Pest predictions: number of classes returned, and the top-1 probability below
+    # which the result is reported as "unknown" (optionally without pest details)
+    PEST_TOP_K: int = Field(
+        default=int(os.getenv("PEST_TOP_K", "3")), ge=1, le=PEST_NUM_CLASSES, validate_default=True
+    )
+    PEST_MIN_CONFIDENCE: float = float(os.getenv("PEST_MIN_CONFIDENCE", "0.5"))
+    PEST_SKIP_LOW_CONFIDENCE_DETAILS: bool = os.getenv("PEST_SKIP_LOW_CONFIDENCE_DETAILS", "true").lower() == "true"
+
+    # Pest classifier micro-batching
+    PEST_BATCH_MAX_SIZE: int = int(os.getenv("PEST_BATCH_MAX_SIZE", "8"))
+    PEST_BATCH_MAX_WAIT_MS: float = float(os.getenv("PEST_BATCH_MAX_WAIT_MS", "10"))
+
+    # Inference executor shared by the disease and pest services.
+    # INFERENCE_WORKERS=0 means one worker per CPU.
+    INFERENCE_EXECUTOR: str = os.getenv("INFERENCE_EXECUTOR", "thread")
+    INFERENCE_WORKERS: int = int(os.getenv("INFERENCE_WORKERS", "0"))
+    INFERENCE_MAX_PENDING: int = int(os.getenv("INFERENCE_MAX_PENDING", "16"))
+
+    # Market price batch / grid prediction limits
+    MARKET_PRICE_MAX_BATCH: int = int(os.getenv("MARKET_PRICE_MAX_BATCH", "1000"))
+    MARKET_PRICE_MAX_GRID: int = int(os.getenv("MARKET_PRICE_MAX_GRID", "100000"))
+    # Encode features with the pre-compiled vocabularies instead of pandas when possible
+    MARKET_COMPILED_ENCODER: bool = os.getenv("MARKET_COMPILED_ENCODER", "true").lower() == "true"
+
+    # Nightly precomputed market price forecasts. MARKET_COMBINATIONS_PATH is a CSV
+    # with State, District, Commodity, Variety, Grade columns.
+    MARKET_COMBINATIONS_PATH: str = os.getenv("MARKET_COMBINATIONS_PATH", os.path.join(os.getcwd(), "ml_models", "market_combinations.csv"))
+    MARKET_FORECAST_STORE_PATH: str = os.getenv("MARKET_FORECAST_STORE_PATH", os.path.join(os.getcwd(), "cache", "market_forecast.npz"))
+    MARKET_FORECAST_HORIZON_DAYS: int = int(os.getenv("MARKET_FORECAST_HORIZON_DAYS", "30"))
+    MARKET_FORECAST_REFRESH_HOUR: int = int(os.getenv("MARKET_FORECAST_REFRESH_HOUR", "2"))
+    # How often workers check the store file for a newer build.
+    MARKET_FORECAST_RELOAD_SECONDS: int = int(os.getenv("MARKET_FORECAST_RELOAD_SECONDS", "300"))
+    MARKET_FORECAST_MAX_DAYS: int = int(os.getenv("MARKET_FORECAST_MAX_DAYS", "90"))
+
+    # Keep a content-addressed copy of every disease upload under static/uploads
+    UPLOAD_PERSIST: bool = os.getenv("UPLOAD_PERSIST", "false").lower() == "true"
+
+    # Prediction result cache keyed on uploaded image bytes.
+    # RESULT_CACHE_DIR enables the on-disk tier.
+    RESULT_CACHE_MAX_ENTRIES: int = int(os.getenv("RESULT_CACHE_MAX_ENTRIES", "1024"))
+    RESULT_CACHE_TTL_SECONDS: int = int(os.getenv("RESULT_CACHE_TTL_SECONDS", "86400"))
+    RESULT_CACHE_DIR: str | None = os.getenv("RESULT_CACHE_DIR")
+    RESULT_CACHE_MAX_DISK_ENTRIES: int = int(os.getenv("RESULT_CACHE_MAX_DISK_ENTRIES", "10000"))
+
+    # Disease advice memoized by normalized class-count signature
+    LLM_ADVICE_CACHE_DIR: str = os.getenv("LLM_ADVICE_CACHE_DIR", os.path.join(os.getcwd(), "cache"))
+    LLM_ADVICE_TTL_SECONDS: int = int(os.getenv("LLM_ADVICE_TTL_SECONDS", str(30 * 86400)))
+    LLM_ADVICE_PREWARM: bool = os.getenv("LLM_ADVICE_PREWARM", "true").lower() == "true"
+
+    # Government schemes catalog, refreshed in the background
+    SCHEMES_CATALOG_PATH: str = os.getenv("SCHEMES_CATALOG_PATH", os.path.join(os.getcwd(), "cache", "schemes_catalog.json"))
+    SCHEMES_REFRESH_SECONDS: int = int(os.getenv("SCHEMES_REFRESH_SECONDS", str(6 * 3600)))
+    SCHEMES_RETRY_SECONDS: int = int(os.getenv("SCHEMES_RETRY_SECONDS", "300"))
 
     class Config:
         case_sensitive = True
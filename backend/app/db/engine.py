@@ -0,0 +1,49 @@
+"""
+Async engine factory, kept apart from `app.db.session` so that scripts and
+tests can build engines without creating the app's global one.
+"""
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine
+from sqlalchemy.pool import QueuePool
+from app.core.config import Settings, settings
+
+def create_engine_from_settings(config: Settings = settings, url: str | None = None) -> AsyncEngine:
+    """
+    Builds the async engine from `Settings`.
+
+    Postgres (asyncpg) gets a bounded pool with pre-ping and recycling, the
+    asyncpg statement cache size and the ssl mode. SQLite URLs (local runs,
+    scripts) only get echo/pre-ping, since their pool is chosen by the dialect.
+    """
+    url = make_url(url or config.DATABASE_URL)
+    kwargs = {"echo": config.DB_ECHO, "pool_pre_ping": config.DB_POOL_PRE_PING}
+    if url.get_backend_name() != "sqlite":
+        kwargs.update(
+            pool_size=config.DB_POOL_SIZE,
+            max_overflow=config.DB_MAX_OVERFLOW,
+            pool_timeout=config.DB_POOL_TIMEOUT_SECONDS,
+            pool_recycle=config.DB_POOL_RECYCLE_SECONDS,
+        )
+    if url.get_driver_name() == "asyncpg":
+        connect_args = {"statement_cache_size": config.DB_STATEMENT_CACHE_SIZE}
+        if config.DB_SSL:
+            connect_args["ssl"] = config.DB_SSL
+        kwargs["connect_args"] = connect_args
+    return create_async_engine(url, **kwargs)
+
+def pool_snapshot(engine: AsyncEngine) -> dict:
+    pool = engine.sync_engine.pool
+    snapshot = {"pool": type(pool).__name__, "status": pool.status()}
+    if isinstance(pool, QueuePool):
+        size = pool.size()
+        checked_out = pool.checkedout()
+        capacity = size + max(0, pool._max_overflow)
+        snapshot.update(
+            size=size,
+            checked_in=pool.checkedin(),
+            checked_out=checked_out,
+            overflow=max(0, pool.overflow()),
+            capacity=capacity,
+            utilization=round(checked_out / capacity, 3) if capacity else None,
+        )
+    return snapshot
@@ -0,0 +1,167 @@
+"""
+Schema versioning for the application database.
+
+The applied version is kept in a `schema_version` table, one row per
+migration from `app/db/migrations`. At startup `ensure_schema` runs
+according to DB_SCHEMA_MODE:
+
+- `check`: one `SELECT max(version)`; refuses to start if the database is
+  behind the code. Use this when migrations run as a release step.
+- `migrate`: the same query, and only if it is behind, applies the pending
+  migrations under a Postgres advisory lock so concurrent workers do not race.
+- `create`: the old `SQLModel.metadata.create_all` (prototyping only).
+- `skip`: nothing.
+
+Command line:
+
+    python -m app.db.migrate upgrade [--to N]
+    python -m app.db.migrate current
+"""
+import argparse
+import asyncio
+import importlib
+import logging
+import pkgutil
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from types import ModuleType
+
+import sqlalchemy as sa
+from sqlalchemy.exc import OperationalError, ProgrammingError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.db import migrations
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_MODES = ("check", "migrate", "create", "skip")
+# Arbitrary constant shared by every process that migrates this database.
+ADVISORY_LOCK_KEY = 7_240_524
+
+schema_version = sa.Table(
+    "schema_version",
+    sa.MetaData(),
+    sa.Column("version", sa.Integer, primary_key=True),
+    sa.Column("description", sa.String, nullable=False),
+    sa.Column("applied_at", sa.DateTime, nullable=False),
+)
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    module: ModuleType
+
+    @property
+    def description(self) -> str:
+        return getattr(self.module, "description", self.name)
+
+
+def load_migrations() -> list[Migration]:
+    found = []
+    for info in pkgutil.iter_modules(migrations.__path__):
+        match = re.fullmatch(r"(\d{4})_\w+", info.name)
+        if match is None:
+            continue
+        module = importlib.import_module(f"{migrations.__name__}.{info.name}")
+        found.append(Migration(int(match.group(1)), info.name, module))
+    found.sort(key=lambda m: m.version)
+    versions = [m.version for m in found]
+    if len(set(versions)) != len(versions):
+        raise RuntimeError(f"Duplicate migration versions in {migrations.__name__}: {versions}")
+    return found
+
+
+def latest_version() -> int:
+    found = load_migrations()
+    return found[-1].version if found else 0
+
+
+async def current_version(engine: AsyncEngine) -> int | None:
+    """Applied schema version, or None if the database has never been migrated."""
+    async with engine.connect() as conn:
+        try:
+            result = await conn.execute(sa.select(sa.func.max(schema_version.c.version)))
+        except (OperationalError, ProgrammingError):
+            # schema_version does not exist yet
+            return None
+        return result.scalar()
+
+
+def _upgrade(connection, target: int) -> list[int]:
+    if connection.dialect.name == "postgresql":
+        connection.execute(sa.text("SELECT pg_advisory_xact_lock(:key)"), {"key": ADVISORY_LOCK_KEY})
+    schema_version.create(connection, checkfirst=True)
+    # Re-read under the lock: another worker may have migrated while we waited.
+    applied = connection.execute(sa.select(sa.func.max(schema_version.c.version))).scalar() or 0
+
+    done = []
+    for migration in load_migrations():
+        if migration.version <= applied or migration.version > target:
+            continue
+        logger.info(f"Applying migration {migration.name}")
+        migration.module.upgrade(connection)
+        connection.execute(
+            schema_version.insert().values(
+                version=migration.version,
+                description=migration.description,
+                applied_at=datetime.now(),
+            )
+        )
+        done.append(migration.version)
+    return done
+
+
+async def upgrade(engine: AsyncEngine, target: int | None = None) -> list[int]:
+    """Applies pending migrations up to `target` (default: latest) in one transaction."""
+    target = latest_version() if target is None else target
+    async with engine.begin() as conn:
+        done = await conn.run_sync(_upgrade, target)
+    if done:
+        logger.info(f"Database migrated to version {done[-1]}")
+    return done
+
+
+async def ensure_schema(engine: AsyncEngine, mode: str):
+    if mode not in SCHEMA_MODES:
+        raise ValueError(f"Unknown DB_SCHEMA_MODE '{mode}', expected one of {', '.join(SCHEMA_MODES)}")
+    if mode == "skip":
+        return
+    if mode == "create":
+        from app.db.session import create_db_and_tables
+        await create_db_and_tables()
+        return
+
+    latest = latest_version()
+    current = await current_version(engine)
+    if current is not None and current >= latest:
+        logger.info(f"Database schema is at version {current}")
+        return
+    if mode == "check":
+        raise RuntimeError(
+            f"Database schema is at version {current or 0}, code expects {latest}; "
+            "run `python -m app.db.migrate upgrade`"
+        )
+    await upgrade(engine, latest)
+
+
+async def _main(args):
+    from app.db.session import engine
+
+    try:
+        if args.command == "current":
+            print(f"current: {await current_version(engine)}  latest: {latest_version()}")
+        else:
+            done = await upgrade(engine, args.to)
+            print(f"applied: {done or 'nothing'}  current: {await current_version(engine)}")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m app.db.migrate")
+    parser.add_argument("command", choices=("upgrade", "current"), nargs="?", default="upgrade")
+    parser.add_argument("--to", type=int, default=None, help="target version (default: latest)")
+    asyncio.run(_main(parser.parse_args()))
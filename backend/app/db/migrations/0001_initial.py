@@ -0,0 +1,22 @@
+import sqlalchemy as sa
+
+description = "users table"
+
+metadata = sa.MetaData()
+
+sa.Table(
+    "user",
+    metadata,
+    sa.Column("id", sa.Integer, primary_key=True),
+    sa.Column("email", sa.String, nullable=False),
+    sa.Column("password", sa.String, nullable=False),
+    sa.Column("createdAt", sa.DateTime, nullable=False),
+    sa.Column("accessToken", sa.String, nullable=True),
+    sa.Column("refreshToken", sa.String, nullable=True),
+    sa.Index("ix_user_email", "email", unique=True),
+)
+
+
+def upgrade(connection):
+    # checkfirst: databases created by the old create_all() at startup already have the table.
+    metadata.create_all(connection, checkfirst=True)
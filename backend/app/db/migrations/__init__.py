@@ -0,0 +1,10 @@
+"""
+Versioned schema migrations, applied in order by `app.db.migrate`.
+
+Each module is named `NNNN_<slug>.py` (the number is the schema version)
+and defines a `description` string and `upgrade(connection)`, which gets a
+synchronous SQLAlchemy Connection inside the migration transaction.
+Migrations describe the schema as it was at that version with plain
+SQLAlchemy Core, never the current SQLModel classes, so they replay the
+same way on a fresh database later on.
+"""
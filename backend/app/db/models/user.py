@@ -7,5 +7,3 @@ class User(SQLModel, table=True):
     email: str = Field(index=True, unique=True) 
     password: str 
     createdAt: datetime = Field(default_factory=datetime.now, nullable=False)
-    accessToken: Optional[str] = Field(default=None) 
-    refreshToken: Optional[str] = Field(default=None) 
\ No newline at end of file
@@ -1,10 +1,10 @@
-from sqlmodel import SQLModel 
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession 
-from sqlalchemy.orm import sessionmaker 
-from app.core.config import DATABASE_URL 
-from typing import AsyncIterator 
+from sqlmodel import SQLModel
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+from app.db.engine import create_engine_from_settings
+from typing import AsyncIterator
 
-engine = create_async_engine(DATABASE_URL, echo=True, future=True, connect_args={"ssl": "require"})
+engine = create_engine_from_settings()
 
 AsyncSessionLocal = sessionmaker(
     bind=engine, class_=AsyncSession, expire_on_commit=False 
@@ -5,11 +5,23 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.requests import Request
 from fastapi.staticfiles import StaticFiles
 
+import asyncio
 from contextlib import asynccontextmanager 
 
 from app.utils.api_models import ApiError
-from app.db.session import create_db_and_tables
-from app.api.v1.endpoints import healthcheck, users, weather, market_price_predict, disease_detect, pest_detect, get_schemes
+from app.core.config import settings
+from app.db.session import engine
+from app.db.migrate import ensure_schema
+from app.services.disease_detect_service import prewarm_advice_cache
+from app.services.llm_client import llm_client
+from app.services import weather_service
+from app.services.pest_detect_service import pest_batcher
+from app.services.scheme_catalog import scheme_catalog
+from app.services.market_forecast_store import market_forecast_store
+from app.utils.inference_pool import inference_pool
+from app.core.security import password_pool
+from app.utils.model_registry import model_registry
+from app.api.v1.endpoints import healthcheck, users, weather, market_price_predict, disease_detect, pest_detect, get_schemes, metrics
 
 # Configure logging
 logging.basicConfig(
@@ -21,10 +33,32 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def lifespan(app:FastAPI):
     logger.info("Starting up Pragati Backend API....")
-    print("Creating database tables") 
-    await create_db_and_tables()
-    print("Database tables created") 
+    await ensure_schema(engine, settings.DB_SCHEMA_MODE)
+    await pest_batcher.start()
+    await weather_service.startup()
+    await scheme_catalog.start()
+    await market_forecast_store.start()
+    warmup_task = None
+    if settings.MODEL_WARMUP:
+        # Models also load on first use; this only gets them ready before traffic does.
+        names = [n.strip() for n in settings.MODEL_WARMUP_MODELS.split(",") if n.strip()]
+        warmup_task = asyncio.create_task(model_registry.warm_up(names or None))
+    prewarm_task = None
+    if settings.LLM_ADVICE_PREWARM:
+        # Runs in the background so startup does not wait on the LLM.
+        prewarm_task = asyncio.create_task(prewarm_advice_cache())
     yield 
+    if prewarm_task is not None:
+        prewarm_task.cancel()
+    if warmup_task is not None:
+        warmup_task.cancel()
+    await scheme_catalog.stop()
+    await market_forecast_store.stop()
+    await pest_batcher.stop()
+    await llm_client.shutdown()
+    await weather_service.shutdown()
+    inference_pool.shutdown()
+    password_pool.shutdown()
     logger.info("Shutting down Pragati Backend API")
     print("Shutting down...") 
 
@@ -61,4 +95,5 @@ app.include_router(weather, prefix="/api/v1/weather", tags=["Weather"])
 app.include_router(market_price_predict, prefix="/api/v1/market-price", tags=["Market-Price"])
 app.include_router(disease_detect, prefix="/api/v1/disease-detect", tags=["Disease-Detect"])
 app.include_router(pest_detect, prefix="/api/v1/pest-detect", tags=["Pest-Detect"])
-app.include_router(get_schemes, prefix="/api/v1/schemes", tags=['Schemes'])
\ No newline at end of file
+app.include_router(get_schemes, prefix="/api/v1/schemes", tags=['Schemes'])
+app.include_router(metrics, prefix="/api/v1/metrics", tags=['Metrics'])
\ No newline at end of file
@@ -1,4 +1,13 @@
+from typing import Dict, Optional
 from pydantic import BaseModel 
 
+class ModelStatus(BaseModel):
+    state: str 
+    path: str 
+    load_seconds: Optional[float] = None 
+    error: Optional[str] = None 
+
 class HealthCheckResponse(BaseModel):
     status: str 
+    ready: bool = True 
+    models: Dict[str, ModelStatus] = {} 
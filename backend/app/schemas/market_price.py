@@ -1,5 +1,6 @@
 from pydantic import BaseModel 
 from datetime import date 
+from typing import List 
 
 class MarketPriceInput(BaseModel):
     date: date
@@ -10,3 +11,22 @@ class MarketPriceInput(BaseModel):
     variety: str
     grade: str
 
+class MarketPriceBatchResponse(BaseModel):
+    predicted_prices: List[float]
+
+class MarketPriceGridRequest(BaseModel):
+    dates: List[date]
+    state: str
+    districts: List[str]
+    market: str = ""
+    commodities: List[str]
+    variety: str
+    grade: str
+
+class MarketPriceForecastPoint(BaseModel):
+    date: date
+    predicted_price: float
+
+class MarketPriceForecastResponse(BaseModel):
+    source: str
+    prices: List[MarketPriceForecastPoint]
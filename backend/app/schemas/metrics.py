@@ -0,0 +1,76 @@
+from pydantic import BaseModel 
+from typing import Dict, Optional 
+
+class BatcherMetrics(BaseModel):
+    max_batch_size: int
+    batches: int
+    items: int
+    errors: int
+    avg_batch_size: float
+    fill_rate: float
+    avg_queue_ms: float
+    max_queue_ms: float
+    avg_forward_ms: float
+    queue_depth: int
+
+class StageMetrics(BaseModel):
+    count: int
+    avg_ms: float
+    max_ms: float
+    avg_wait_ms: float
+
+class PoolMetrics(BaseModel):
+    kind: str
+    workers: int
+    in_flight: int
+    max_in_flight: int
+    rejected: int
+    stages: Dict[str, StageMetrics]
+
+class InferenceMetricsResponse(BaseModel):
+    pool: PoolMetrics
+    auth_pool: PoolMetrics
+    batchers: Dict[str, BatcherMetrics]
+
+
+class CacheMetrics(BaseModel):
+    entries: int
+    max_entries: int
+    hits: int
+    misses: int
+    evictions: int
+    ttl_seconds: float
+    disk_enabled: bool
+    disk_hits: int
+    disk_misses: int
+
+class CacheMetricsResponse(BaseModel):
+    caches: Dict[str, CacheMetrics]
+
+
+class ModelMemory(BaseModel):
+    state: str
+    weights_bytes: Optional[int] = None
+    rss_delta_bytes: Optional[int] = None
+    inherited: bool
+
+class MemoryMetricsResponse(BaseModel):
+    pid: int
+    parent_pid: int
+    rss_bytes: int
+    uss_bytes: Optional[int] = None
+    pss_bytes: Optional[int] = None
+    shared_bytes: Optional[int] = None
+    gc_frozen_objects: int
+    models: Dict[str, ModelMemory]
+
+
+class DbPoolMetrics(BaseModel):
+    pool: str
+    status: str
+    size: Optional[int] = None
+    checked_in: Optional[int] = None
+    checked_out: Optional[int] = None
+    overflow: Optional[int] = None
+    capacity: Optional[int] = None
+    utilization: Optional[float] = None
@@ -1,8 +1,17 @@
 from pydantic import BaseModel 
 from typing import List, Optional, Dict, Any
 
+class PestCandidate(BaseModel): 
+    class_id: str 
+    pest: str 
+    confidence: float 
+
 class PestResposne(BaseModel): 
+    # "unknown" when the top prediction is below PEST_MIN_CONFIDENCE
     pest: str 
+    class_id: Optional[str] = None 
+    confidence: Optional[float] = None 
+    low_confidence: bool = False 
+    top_k: List[PestCandidate] = [] 
     data: Optional[Dict[str, Any]] 
     images: Optional[List[str]] 
-    
\ No newline at end of file
@@ -8,6 +8,9 @@ class Token(BaseModel):
 
 class TokenPayload(BaseModel):
     sub: Optional[str] = None 
+    exp: Optional[int] = None 
+    jti: Optional[str] = None 
+    fam: Optional[str] = None 
 
 class RefreshTokenRequest(BaseModel):
     refresh_token: str 
\ No newline at end of file
@@ -58,8 +58,8 @@ class CurrentWeather(BaseModel):
 
 class WeatherResponse(BaseModel):
     location: str = Field(..., alias='resolvedAddress')
-    current: CurrentWeather
-    forecast: Forecast
+    current: Optional[CurrentWeather] = None
+    forecast: Optional[Forecast] = None
 
     class Config:
         validate_by_name = True  # Updated for Pydantic V2
\ No newline at end of file
@@ -1,7 +1,15 @@
 from . import user_service 
+from . import auth_cache
+from . import token_service
 from . import healthcheck_service 
 from . import weather_service
 from . import market_price_service
 from . import disease_detect_service 
+from . import pest_knowledge
 from . import pest_detect_service
-from . import schemes
\ No newline at end of file
+from . import schemes
+from . import metrics_service
+from . import llm_client
+
+from . import scheme_catalog
+from . import market_forecast_store
\ No newline at end of file
@@ -0,0 +1,67 @@
+import hashlib
+import logging
+import time
+
+from sqlalchemy import event
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.core.security import verify_access_token
+from app.db.models.user import User
+from app.schemas.token import TokenPayload
+from app.services import user_service
+from app.utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Decoded access tokens by sha256 of the token, each kept until its own `exp`.
+# Logout and refresh reuse revoke the token's family instead of evicting it
+# here; get_current_user checks the family on every request, cached or not.
+token_cache = TTLCache(
+    max_entries=settings.AUTH_TOKEN_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.ACCESS_TOKEN_EXPIRY_MINUTES * 60,
+)
+
+# Column values of recently seen users by id. Each hit builds a new detached
+# User, so handlers never share an instance or touch a closed session.
+user_cache = TTLCache(
+    max_entries=settings.AUTH_USER_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.AUTH_USER_CACHE_TTL_SECONDS,
+)
+
+def _token_key(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+def verify_access_token_cached(token: str, credentials_exception: Exception) -> TokenPayload:
+    """`verify_access_token` with the result cached until the token expires."""
+    key = _token_key(token)
+    token_data = token_cache.get(key)
+    if token_data is not None:
+        return token_data
+
+    token_data = verify_access_token(token, credentials_exception)
+    remaining = (token_data.exp or 0) - time.time()
+    if remaining > 0:
+        token_cache.set(key, token_data, ttl_seconds=remaining)
+    return token_data
+
+async def get_user_cached(session: AsyncSession, user_id: int) -> User | None:
+    data = user_cache.get(str(user_id))
+    if data is not None:
+        return User(**data)
+
+    user = await user_service.get_user_by_id(session=session, user_id=user_id)
+    if user is not None:
+        user_cache.set(str(user_id), user.model_dump())
+    return user
+
+def invalidate_user(user_id: int | None):
+    if user_id is not None:
+        user_cache.delete(str(user_id))
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_on_change(mapper, connection, target: User):
+    # Covers every ORM write in this process. Other workers keep a stale
+    # entry for at most AUTH_USER_CACHE_TTL_SECONDS.
+    invalidate_user(target.id)
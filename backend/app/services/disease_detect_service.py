@@ -2,26 +2,76 @@ import os
 import logging 
 import cv2 
 import numpy as np 
-from ultralytics import YOLO 
 import supervision as sv 
-from groq import Groq 
+import asyncio 
 import json 
 
+from app.core.config import settings 
+from app.services.llm_client import llm_client 
+from app.utils.cache import ResultCache 
+from app.utils.file_lock import async_file_lock 
+from app.utils.inference_pool import inference_pool 
+from app.utils.model_registry import model_registry 
+
 logger = logging.getLogger(__name__) 
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
 MODEL_PATH = os.path.join(BASE_DIR, "ml_models", "best.pt")
 
-if not os.path.exists(MODEL_PATH):
-    logger.error(f"Disease model not found at {MODEL_PATH}")
-    raise RuntimeError(f"Disease model file missing: {MODEL_PATH}")
+# Frame the model was trained and tuned on; uploads are stretched to this aspect ratio.
+DETECT_FRAME = (1280, 720) 
+
+# Input size of `python export_models.py disease` when --imgsz is not given.
+EXPORT_IMGSZ = 640 
+
+def backend_path(backend: str) -> str: 
+    """Weights used by DISEASE_BACKEND: best.pt, or its export from `python export_models.py disease`."""
+    if backend == "onnx": 
+        return settings.DISEASE_ONNX_PATH 
+    if backend == "openvino": 
+        return settings.DISEASE_OPENVINO_PATH 
+    return MODEL_PATH 
+
+def _load_model(path: str): 
+    if settings.DISEASE_BACKEND not in ("torch", "onnx", "openvino"): 
+        raise ValueError(f"Unknown disease backend: {settings.DISEASE_BACKEND}") 
+    # Imported here so that importing this module stays cheap.
+    from ultralytics import YOLO 
+    # Exported models carry their metadata (class names, imgsz); the task is
+    # given explicitly so ultralytics does not have to guess it.
+    return YOLO(path, task="detect") 
+
+disease_model = model_registry.register("disease", backend_path(settings.DISEASE_BACKEND), _load_model) 
+
+def result_version() -> str: 
+    """Namespaces cached results by weights, backend and input size."""
+    return f"{disease_model.version}:{settings.DISEASE_BACKEND}:{settings.DISEASE_IMGSZ or 'default'}" 
+
+def detection_imgsz(model, backend: str) -> int | list[int] | None: 
+    """
+    Network input size: DISEASE_IMGSZ when set. Otherwise exports (static
+    input shape) run at EXPORT_IMGSZ and best.pt at the size stored in its
+    checkpoint, i.e. what it was trained at (None if the checkpoint has none).
+    """
+    if settings.DISEASE_IMGSZ: 
+        return settings.DISEASE_IMGSZ 
+    if backend != "torch": 
+        return EXPORT_IMGSZ 
+    return getattr(model, "overrides", {}).get("imgsz") 
 
-try:
-    model = YOLO(MODEL_PATH)
-    logger.info(f"Loaded YOLO model from {MODEL_PATH}")
-except Exception as e:
-    logger.error(f"Failed to load YOLO model: {e}")
-    raise
+def input_size(imgsz: int) -> tuple[int, int]: 
+    """(width, height) of DETECT_FRAME scaled so its long side is `imgsz` (never upscaled)."""
+    scale = min(1.0, imgsz / max(DETECT_FRAME)) 
+    return round(DETECT_FRAME[0] * scale), round(DETECT_FRAME[1] * scale) 
+
+# Caches the full endpoint result (class counts + LLM advice) per uploaded image.
+disease_result_cache = ResultCache(
+    "disease-detect",
+    max_entries=settings.RESULT_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.RESULT_CACHE_TTL_SECONDS,
+    disk_dir=settings.RESULT_CACHE_DIR,
+    max_disk_entries=settings.RESULT_CACHE_MAX_DISK_ENTRIES,
+)
 
 COLOR_MAP = {
     "Blight": sv.Color(255, 0, 0),
@@ -35,29 +85,71 @@ COLOR_MAP = {
     "Background": sv.Color(255, 255, 255),
 }
 
-def detect_image(path: str) -> dict[str, int]:
-    image = cv2.imread(path) 
+# Classes that never change the advice and are left out of the signature.
+ADVICE_IGNORED_CLASSES = {"Background"} 
+
+# (upper bound, label) pairs used to bucket per-class detection counts.
+ADVICE_COUNT_BUCKETS = ((1, "1"), (4, "2-4"), (None, "5+")) 
+
+# Bump whenever the LLM prompt changes so stale advice is not reused.
+ADVICE_PROMPT_VERSION = "v1" 
+
+advice_cache = ResultCache(
+    "disease-advice",
+    max_entries=256,
+    ttl_seconds=settings.LLM_ADVICE_TTL_SECONDS,
+    disk_dir=settings.LLM_ADVICE_CACHE_DIR,
+)
+
+def decode_image(data: bytes) -> np.ndarray: 
+    """Decodes encoded image bytes straight from memory (no copy of the buffer)."""
+    buffer = np.frombuffer(memoryview(data), dtype=np.uint8) 
+    image = cv2.imdecode(buffer, cv2.IMREAD_COLOR) 
     if image is None: 
-        logger.error(f"Could not load image at {path}") 
+        logger.error("Could not decode uploaded image bytes") 
         raise RuntimeError("Failed to load image") 
-    
-    image = cv2.resize(image, (1280, 720)) 
+    return image 
+
+def count_detections(model, image: np.ndarray, imgsz: int | list[int] | None) -> dict[str, int]: 
+    """Runs `model` on a decoded BGR image and counts detections per class name."""
+    if imgsz is None: 
+        # Unknown input size: the original preprocessing, YOLO picks the size.
+        image = cv2.resize(image, DETECT_FRAME) 
+        with inference_pool.timed("disease.model"): 
+            results = model.predict(image, verbose=False)[0] 
+    else: 
+        # A single resize straight to the network input size. Resizing to
+        # DETECT_FRAME first and letting YOLO scale it down again gives the same
+        # geometry but touches every pixel twice; after this resize YOLO's
+        # letterbox only pads.
+        long_side = max(imgsz) if isinstance(imgsz, (list, tuple)) else imgsz 
+        image = cv2.resize(image, input_size(long_side), interpolation=cv2.INTER_AREA) 
+        with inference_pool.timed("disease.model"): 
+            results = model.predict(image, imgsz=imgsz, verbose=False)[0] 
 
-    results = model(image)[0] 
-    detections = sv.Detections.from_ultralytics(results) 
+    with inference_pool.timed("disease.postprocess"): 
+        detections = sv.Detections.from_ultralytics(results) 
 
-    counts: dict[str, int] = {} 
-    for cid in detections.class_id: 
-        name = results.names[cid] 
-        counts[name] = counts.get(name, 0) + 1 
+        counts: dict[str, int] = {} 
+        for cid in detections.class_id: 
+            name = results.names[cid] 
+            counts[name] = counts.get(name, 0) + 1 
 
     logger.debug(f"Detection counts: {counts}")
     return counts 
 
-def get_llm_response(class_counts: dict[str, int]) -> dict: 
-    client = Groq() 
+def _detect(image: np.ndarray) -> dict[str, int]: 
+    model = disease_model.get() 
+    return count_detections(model, image, detection_imgsz(model, settings.DISEASE_BACKEND)) 
+
+def detect_image_bytes(data: bytes) -> dict[str, int]: 
+    with inference_pool.timed("disease.decode"): 
+        image = decode_image(data) 
+    return _detect(image) 
+
+async def get_llm_response(class_counts: dict[str, int] | dict[str, str]) -> dict: 
     user_content = json.dumps({"class counts": class_counts}, indent=4)
-    completion = client.chat.completions.create(
+    llm_response = await llm_client.chat_completion(
         model = "meta-llama/llama-4-maverick-17b-128e-instruct",
         messages=[
             {
@@ -76,9 +168,90 @@ def get_llm_response(class_counts: dict[str, int]) -> dict:
         response_format={"type": "json_object"},
         stop=None, 
     )
-    llm_response = completion.choices[0].message.content 
     
     try:
         return json.loads(llm_response) 
     except Exception: 
-        return {"errror": "Failed to parse LLM response", "raw": llm_response}
\ No newline at end of file
+        return {"errror": "Failed to parse LLM response", "raw": llm_response}
+
+def _bucket(count: int) -> str: 
+    for upper, label in ADVICE_COUNT_BUCKETS: 
+        if upper is None or count <= upper: 
+            return label 
+
+def disease_signature(class_counts: dict[str, int]) -> dict[str, str]: 
+    """
+    Normalizes detection counts into the input actually sent to the LLM:
+    ignored classes are dropped and counts are bucketed, so e.g. 3 and 4
+    Blight detections share one cached answer.
+    """
+    return {
+        name: _bucket(count)
+        for name, count in sorted(class_counts.items())
+        if count > 0 and name not in ADVICE_IGNORED_CLASSES
+    }
+
+def _advice_key(signature: dict[str, str]) -> str: 
+    return ResultCache.key_for(json.dumps(signature, sort_keys=True).encode(), ADVICE_PROMPT_VERSION) 
+
+async def get_disease_advice(class_counts: dict[str, int]) -> dict: 
+    signature = disease_signature(class_counts) 
+    key = _advice_key(signature) 
+    advice = await advice_cache.aget(key) 
+    if advice is not None: 
+        logger.debug(f"LLM advice cache hit for signature {signature}") 
+        return advice 
+
+    advice = await get_llm_response(signature) 
+    if "raw" not in advice: 
+        await advice_cache.aset(key, advice) 
+    return advice 
+
+def common_signatures() -> list[dict[str, str]]: 
+    """No detections, plus every single disease at every count bucket."""
+    signatures = [{}] 
+    for name in COLOR_MAP: 
+        if name in ADVICE_IGNORED_CLASSES: 
+            continue 
+        for _, label in ADVICE_COUNT_BUCKETS: 
+            signatures.append({name: label}) 
+    return signatures 
+
+async def prewarm_advice_cache() -> int: 
+    """
+    Fills `advice_cache` for all common signatures that are not cached yet.
+
+    With the disk cache enabled this runs once per host: workers take turns
+    on a lock next to the cache directory, and those that waited find the
+    answers on disk and make no LLM calls.
+    """
+    if not llm_client.configured: 
+        logger.warning("Skipping LLM advice pre-warm, GROQ_API_KEY is not set") 
+        return 0 
+
+    async def warm(signature: dict[str, str]) -> bool: 
+        key = _advice_key(signature) 
+        if await advice_cache.aget(key) is not None: 
+            return False 
+        try: 
+            advice = await get_llm_response(signature) 
+        except Exception as e: 
+            logger.warning(f"Pre-warming LLM advice for {signature} failed: {e}") 
+            return False 
+        if "raw" in advice: 
+            return False 
+        await advice_cache.aset(key, advice) 
+        return True 
+
+    async def warm_all() -> int: 
+        # llm_client caps how many of these run against Groq at once.
+        results = await asyncio.gather(*(warm(signature) for signature in common_signatures())) 
+        return sum(results) 
+
+    if advice_cache.disk_dir is None: 
+        warmed = await warm_all() 
+    else: 
+        async with async_file_lock(f"{advice_cache.disk_dir}.prewarm.lock"): 
+            warmed = await warm_all() 
+    logger.info(f"Pre-warmed LLM advice for {warmed} disease signatures") 
+    return warmed 
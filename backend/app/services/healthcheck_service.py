@@ -1,2 +1,9 @@
+from app.utils.model_registry import model_registry
+
 def get_health_status():
-    return {"status": "ok"}
\ No newline at end of file
+    # Liveness stays "ok" while models load; "ready" tells when all of them can serve.
+    return {
+        "status": "ok",
+        "ready": model_registry.all_ready(),
+        "models": model_registry.snapshot(),
+    }
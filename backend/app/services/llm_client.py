@@ -0,0 +1,101 @@
+import asyncio 
+import hashlib 
+import json 
+import logging 
+
+import httpx 
+from fastapi import HTTPException, status 
+from groq import AsyncGroq 
+
+from app.core.config import settings 
+from app.utils.singleflight import SingleFlight 
+
+logger = logging.getLogger(__name__) 
+
+class LLMClient: 
+    """
+    Shared async Groq client.
+
+    One pooled HTTP client is opened on first use and kept for the app
+    lifespan (503 while GROQ_API_KEY is unset), the number of
+    concurrent upstream completions is capped, and identical in-flight
+    requests are coalesced so N simultaneous callers cause one upstream call.
+    Point GROQ_BASE_URL at a local stub server to exercise it without Groq.
+    """
+
+    def __init__(self, max_concurrency: int, timeout_seconds: float, max_retries: int): 
+        self.timeout_seconds = timeout_seconds 
+        self.max_retries = max_retries 
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency)) 
+        self._max_connections = max(1, max_concurrency) 
+        self._flights = SingleFlight() 
+        self._client: AsyncGroq | None = None 
+        self._client_lock = asyncio.Lock() 
+        self._warned = False 
+
+    @property 
+    def configured(self) -> bool: 
+        return bool(settings.GROQ_API_KEY) 
+
+    async def _get_client(self) -> AsyncGroq: 
+        # Created on first use, so the API starts (and serves everything that
+        # does not need the LLM) even without GROQ_API_KEY.
+        async with self._client_lock: 
+            if self._client is not None: 
+                return self._client 
+            if not self.configured: 
+                if not self._warned: 
+                    logger.warning("GROQ_API_KEY is not set, LLM-backed endpoints answer 503") 
+                    self._warned = True 
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="LLM service is not configured",
+                )
+            http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self._max_connections,
+                    max_keepalive_connections=self._max_connections,
+                ),
+                timeout=httpx.Timeout(self.timeout_seconds),
+            )
+            try: 
+                self._client = AsyncGroq(
+                    api_key=settings.GROQ_API_KEY,
+                    base_url=settings.GROQ_BASE_URL,
+                    http_client=http_client,
+                    timeout=self.timeout_seconds,
+                    max_retries=self.max_retries,
+                )
+            except Exception: 
+                await http_client.aclose() 
+                raise 
+            logger.info("LLM client started") 
+            return self._client 
+
+    async def shutdown(self): 
+        if self._client is not None: 
+            await self._client.close() 
+            self._client = None 
+            logger.info("LLM client closed") 
+
+    async def chat_completion(self, **params) -> str: 
+        """Runs a chat completion and returns the first choice's message content."""
+        if not self.configured: 
+            await self._get_client() 
+        key = hashlib.sha256(json.dumps(params, sort_keys=True, default=str).encode()).hexdigest() 
+        return await self._flights.do(key, lambda: self._create(params)) 
+
+    async def _create(self, params: dict) -> str: 
+        client = await self._get_client() 
+        async with self._semaphore: 
+            completion = await client.chat.completions.create(**params) 
+        return completion.choices[0].message.content 
+
+    def snapshot(self) -> dict: 
+        return self._flights.snapshot() 
+
+llm_client = LLMClient(
+    max_concurrency=settings.LLM_MAX_CONCURRENCY,
+    timeout_seconds=settings.LLM_TIMEOUT_SECONDS,
+    max_retries=settings.LLM_MAX_RETRIES,
+)
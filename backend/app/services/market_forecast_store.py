@@ -0,0 +1,247 @@
+import asyncio
+import csv
+import logging
+import os
+from datetime import date, datetime, timedelta
+
+import numpy as np
+
+from app.core.config import settings
+from app.services.market_price_service import feature_columns, market_model, predict_features
+from app.utils.file_lock import async_file_lock
+from app.utils.inference_pool import inference_pool
+
+logger = logging.getLogger(__name__)
+
+KEY_COLUMNS = ("State", "District", "Commodity", "Variety", "Grade")
+
+# Rows predicted per model call while materializing, to bound peak memory.
+PRECOMPUTE_CHUNK_ROWS = 50_000
+
+def make_key(state: str, district: str, commodity: str, variety: str, grade: str) -> str:
+    return "|".join((state, district, commodity, variety, grade))
+
+def load_combinations(path: str) -> list[tuple[str, ...]]:
+    """Reads the known (State, District, Commodity, Variety, Grade) combinations from a CSV file."""
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        missing = [c for c in KEY_COLUMNS if c not in (reader.fieldnames or [])]
+        if missing:
+            raise ValueError(f"{path} is missing columns: {', '.join(missing)}")
+        combos = {tuple(row[c].strip() for c in KEY_COLUMNS) for row in reader}
+    return sorted(combos)
+
+def predict_days(dates: list[date], columns: list[tuple[str, ...]]) -> np.ndarray:
+    """
+    Predictions for every combination on each of `dates`, shaped
+    (len(dates), combinations). Runs in the inference pool, so with the
+    process executor the model is only ever loaded by the pool's children.
+    """
+    count = len(columns[0])
+    chunk_columns = feature_columns(
+        [d for d in dates for _ in range(count)],
+        *[list(col) * len(dates) for col in columns],
+    )
+    return predict_features(chunk_columns).reshape(len(dates), count)
+
+class MarketForecastStore:
+    """
+    Materialized daily price predictions for every known combination.
+
+    `prices[i, d]` is the prediction for combination `keys[i]` on
+    `base_date + d` days, so a range query is a dict lookup plus an array
+    slice. The arrays are saved as one .npz file together with the version
+    of the model that produced them; a store from another model is ignored.
+
+    Predictions run through the shared inference pool one chunk at a time,
+    so requests interleave with a build. The file is built once per host:
+    builders hold an exclusive lock on
+    `<path>.lock`, and workers that waited on it load the fresh file instead
+    of building again. Workers also reload the file whenever it changes, so
+    a build from cron (`python -m app.services.market_forecast_store`) is
+    picked up without a restart.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.base_date: date | None = None
+        self.built_at: str | None = None
+        self.model_version: str | None = None
+        self.prices: np.ndarray | None = None
+        self.index: dict[str, int] = {}
+        self._file_state: tuple[int, int] | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def horizon(self) -> int:
+        return 0 if self.prices is None else self.prices.shape[1]
+
+    def _swap(self, keys, prices: np.ndarray, base_date: date, built_at: str, model_version: str | None):
+        self.index = {str(key): i for i, key in enumerate(keys)}
+        self.prices = prices
+        self.base_date = base_date
+        self.built_at = built_at
+        self.model_version = model_version
+
+    def _stat(self) -> tuple[int, int] | None:
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns
+
+    def load(self) -> bool:
+        state = self._stat()
+        try:
+            with np.load(self.path, allow_pickle=False) as data:
+                self._swap(
+                    data["keys"],
+                    data["prices"],
+                    date.fromisoformat(str(data["base_date"])),
+                    str(data["built_at"]),
+                    # Files written before the version was stored never match the model.
+                    str(data["model_version"]) if "model_version" in data.files else None,
+                )
+        except FileNotFoundError:
+            logger.info(f"No market forecast store at {self.path}")
+            return False
+        except Exception as e:
+            logger.error(f"Ignoring unreadable market forecast store {self.path}: {e}")
+            return False
+        finally:
+            self._file_state = state
+        logger.info(
+            f"Loaded market forecast store: {len(self.index)} combinations x {self.horizon} days from {self.base_date}"
+        )
+        return True
+
+    def reload_if_changed(self) -> bool:
+        """Loads the file again if another process replaced it since the last load."""
+        if self._stat() == self._file_state:
+            return False
+        return self.load()
+
+    def lookup(self, key: str, start: date, days: int) -> list[float] | None:
+        """Returns `days` prices starting at `start`, or None if not fully materialized."""
+        row = self.index.get(key)
+        if row is None or self.base_date is None or self.model_version != market_model.version:
+            return None
+        offset = (start - self.base_date).days
+        if offset < 0 or offset + days > self.horizon:
+            return None
+        return self.prices[row, offset:offset + days].astype(float).tolist()
+
+    async def materialize(self, combos_path: str, base_date: date, horizon: int):
+        """Predicts every combination for `horizon` days and atomically replaces the store file."""
+        combos = await asyncio.to_thread(load_combinations, combos_path)
+        if not combos:
+            raise ValueError(f"No combinations found in {combos_path}")
+        logger.info(f"Materializing market forecasts: {len(combos)} combinations x {horizon} days")
+
+        dates = [base_date + timedelta(days=d) for d in range(horizon)]
+        columns = list(zip(*combos))
+        prices = np.empty((len(combos), horizon), dtype=np.float32)
+
+        # One model call per chunk of days; each call covers every combination.
+        days_per_chunk = max(1, PRECOMPUTE_CHUNK_ROWS // len(combos))
+        for start in range(0, horizon, days_per_chunk):
+            chunk_dates = dates[start:start + days_per_chunk]
+            predicted = await inference_pool.run("market.precompute", predict_days, chunk_dates, columns)
+            prices[:, start:start + len(chunk_dates)] = predicted.T
+
+        keys = np.array([make_key(*combo) for combo in combos])
+        built_at = datetime.now().isoformat(timespec="seconds")
+        model_version = market_model.version
+        await asyncio.to_thread(self._save, keys, prices, base_date, built_at, model_version)
+
+        self._swap(keys, prices, base_date, built_at, model_version)
+        self._file_state = self._stat()
+        logger.info(f"Market forecast store written to {self.path}")
+
+    def _save(self, keys: np.ndarray, prices: np.ndarray, base_date: date, built_at: str, model_version: str):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp.npz"
+        np.savez(
+            tmp_path,
+            keys=keys,
+            prices=prices,
+            base_date=base_date.isoformat(),
+            built_at=built_at,
+            model_version=model_version,
+        )
+        os.replace(tmp_path, self.path)
+
+    def is_current(self) -> bool:
+        return (
+            self.base_date is not None
+            and self.base_date >= date.today()
+            and self.model_version == market_model.version
+        )
+
+    def needs_build(self) -> bool:
+        # Yesterday's store still covers today, so a new day only triggers a
+        # build from MARKET_FORECAST_REFRESH_HOUR on; a new model does at once.
+        if self.base_date is None or self.model_version != market_model.version:
+            return True
+        return not self.is_current() and datetime.now().hour >= settings.MARKET_FORECAST_REFRESH_HOUR
+
+    async def build_if_needed(self) -> bool:
+        """Builds under the host-wide lock unless another process already did."""
+        async with async_file_lock(f"{self.path}.lock"):
+            await asyncio.to_thread(self.reload_if_changed)
+            if not self.needs_build():
+                return False
+            await self.materialize(
+                settings.MARKET_COMBINATIONS_PATH,
+                date.today(),
+                settings.MARKET_FORECAST_HORIZON_DAYS,
+            )
+            return True
+
+    async def refresh(self):
+        if not os.path.exists(settings.MARKET_COMBINATIONS_PATH):
+            logger.warning(f"Skipping market forecast precompute, {settings.MARKET_COMBINATIONS_PATH} not found")
+            return
+        try:
+            await self.build_if_needed()
+        except Exception as e:
+            logger.error(f"Market forecast precompute failed, keeping previous store: {e}")
+
+    async def _run(self):
+        while True:
+            await asyncio.to_thread(self.reload_if_changed)
+            if self.needs_build():
+                await self.refresh()
+            await asyncio.sleep(settings.MARKET_FORECAST_RELOAD_SECONDS)
+
+    async def start(self):
+        self.load()
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="market-forecast-precompute")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+market_forecast_store = MarketForecastStore(settings.MARKET_FORECAST_STORE_PATH)
+
+if __name__ == "__main__":
+    # One-off build, e.g. from cron: python -m app.services.market_forecast_store
+    async def _build():
+        async with async_file_lock(f"{market_forecast_store.path}.lock"):
+            await market_forecast_store.materialize(
+                settings.MARKET_COMBINATIONS_PATH,
+                date.today(),
+                settings.MARKET_FORECAST_HORIZON_DAYS,
+            )
+
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(_build())
+    finally:
+        inference_pool.shutdown()
@@ -1,7 +1,18 @@
+import itertools 
+import logging 
 import os 
+from datetime import date, timedelta 
+from typing import Iterator, List, Sequence 
+
+import numpy as np 
 import pandas as pd 
-from app.schemas.market_price import MarketPriceInput 
+from app.core.config import settings 
+from app.schemas.market_price import MarketPriceInput, MarketPriceGridRequest 
+from app.utils.feature_encoding import CompiledPipeline, compile_pipeline 
 from app.utils.ml_models import load_model
+from app.utils.model_registry import model_registry 
+
+logger = logging.getLogger(__name__) 
 
 MODEL_PATH = os.path.join(
     os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
@@ -11,24 +22,127 @@ MODEL_PATH = os.path.join(
 print(f"Resolved MODEL_PATH: {MODEL_PATH}")
 print(f"File exists: {os.path.exists(MODEL_PATH)}")
 
-model = load_model(MODEL_PATH)
+FEATURE_COLUMNS = [
+    "year", "month", "day_of_week", "day_of_month",
+    "State", "District", "Commodity", "Variety", "Grade",
+]
 
-def predict_market_price(input_data: MarketPriceInput):
-    if model is None:
-        raise RuntimeError("Model not loaded") 
-    date_obj = input_data.date
-    features = {
-        "year": date_obj.year,
-        "month": date_obj.month,
-        "day_of_week": date_obj.weekday(),
-        "day_of_month": date_obj.day,
-        "State": input_data.state,
-        "District": input_data.district,
-        "Commodity": input_data.commodity,
-        "Variety": input_data.variety,
-        "Grade": input_data.grade
+def feature_columns(
+    dates: Sequence[date],
+    states: Sequence[str],
+    districts: Sequence[str],
+    commodities: Sequence[str],
+    varieties: Sequence[str],
+    grades: Sequence[str],
+) -> dict[str, Sequence]: 
+    """Model features as equally long columns, keyed by FEATURE_COLUMNS."""
+    return {
+        "year": [d.year for d in dates],
+        "month": [d.month for d in dates],
+        "day_of_week": [d.weekday() for d in dates],
+        "day_of_month": [d.day for d in dates],
+        "State": states,
+        "District": districts,
+        "Commodity": commodities,
+        "Variety": varieties,
+        "Grade": grades,
     }
-    df = pd.DataFrame([features])
-    prediction = model.predict(df)
-    return prediction[0]
 
+def input_columns(inputs: List[MarketPriceInput]) -> dict[str, Sequence]: 
+    """Feature columns for a list of inputs (one row per input, same order)."""
+    return feature_columns(
+        [item.date for item in inputs],
+        [item.state for item in inputs],
+        [item.district for item in inputs],
+        [item.commodity for item in inputs],
+        [item.variety for item in inputs],
+        [item.grade for item in inputs],
+    )
+
+def build_feature_frame(inputs: List[MarketPriceInput]) -> pd.DataFrame: 
+    return pd.DataFrame(input_columns(inputs), columns=FEATURE_COLUMNS) 
+
+class MarketModel: 
+    """The pickled pipeline plus, when it could be compiled, its fast encoder."""
+
+    def __init__(self, pipeline, compiled: CompiledPipeline | None): 
+        self.pipeline = pipeline 
+        self.compiled = compiled 
+
+def predict_frame(frame: pd.DataFrame) -> np.ndarray: 
+    """Reference path: the pickled pipeline encodes the DataFrame itself."""
+    return np.asarray(market_model.get().pipeline.predict(frame), dtype=np.float64) 
+
+def _probe_columns(compiled: CompiledPipeline) -> dict[str, Sequence]: 
+    """A few rows mixing known and unknown categories, for the load-time parity check."""
+    known: dict[str, list] = {} 
+    for block in compiled.blocks: 
+        for name, vocab in zip(getattr(block, "names", []), getattr(block, "vocab", [])): 
+            known[name] = list(vocab)[:3] 
+    dates = [date.today() + timedelta(days=d * 37) for d in range(4)] 
+
+    def values(name: str) -> list: 
+        cats = known.get(name) or ["__probe__"] 
+        return [cats[i % len(cats)] for i in range(3)] + ["__unknown__"] 
+
+    return feature_columns(dates, *(values(name) for name in FEATURE_COLUMNS[4:])) 
+
+def _compile_model(model) -> CompiledPipeline | None: 
+    if not settings.MARKET_COMPILED_ENCODER: 
+        return None 
+    compiled = compile_pipeline(model) 
+    if compiled is None: 
+        return None 
+
+    probe = _probe_columns(compiled) 
+    try: 
+        expected = np.asarray(model.predict(pd.DataFrame(probe, columns=FEATURE_COLUMNS)), dtype=np.float64) 
+        actual = np.asarray(compiled.predict(probe), dtype=np.float64) 
+    except Exception as e: 
+        logger.warning(f"Compiled market encoder failed its parity probe, using pandas path: {e}") 
+        return None 
+    if not np.allclose(actual, expected, rtol=1e-9, atol=1e-9): 
+        logger.warning("Compiled market encoder disagrees with the pipeline, using pandas path") 
+        return None 
+
+    logger.info(f"Using compiled market feature encoding ({compiled.width} encoded features)") 
+    return compiled 
+
+def _load_model(path: str) -> MarketModel: 
+    # Large numpy arrays in an uncompressed pickle are memory-mapped read-only
+    # and shared through the page cache; compressed pickles load normally.
+    pipeline = load_model(path, mmap_mode="r" if settings.MODEL_MMAP_WEIGHTS else None) 
+    if pipeline is None: 
+        raise RuntimeError("Model not loaded") 
+    return MarketModel(pipeline, _compile_model(pipeline)) 
+
+market_model = model_registry.register("market-price", MODEL_PATH, _load_model) 
+
+def predict_features(columns: dict[str, Sequence]) -> np.ndarray: 
+    """Predicts feature columns, skipping pandas when the encoder could be compiled."""
+    loaded = market_model.get() 
+    if loaded.compiled is not None: 
+        return np.asarray(loaded.compiled.predict(columns), dtype=np.float64) 
+    return np.asarray(loaded.pipeline.predict(pd.DataFrame(columns, columns=FEATURE_COLUMNS)), dtype=np.float64) 
+
+def predict_market_prices(inputs: List[MarketPriceInput]) -> List[float]: 
+    """Predicts all inputs with a single vectorized model call."""
+    if not inputs: 
+        return [] 
+    return predict_features(input_columns(inputs)).tolist() 
+
+def grid_size(grid: MarketPriceGridRequest) -> int: 
+    return len(grid.dates) * len(grid.districts) * len(grid.commodities) 
+
+def iter_grid(grid: MarketPriceGridRequest) -> Iterator[MarketPriceInput]: 
+    """Expands a grid request in date, district, commodity order."""
+    for date_value, district, commodity in itertools.product(grid.dates, grid.districts, grid.commodities): 
+        yield MarketPriceInput(
+            date=date_value,
+            state=grid.state,
+            district=district,
+            market=grid.market,
+            commodity=commodity,
+            variety=grid.variety,
+            grade=grid.grade,
+        )
@@ -0,0 +1,42 @@
+import gc
+import os
+
+import psutil
+
+from app.core.security import password_pool
+from app.db.engine import pool_snapshot
+from app.db.session import engine
+from app.services.pest_detect_service import pest_batcher
+from app.utils.cache import all_cache_stats
+from app.utils.inference_pool import inference_pool
+from app.utils.model_registry import model_registry
+
+def get_inference_metrics():
+    batchers = {}
+    for batcher in (pest_batcher,):
+        batchers[batcher.name] = {**batcher.stats.snapshot(), "queue_depth": batcher.queue_depth()}
+    return {"pool": inference_pool.snapshot(), "auth_pool": password_pool.snapshot(), "batchers": batchers}
+
+def get_cache_metrics():
+    return {"caches": all_cache_stats()}
+
+def get_db_metrics():
+    return pool_snapshot(engine)
+
+def get_memory_metrics():
+    process = psutil.Process()
+    try:
+        # uss/pss need to walk the process maps (Linux); fall back to plain RSS.
+        info = process.memory_full_info()
+    except (psutil.AccessDenied, NotImplementedError):
+        info = process.memory_info()
+    return {
+        "pid": os.getpid(),
+        "parent_pid": process.ppid(),
+        "rss_bytes": info.rss,
+        "uss_bytes": getattr(info, "uss", None),
+        "pss_bytes": getattr(info, "pss", None),
+        "shared_bytes": getattr(info, "shared", None),
+        "gc_frozen_objects": gc.get_freeze_count(),
+        "models": model_registry.memory_snapshot(),
+    }
@@ -1,96 +1,242 @@
-import io 
+import json 
 import numpy as np 
 import torch 
 import timm 
 import logging 
 import os 
+import threading 
 
-from PIL import Image 
-from app.utils.image_utils import valid_transform 
-from app.utils.pest_name import pest_name 
-from app.utils.pests import pests
+from app.core.config import PEST_NUM_CLASSES, settings
+from app.services.pest_knowledge import pest_knowledge 
+from app.utils.batching import MicroBatcher 
+from app.utils.cache import ResultCache 
+from app.utils.image_utils import decode_full, decode_resized 
+from app.utils.inference_backends import OnnxBackend, TorchBackend, quantize_int8 
+from app.utils.inference_pool import inference_pool 
+from app.utils.model_registry import model_registry 
 
 logger = logging.getLogger(__name__) 
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
 MODEL_PATH = os.path.join(BASE_DIR, "ml_models", "pest_model.pth") 
 
-if not os.path.exists(MODEL_PATH): 
-    logger.errro(f"Peset model not found at {MODEL_PATH}") 
-    raise RuntimeError(f"Pest model file missign :{MODEL_PATH}") 
-
 _device = torch.device("cuda" if torch.cuda.is_available() else "cpu") 
 
-if _device.type == "cuda": 
-    logger.info(f"CUDA is available. Using GPU: {torch.cuda.get_device_name(0)}")
-else: 
-    logger.info("CUDA not available. Using CPU") 
-
-try:
-
-    class InsectModel(torch.nn.Module):
-        def __init__(self, num_classes: int): 
-            super().__init__() 
-            self.model = timm.create_model(
-                "vit_base_patch16_224",
-                pretrained=True, 
-                num_classes = num_classes
-            )
-
-        def forward(self, x:torch.Tensor) -> torch.Tensor:
-            return self.model(x) 
-    
-    _classes = [str(i) for i in range(1, 41)] 
-    logger.info(f"Intiliazing InsectModel with {len(_classes)} classes") 
-    _model = InsectModel(num_classes=len(_classes)) 
+_classes = [str(i) for i in range(1, PEST_NUM_CLASSES + 1)] 
 
-    logger.info(f"Loading model weights from {MODEL_PATH}") 
-    state = torch.load(MODEL_PATH, map_location=_device) 
-    _model.load_state_dict(state) 
-    _model.to(_device).eval() 
-    logger.info("Pest model loaded and set to eval() mode") 
+class InsectModel(torch.nn.Module):
+    def __init__(self, num_classes: int): 
+        super().__init__() 
+        # Architecture only; the trained weights come from MODEL_PATH, so
+        # nothing is downloaded.
+        self.model = timm.create_model(
+            "vit_base_patch16_224",
+            pretrained=False, 
+            num_classes = num_classes
+        )
 
-except Exception as e: 
-    logger.error(f"Failed to load pest mode: {e}", exc_info=True) 
-    raise 
+    def forward(self, x:torch.Tensor) -> torch.Tensor:
+        return self.model(x) 
+
+def load_torch_model(path: str, device: torch.device = _device) -> InsectModel: 
+    if device.type == "cuda": 
+        logger.info(f"CUDA is available. Using GPU: {torch.cuda.get_device_name(0)}")
+    else: 
+        logger.info("Using CPU") 
+
+    logger.info(f"Intiliazing InsectModel with {len(_classes)} classes") 
+    if settings.MODEL_MMAP_WEIGHTS and device.type == "cpu": 
+        # Build the module without allocating weights, then adopt the tensors
+        # of the memory-mapped checkpoint as parameters. The weights stay in
+        # the page cache and are shared by every process mapping the file.
+        with torch.device("meta"): 
+            model = InsectModel(num_classes=len(_classes)) 
+        logger.info(f"Memory-mapping model weights from {path}") 
+        try: 
+            state = torch.load(path, map_location="cpu", mmap=True, weights_only=True) 
+        except RuntimeError as e: 
+            # Only zipfile checkpoints (torch >= 1.6 format) can be mapped.
+            logger.warning(f"Cannot memory-map {path}, loading it into memory: {e}") 
+            state = torch.load(path, map_location="cpu") 
+        model.load_state_dict(state, assign=True) 
+    else: 
+        model = InsectModel(num_classes=len(_classes)) 
+        logger.info(f"Loading model weights from {path}") 
+        state = torch.load(path, map_location=device) 
+        model.load_state_dict(state) 
+    model.to(device).eval() 
+    logger.info("Pest model loaded and set to eval() mode") 
+    return model 
+
+def load_backend(backend: str, path: str): 
+    """Builds the inference backend selected by PEST_BACKEND ("torch", "int8" or "onnx")."""
+    if backend == "torch": 
+        return TorchBackend("torch", load_torch_model(path), _device) 
+    if backend == "int8": 
+        cpu = torch.device("cpu") 
+        return TorchBackend("int8", quantize_int8(load_torch_model(path, cpu)), cpu) 
+    if backend == "onnx": 
+        return OnnxBackend(path, threads=settings.PEST_ONNX_THREADS) 
+    raise ValueError(f"Unknown pest backend: {backend}") 
+
+def backend_path(backend: str) -> str: 
+    return settings.PEST_ONNX_PATH if backend == "onnx" else MODEL_PATH 
+
+pest_model = model_registry.register(
+    "pest",
+    backend_path(settings.PEST_BACKEND),
+    lambda path: load_backend(settings.PEST_BACKEND, path),
+) 
+
+# (width, height) of the classifier input.
+INPUT_SIZE = (224, 224) 
+
+def _preprocess(img_bytes: bytes) -> np.ndarray:
+    """Decodes an upload into an HWC uint8 array of INPUT_SIZE (150 KB, cheap to hand to a worker)."""
+    try: 
+        if settings.PEST_FAST_DECODE: 
+            sample = decode_resized(img_bytes, INPUT_SIZE) 
+        else: 
+            sample = decode_full(img_bytes, INPUT_SIZE) 
+        logger.debug(f"input image decoded succesfully, shape: {sample.shape}") 
+
+    except Exception as e: 
+        logger.error(f"Failed to decode image bytes: {e}")
+        raise RuntimeError("Invalid image data") 
+
+    return sample 
+
+def samples_to_batch(samples: list[np.ndarray], out: torch.Tensor | None = None) -> torch.Tensor:
+    """Writes HWC uint8 samples into an NCHW float batch scaled to [0, 1] (into `out` when given)."""
+    width, height = INPUT_SIZE 
+    if out is None: 
+        out = torch.empty((len(samples), 3, height, width), dtype=torch.float32) 
+    batch = out[:len(samples)] 
+    for i, sample in enumerate(samples): 
+        batch[i].copy_(torch.from_numpy(sample).permute(2, 0, 1)) 
+    return batch.div_(255.0) 
+
+_buffers = threading.local() 
+
+def _batch_buffer(size: int) -> torch.Tensor:
+    """
+    Batch tensor reused across forward passes by the calling thread, so
+    batching does not allocate a new input tensor every time. Pinned when
+    the torch backend runs on a GPU, so the host-to-device copy is async.
+    """
+    buffer = getattr(_buffers, "batch", None) 
+    if buffer is None or buffer.shape[0] < size: 
+        width, height = INPUT_SIZE 
+        pin = _device.type == "cuda" and settings.PEST_BACKEND == "torch" 
+        buffer = torch.empty(
+            (max(size, settings.PEST_BATCH_MAX_SIZE), 3, height, width),
+            dtype=torch.float32,
+            pin_memory=pin,
+        ) 
+        _buffers.batch = buffer 
+    return buffer 
+
+def top_k_probabilities(logits: np.ndarray, k: int) -> list[list[tuple[int, float]]]:
+    """Softmax over each row of logits; returns the k most likely (class index, probability) pairs per row."""
+    shifted = logits - logits.max(axis=1, keepdims=True) 
+    probs = np.exp(shifted) 
+    probs /= probs.sum(axis=1, keepdims=True) 
+    top = np.argsort(-probs, axis=1)[:, :k] 
+    return [
+        [(int(idx), float(row[idx])) for idx in indices]
+        for row, indices in zip(probs, top)
+    ] 
+
+def _forward(samples: list[np.ndarray]) -> list[list[tuple[int, float]]]:
+    """Runs one forward pass over a list of preprocessed samples and returns the top-k classes of each."""
+    tensor = samples_to_batch(samples, out=_batch_buffer(len(samples))) 
+    backend = pest_model.get() 
+    logger.debug(f"Running {backend.name} backend, batch shape: {tensor.shape}") 
+
+    logits = backend(tensor) 
+    top = top_k_probabilities(logits, settings.PEST_TOP_K) 
+    logger.info(f"Top predictions (class index, probability): {[t[0] for t in top]}") 
+
+    return top 
+
+pest_batcher = MicroBatcher(
+    "pest-detect",
+    _forward,
+    max_batch_size=settings.PEST_BATCH_MAX_SIZE,
+    max_wait_ms=settings.PEST_BATCH_MAX_WAIT_MS,
+    pool=inference_pool,
+)
+
+pest_result_cache = ResultCache(
+    "pest-detect",
+    max_entries=settings.RESULT_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.RESULT_CACHE_TTL_SECONDS,
+    disk_dir=settings.RESULT_CACHE_DIR,
+    max_disk_entries=settings.RESULT_CACHE_MAX_DISK_ENTRIES,
+)
+
+def result_version() -> str:
+    # Backends and decode paths may disagree on borderline images, so each gets its own entries.
+    decode = "draft" if settings.PEST_FAST_DECODE else "full" 
+    return f"{pest_model.version}:{settings.PEST_BACKEND}:{decode}:top{settings.PEST_TOP_K}" 
+
+UNKNOWN_PEST = "unknown" 
+
+def build_prediction(top: list[tuple[int, float]]) -> dict:
+    """
+    Response fields for one image. The threshold is applied here rather
+    than in the forward pass, so cached top-k results stay valid when
+    PEST_MIN_CONFIDENCE changes.
+    """
+    candidates = [
+        {"class_id": _classes[idx], "pest": pest_knowledge.label(_classes[idx]), "confidence": prob}
+        for idx, prob in top
+    ] 
+    best = candidates[0] 
+    low_confidence = best["confidence"] < settings.PEST_MIN_CONFIDENCE 
+    return {
+        "pest": UNKNOWN_PEST if low_confidence else best["pest"],
+        "class_id": None if low_confidence else best["class_id"],
+        "confidence": best["confidence"],
+        "low_confidence": low_confidence,
+        "top_k": candidates,
+    } 
+
+def _details_class_id(prediction: dict) -> str | None:
+    """Class whose details go with a prediction, or None when they are skipped."""
+    if prediction["low_confidence"] and settings.PEST_SKIP_LOW_CONFIDENCE_DETAILS: 
+        return None 
+    return prediction["top_k"][0]["class_id"] 
 
 class PredictService: 
     @staticmethod 
-    def predict(img_bytes: bytes) -> str: 
+    async def predict_async(img_bytes: bytes) -> dict: 
+        """
+        Top-k prediction for one image (see `build_prediction`). The forward
+        pass is shared with concurrent requests via `pest_batcher`, and
+        repeated uploads of the same image are served from `pest_result_cache`.
+        """
+        key = ResultCache.key_for(img_bytes, result_version()) 
+        cached = await pest_result_cache.aget(key) 
+        if cached is not None: 
+            logger.debug(f"Pest prediction cache hit for {key[:12]}") 
+            return build_prediction(cached) 
+
+        await pest_model.ensure() 
+        async with inference_pool.admission(): 
+            sample = await inference_pool.run("pest.preprocess", _preprocess, img_bytes) 
+            top = await pest_batcher.submit(sample) 
+
+        await pest_result_cache.aset(key, top) 
+        return build_prediction(top) 
 
-        try: 
-            image = Image.open(io.BytesIO(img_bytes)).convert("RGB") 
-            logger.debug("input image decoded succesfully") 
-
-        except Exception as e: 
-            logger.error(f"Failed to decode image bytes: {e}")
-            raise RuntimeError("Invalid image data") 
-        
-        arr = np.array(image) 
-        tr = valid_transform() 
-        sample = tr(image=arr)["image"] 
-        logger.debug(f"Applied valid_transform, tensor shape: {sample.shape}") 
-
-        tensor = sample.float().unsqueeze(0).to(_device) / 255.0 
-        logger.debug(f"Tensor moved to {_device}, batch shape: {tensor.shape}") 
-
-        with torch.no_grad():
-            logits = _model(tensor) 
-            logger.debug("Model forward pass complete") 
-            idx = torch.argmax(logits, dim=1).item() 
-            logger.info(f"Raw model output logits, selected class index: {idx}") 
-
-        class_id = _classes[idx] 
-        predicted_pest_name = pest_name.get(class_id, class_id) 
-        logger.info(f"Mapped class '{class_id}' to pest name '{pest_name}' ")
-        return predicted_pest_name 
-    
     @staticmethod
-    def get_pest_info(img_bytes: bytes): 
-        pest_name_pred = PredictService.predict(img_bytes) 
-        pest_id = next((k for k, v in pest_name.items() if v == pest_name_pred), None)
-        pest_data = pests.get(pest_id, {}) 
-        images = [] 
-        if pest_data and 'pest_image' in pest_data: 
-            images = [f'/static/{img}' for img in pest_data['pest_image']] 
-        return pest_name_pred, pest_data, images 
\ No newline at end of file
+    async def get_pest_response_async(img_bytes: bytes) -> bytes: 
+        """
+        The pest endpoint's JSON body. Only the prediction is serialized per
+        request; the details are spliced in from `pest_knowledge`'s
+        pre-serialized fragment.
+        """
+        prediction = await PredictService.predict_async(img_bytes) 
+        head = json.dumps(prediction, ensure_ascii=False, separators=(",", ":")).encode("utf-8") 
+        return head[:-1] + b"," + pest_knowledge.fragment(_details_class_id(prediction)) + b"}" 
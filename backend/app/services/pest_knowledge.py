@@ -0,0 +1,59 @@
+import json
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+DATA_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "pests.json")
+
+def _dumps(value) -> bytes:
+    # Same separators and escaping as FastAPI's JSONResponse.
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+class PestKnowledgeStore:
+    """
+    Pest metadata keyed by classifier class id ("1".."40").
+
+    Loaded once from app/data/pests.json. Each entry has the classifier
+    `label` plus the details served to clients (name, description,
+    prevention, pesticides, pest_image). Lookups by class id and by label are
+    dict hits. The `"data":...,"images":...` part of the pest response is
+    serialized once per pest, so responses can be assembled from bytes.
+    """
+
+    def __init__(self, path: str = DATA_PATH):
+        self.path = path
+        self.details: dict[str, dict] = {}
+        self.labels: dict[str, str] = {}
+        self.ids_by_label: dict[str, str] = {}
+        self.images: dict[str, list[str]] = {}
+        self._fragments: dict[str, bytes] = {}
+        self.load()
+
+    def load(self):
+        with open(self.path, "r", encoding="utf-8") as f:
+            entries = json.load(f)
+
+        details, labels, images, fragments = {}, {}, {}, {}
+        for class_id, entry in entries.items():
+            entry = dict(entry)
+            labels[class_id] = entry.pop("label")
+            details[class_id] = entry
+            images[class_id] = [f"/static/{img}" for img in entry.get("pest_image", [])]
+            fragments[class_id] = b'"data":' + _dumps(entry) + b',"images":' + _dumps(images[class_id])
+
+        self.details, self.labels, self.images, self._fragments = details, labels, images, fragments
+        self.ids_by_label = {label: class_id for class_id, label in labels.items()}
+        logger.info(f"Loaded {len(details)} pests from {self.path}")
+
+    def label(self, class_id: str) -> str:
+        return self.labels.get(class_id, class_id)
+
+    def class_id_for(self, label: str) -> str | None:
+        return self.ids_by_label.get(label)
+
+    def fragment(self, class_id: str | None) -> bytes:
+        """Pre-serialized `"data":...,"images":...` for a pest; nulls when unknown or skipped."""
+        return self._fragments.get(class_id, b'"data":null,"images":null')
+
+pest_knowledge = PestKnowledgeStore()
@@ -0,0 +1,178 @@
+import asyncio 
+import hashlib 
+import json 
+import logging 
+import os 
+from datetime import datetime, timezone 
+
+from app.core.config import settings 
+from app.schemas.scheme import SchemesResponse 
+from app.services.schemes import get_schemes 
+from app.utils.file_lock import async_file_lock 
+from app.utils.singleflight import SingleFlight 
+
+logger = logging.getLogger(__name__) 
+
+class SchemeSnapshot: 
+    """One validated catalog version, pre-serialized so reads never touch Pydantic."""
+
+    def __init__(self, version: int, fetched_at: str, data: SchemesResponse): 
+        self.version = version 
+        self.fetched_at = fetched_at 
+        self.data = data 
+        self.body = data.model_dump_json().encode() 
+        self.etag = f'"{hashlib.sha256(self.body).hexdigest()[:32]}"' 
+
+    def to_record(self) -> dict: 
+        return {
+            "version": self.version,
+            "fetched_at": self.fetched_at,
+            "data": json.loads(self.body),
+        }
+
+class SchemeCatalog: 
+    """
+    Keeps the government schemes list in memory and refreshes it in the background.
+
+    The LLM web search behind `get_schemes` is slow and returns the same
+    content to everyone, so it only runs on a schedule. Each good result is
+    validated, versioned and written to `path`; a failed refresh keeps
+    serving the last good snapshot (also loaded from disk at startup).
+
+    All workers of a host share that file: a refresh holds an exclusive lock
+    on `<path>.lock`, and workers that waited on it load the new file
+    instead of fetching again. Every worker thus serves the same version
+    and ETag, both taken from the file's content.
+    """
+
+    def __init__(self, path: str, refresh_seconds: float, retry_seconds: float): 
+        self.path = path 
+        self.refresh_seconds = refresh_seconds 
+        self.retry_seconds = retry_seconds 
+        self.snapshot: SchemeSnapshot | None = None 
+        self.last_error: str | None = None 
+        # Requests on a cold start and the background task share one fetch.
+        self._flight = SingleFlight() 
+        self._file_state: tuple[int, int] | None = None 
+        self._task: asyncio.Task | None = None 
+
+    def _stat(self) -> tuple[int, int] | None: 
+        try: 
+            stat = os.stat(self.path) 
+        except FileNotFoundError: 
+            return None 
+        return stat.st_ino, stat.st_mtime_ns 
+
+    def load(self): 
+        self._file_state = self._stat() 
+        try: 
+            with open(self.path, "r", encoding="utf-8") as f: 
+                record = json.load(f) 
+            self.snapshot = SchemeSnapshot(
+                version=record["version"],
+                fetched_at=record["fetched_at"],
+                data=SchemesResponse.model_validate(record["data"]),
+            )
+            logger.info(f"Loaded schemes catalog v{self.snapshot.version} from {self.path}") 
+        except FileNotFoundError: 
+            logger.info(f"No schemes catalog snapshot at {self.path}") 
+        except Exception as e: 
+            logger.error(f"Ignoring unreadable schemes catalog snapshot {self.path}: {e}") 
+
+    def _persist(self, snapshot: SchemeSnapshot): 
+        os.makedirs(os.path.dirname(self.path), exist_ok=True) 
+        tmp_path = f"{self.path}.{os.getpid()}.tmp" 
+        with open(tmp_path, "w", encoding="utf-8") as f: 
+            json.dump(snapshot.to_record(), f) 
+        os.replace(tmp_path, self.path) 
+        self._file_state = self._stat() 
+
+    def reload_if_changed(self): 
+        """Loads the file again if another worker replaced it since the last load."""
+        if self._stat() != self._file_state: 
+            self.load() 
+
+    def seconds_until_stale(self) -> float: 
+        if self.snapshot is None: 
+            return 0.0 
+        fetched_at = datetime.fromisoformat(self.snapshot.fetched_at) 
+        age = (datetime.now(timezone.utc) - fetched_at).total_seconds() 
+        return max(0.0, self.refresh_seconds - age) 
+
+    def is_stale(self) -> bool: 
+        return self.seconds_until_stale() == 0.0 
+
+    async def refresh(self) -> bool: 
+        """Fetches a new catalog. Returns False (keeping the old snapshot) on failure."""
+        return await self._flight.do("refresh", self._refresh) 
+
+    async def _refresh(self) -> bool: 
+        async with async_file_lock(f"{self.path}.lock"): 
+            # Another worker may have refreshed while we waited for the lock.
+            await asyncio.to_thread(self.reload_if_changed) 
+            if not self.is_stale(): 
+                return True 
+            return await self._fetch() 
+
+    async def _fetch(self) -> bool: 
+        try: 
+            data = SchemesResponse.model_validate(await get_schemes()) 
+            if not data.schemes: 
+                raise ValueError("LLM returned no schemes") 
+        except Exception as e: 
+            self.last_error = str(e) 
+            logger.error(f"Schemes catalog refresh failed, keeping last snapshot: {e}") 
+            return False 
+
+        previous = self.snapshot 
+        fetched_at = datetime.now(timezone.utc).isoformat() 
+        candidate = SchemeSnapshot(0, fetched_at, data) 
+        if previous is not None and previous.etag == candidate.etag: 
+            version = previous.version 
+        else: 
+            version = (previous.version if previous else 0) + 1 
+        snapshot = SchemeSnapshot(version, fetched_at, data) 
+
+        try: 
+            await asyncio.to_thread(self._persist, snapshot) 
+        except Exception as e: 
+            logger.error(f"Failed to persist schemes catalog to {self.path}: {e}") 
+
+        self.snapshot = snapshot 
+        self.last_error = None 
+        logger.info(f"Schemes catalog refreshed to v{snapshot.version} ({len(data.schemes)} schemes)") 
+        return True 
+
+    async def ensure_loaded(self) -> SchemeSnapshot | None: 
+        if self.snapshot is None: 
+            await self.refresh() 
+        return self.snapshot 
+
+    async def _run(self): 
+        while True: 
+            await asyncio.to_thread(self.reload_if_changed) 
+            ok = True 
+            if self.is_stale(): 
+                ok = await self.refresh() 
+            # Workers share `fetched_at` from the file, so they all wake up when it goes stale.
+            await asyncio.sleep(max(1.0, self.seconds_until_stale()) if ok else self.retry_seconds) 
+
+    async def start(self): 
+        self.load() 
+        if self._task is None: 
+            self._task = asyncio.create_task(self._run(), name="scheme-catalog-refresh") 
+
+    async def stop(self): 
+        if self._task is not None: 
+            self._task.cancel() 
+            try: 
+                await self._task 
+            except asyncio.CancelledError: 
+                pass 
+            self._task = None 
+
+scheme_catalog = SchemeCatalog(
+    path=settings.SCHEMES_CATALOG_PATH,
+    refresh_seconds=settings.SCHEMES_REFRESH_SECONDS,
+    retry_seconds=settings.SCHEMES_RETRY_SECONDS,
+)
@@ -1,13 +1,11 @@
 import logging 
 import json 
 import re 
-from groq import Groq 
+from app.services.llm_client import llm_client 
 
 logger = logging.getLogger(__name__) 
 
-def get_schemes(): 
-    client = Groq()
-
+async def get_schemes(): 
     formatted_prompt = """
     Search the web and find the best and currently active government agricultural schemes for Indian farmers.
 
@@ -47,7 +45,7 @@ def get_schemes():
     }
     """
 
-    response = client.chat.completions.create(
+    content = await llm_client.chat_completion(
         model="compound-beta",
         messages=[
             {
@@ -62,8 +60,6 @@ def get_schemes():
         response_format={"type": "json_object"}
     )
 
-    content = response.choices[0].message.content
-
     # Extract the first JSON object from the response
     match = re.search(r'(\{.*\}|\[.*\])', content, re.DOTALL)
     if match:
@@ -0,0 +1,74 @@
+import logging
+import secrets
+import time
+
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+from app.core.security import create_access_token, create_refresh_token, verify_refresh_token
+from app.schemas.token import Token, TokenPayload
+from app.utils.revocation_store import RevocationStore
+
+logger = logging.getLogger(__name__)
+
+# Used refresh tokens ("jti:<id>") and revoked families ("fam:<id>"), each
+# kept only until the tokens it covers would have expired anyway.
+revocation_store = RevocationStore(
+    path=settings.TOKEN_REVOCATION_PATH,
+    bloom_bits=settings.TOKEN_REVOCATION_BLOOM_BITS,
+)
+
+def _credentials_exception(detail: str = "Could not validate refresh token") -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+def _family_expiry() -> float:
+    # Every rotation extends the family by a full refresh lifetime, so a
+    # revocation has to outlive the newest token that could still be issued.
+    return time.time() + settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400
+
+def issue_tokens(user_id: int, family: str | None = None) -> Token:
+    """A new access/refresh pair; without `family` (i.e. on login) a new session starts."""
+    family = family or secrets.token_urlsafe(16)
+    refresh_token = create_refresh_token(subject=user_id, family=family)
+    access_token = create_access_token(subject=user_id, family=family)
+    return Token(access_token=access_token, refresh_token=refresh_token)
+
+def is_family_revoked(family: str | None) -> bool:
+    return family is not None and revocation_store.contains(f"fam:{family}")
+
+def _verify(refresh_token: str) -> TokenPayload:
+    token_data = verify_refresh_token(refresh_token, _credentials_exception())
+    if token_data.jti is None or token_data.fam is None:
+        # Issued before rotation existed; the client has to log in again.
+        raise _credentials_exception()
+    return token_data
+
+def rotate_refresh_token(refresh_token: str) -> Token:
+    """
+    Exchanges a refresh token for a new pair in the same family.
+
+    Each refresh token works once. Presenting one that was already used
+    means it leaked (or the client replayed it), so the whole family is
+    revoked and its holder, legitimate or not, has to log in again. No
+    database access: the user id comes from the signed token, and deleted
+    users are still rejected by `get_current_user` when the access token is used.
+    """
+    token_data = _verify(refresh_token)
+    if is_family_revoked(token_data.fam):
+        raise _credentials_exception("Session has been revoked")
+
+    if not revocation_store.add_if_absent(f"jti:{token_data.jti}", token_data.exp or _family_expiry()):
+        revocation_store.add(f"fam:{token_data.fam}", _family_expiry())
+        logger.warning(f"Refresh token reuse for user {token_data.sub}, revoked family {token_data.fam}")
+        raise _credentials_exception("Refresh token reuse detected, please log in again")
+
+    return issue_tokens(int(token_data.sub), family=token_data.fam)
+
+def revoke_refresh_token(refresh_token: str):
+    """Logout: revokes the token's family, which ends the session on every token derived from it."""
+    token_data = _verify(refresh_token)
+    revocation_store.add(f"fam:{token_data.fam}", _family_expiry())
@@ -1,3 +1,5 @@
+import logging
+
 from fastapi import HTTPException, status
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -5,7 +7,9 @@ from sqlalchemy.exc import IntegrityError
 
 from app.db.models.user import User
 from app.schemas.user import UserCreateRequest, LoginRequest
-from app.core.security import get_password_hash, verify_password
+from app.core.security import get_password_hash_async, verify_and_update_password
+
+logger = logging.getLogger(__name__)
 
 async def get_user_by_email(session: AsyncSession, email: str) -> User | None:
     """Fetches a user by email."""
@@ -21,7 +25,7 @@ async def create_user(session: AsyncSession, user_in: UserCreateRequest) -> User
             detail=f"User with email {user_in.email} already exists"
         )
 
-    hashed_password = get_password_hash(user_in.password)
+    hashed_password = await get_password_hash_async(user_in.password)
     new_user = User(
         email=user_in.email,
         password=hashed_password
@@ -53,8 +57,18 @@ async def authenticate_user(session: AsyncSession, login_data: LoginRequest) ->
     user = await get_user_by_email(session, login_data.email)
     if not user:
         return None
-    if not verify_password(login_data.password, user.password):
+    valid, new_hash = await verify_and_update_password(login_data.password, user.password)
+    if not valid:
         return None
+    if new_hash:
+        # Stored hash predates the current BCRYPT_ROUNDS; upgrade it transparently.
+        user.password = new_hash
+        try:
+            session.add(user)
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            logger.warning(f"Could not rehash password for user {user.id}: {e}")
     return user
 
 async def get_user_by_id(session: AsyncSession, user_id: int) -> User | None:
@@ -1,20 +1,149 @@
 import aiohttp
+import asyncio
 import logging
+import re
+import time
+from urllib.parse import quote
 from fastapi import HTTPException
 from app.core.config import settings
-from app.schemas.weather import WeatherResponse, CurrentWeather, Forecast, ForecastDay, Hour, Day, Condition, Astro
+from app.schemas.weather import WeatherResponse
+from app.utils.cache import TTLCache
+from app.utils.singleflight import SingleFlight
+from app.utils.weather_mapper import ALL_SECTIONS, FORECAST_SECTIONS, map_weather, serialize
 
 logger = logging.getLogger(__name__)
 
-async def fetch_weather_data(location: str) -> WeatherResponse:
+# Entries are fresh for WEATHER_CACHE_TTL_SECONDS, then served stale (while a
+# background refresh runs) for up to WEATHER_CACHE_STALE_SECONDS more.
+_cache = TTLCache(
+    max_entries=settings.WEATHER_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.WEATHER_CACHE_TTL_SECONDS + settings.WEATHER_CACHE_STALE_SECONDS,
+)
+_flights = SingleFlight()
+_refresh_tasks: set[asyncio.Task] = set()
+_session: aiohttp.ClientSession | None = None
+_validated = False
+
+
+async def startup():
+    """Opens the pooled HTTP session shared by all weather requests."""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=settings.WEATHER_MAX_CONNECTIONS, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=10),
+        )
+        logger.info("Weather HTTP session opened")
+
+
+async def shutdown():
+    global _session
+    for task in list(_refresh_tasks):
+        task.cancel()
+    if _session is not None:
+        await _session.close()
+        _session = None
+        logger.info("Weather HTTP session closed")
+
+
+async def _get_session() -> aiohttp.ClientSession:
+    # Opened lazily so the service also works outside the app lifespan.
+    if _session is None or _session.closed:
+        await startup()
+    return _session
+
+
+MAX_FORECAST_DAYS = 15
+
+# Visual Crossing elements read by the mapper, per response section.
+_BASE_ELEMENTS = ("datetime", "datetimeEpoch", "temp", "feelslike", "conditions", "icon",
+                  "windspeed", "humidity", "precip", "uvindex")
+_SECTION_ELEMENTS = {
+    "current": ("winddir",),
+    "day": ("tempmax", "tempmin", "precipprob"),
+    "astro": ("sunrise", "sunset"),
+    "hour": (),
+}
+
+
+def normalize_location(location: str) -> str:
+    return re.sub(r"\s+", " ", location.strip()).casefold()
+
+
+def parse_sections(fields: str | None, hours: bool = True) -> frozenset[str]:
     """
-    Fetch weather data from the Visual Crossing Weather API for a given location.
+    Turns the `fields` mask (comma-separated "current", "forecast",
+    "forecast.day", "forecast.astro", "forecast.hour") into mapper sections.
+    """
+    if not fields:
+        sections = set(ALL_SECTIONS)
+    else:
+        sections = set()
+        for token in (t.strip().lower() for t in fields.split(",")):
+            if not token:
+                continue
+            if token == "current":
+                sections.add("current")
+            elif token == "forecast":
+                sections.update(FORECAST_SECTIONS)
+            elif token.startswith("forecast.") and token[len("forecast."):] in FORECAST_SECTIONS:
+                sections.add(token[len("forecast."):])
+            else:
+                raise HTTPException(status_code=400, detail=f"Unknown weather field '{token}'")
+    if not hours:
+        sections.discard("hour")
+    if not sections:
+        raise HTTPException(status_code=400, detail="Field selection is empty")
+    return frozenset(sections)
+
+
+def build_upstream_url(location: str, api_key: str, sections: frozenset[str], days: int | None) -> str:
+    """Pushes the section mask and horizon down into the Visual Crossing request."""
+    base_url = "https://weather.visualcrossing.com/VisualCrossingWebServices/rest/services/timeline"
+    path = quote(location, safe=",")
+    if days is not None and any(s in sections for s in FORECAST_SECTIONS):
+        path += "/today" if days == 1 else f"/next{days - 1}days"
+
+    include = []
+    if "current" in sections:
+        include.append("current")
+    if any(s in sections for s in FORECAST_SECTIONS):
+        include.append("days")
+    if "hour" in sections:
+        include.append("hours")
+
+    elements = list(_BASE_ELEMENTS)
+    for section in sorted(sections):
+        elements.extend(_SECTION_ELEMENTS[section])
+
+    return (
+        f"{base_url}/{path}?key={api_key}&unitGroup=metric"
+        f"&include={','.join(include)}&elements={','.join(elements)}"
+    )
+
+
+async def fetch_weather_data(
+    location: str,
+    days: int | None = None,
+    hours: bool = True,
+    fields: str | None = None,
+) -> bytes:
+    """
+    Fetch weather data for a given location, served from a short-lived cache.
+
+    Only the requested days and sections are fetched from upstream, mapped
+    and returned. Concurrent requests for the same (normalized) location and
+    selection share a single upstream fetch, and stale entries are returned
+    immediately while they are refreshed in the background.
 
     Args:
         location (str): The location to fetch weather data for (e.g., "Delhi").
+        days (int | None): Number of forecast days, starting today. All days if None.
+        hours (bool): Whether to include hourly forecasts.
+        fields (str | None): Comma-separated field mask, see `parse_sections`.
 
     Returns:
-        WeatherResponse: Parsed and structured weather data.
+        bytes: The serialized WeatherResponse JSON.
 
     Raises:
         HTTPException: If the API request fails or data parsing fails.
@@ -22,125 +151,92 @@ async def fetch_weather_data(location: str) -> WeatherResponse:
     if not location or location.strip() == "":
         logger.warning("Received empty or invalid location")
         raise HTTPException(status_code=400, detail="Location cannot be empty")
+    if days is not None and not 1 <= days <= MAX_FORECAST_DAYS:
+        raise HTTPException(status_code=400, detail=f"days must be between 1 and {MAX_FORECAST_DAYS}")
 
+    sections = parse_sections(fields, hours)
+    key = f"{normalize_location(location)}|{days or ''}|{','.join(sorted(sections))}"
+    entry = _cache.get(key)
+    if entry is not None:
+        fetched_at, body = entry
+        if time.time() - fetched_at >= settings.WEATHER_CACHE_TTL_SECONDS:
+            _schedule_refresh(key, location, sections, days)
+        return body
+
+    return await _flights.do(key, lambda: _fetch_and_store(key, location, sections, days))
+
+
+def _schedule_refresh(key: str, location: str, sections: frozenset[str], days: int | None):
+    async def refresh():
+        try:
+            await _flights.do(key, lambda: _fetch_and_store(key, location, sections, days))
+        except Exception as e:
+            logger.warning(f"Background weather refresh for '{location}' failed: {e}")
+
+    logger.debug(f"Serving stale weather for '{location}', refreshing in background")
+    task = asyncio.create_task(refresh())
+    _refresh_tasks.add(task)
+    task.add_done_callback(_refresh_tasks.discard)
+
+
+async def _fetch_and_store(key: str, location: str, sections: frozenset[str], days: int | None) -> bytes:
+    body = await _fetch_upstream(location.strip(), sections, days)
+    _cache.set(key, (time.time(), body))
+    return body
+
+
+def _validate_once(payload: dict):
+    """
+    Checks a mapped payload against WeatherResponse. Done for the first
+    response per process (or every response with WEATHER_VALIDATE_RESPONSES)
+    so schema drift is caught without paying for it on every request.
+    """
+    global _validated
+    if _validated and not settings.WEATHER_VALIDATE_RESPONSES:
+        return
+    WeatherResponse.model_validate(payload)
+    _validated = True
+
+
+async def _fetch_upstream(location: str, sections: frozenset[str] = ALL_SECTIONS, days: int | None = None) -> bytes:
+    """
+    Fetch weather data from the Visual Crossing Weather API for a given location.
+    """
     # Construct the API URL
     api_key = settings.WEATHER_API_KEY
     if not api_key:
         logger.error("Weather API key is not configured")
         raise HTTPException(status_code=500, detail="Weather API key is not configured")
 
-    base_url = "https://weather.visualcrossing.com/VisualCrossingWebServices/rest/services/timeline"
-    url = f"{base_url}/{location}?key={api_key}&unitGroup=metric&include=days,hours,current"
-    logger.info(f"Fetching weather data for '{location}' from {url}")
+    url = build_upstream_url(location, api_key, sections, days)
+    logger.info(f"Fetching weather data for '{location}'")
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, timeout=10) as response:
-                if response.status != 200:
-                    logger.error(f"API request failed with status {response.status}: {await response.text()}")
-                    raise HTTPException(
-                        status_code=response.status,
-                        detail=f"Weather API request failed with status {response.status}"
-                    )
-
-                data = await response.json()
-                logger.debug(f"Raw API response: {data}")
-
-                # Map Visual Crossing response to WeatherResponse schema
-                try:
-                    # Map currentConditions to CurrentWeather
-                    current_conditions = data.get('currentConditions', {})
-                    current_weather = CurrentWeather(
-                        last_updated=current_conditions.get('datetime'),
-                        last_updated_epoch=current_conditions.get('datetimeEpoch'),
-                        temp_c=current_conditions.get('temp'),
-                        feelslike_c=current_conditions.get('feelslike'),
-                        condition=Condition(
-                            text=current_conditions.get('conditions'),
-                            icon=current_conditions.get('icon')
-                        ),
-                        wind_kph=float(current_conditions.get('windspeed', 0)) * 3.6,  # Convert mph to kph
-                        wind_dir=current_conditions.get('winddir'),
-                        humidity=current_conditions.get('humidity'),
-                        precip_mm=current_conditions.get('precip'),
-                        uv=current_conditions.get('uvindex'),
-                        temp_f=current_conditions.get('temp') * 9/5 + 32 if current_conditions.get('temp') else None,
-                        feelslike_f=current_conditions.get('feelslike') * 9/5 + 32 if current_conditions.get('feelslike') else None
-                    )
-
-                    # Map days to Forecast.forecastday
-                    forecast_days = []
-                    for day_data in data.get('days', []):
-                        # Map hourly data
-                        hours = [
-                            Hour(
-                                time_epoch=hour.get('datetimeEpoch'),
-                                time=hour.get('datetime'),
-                                temp_c=hour.get('temp'),
-                                is_day=1 if hour.get('icon').endswith('-day') else 0,
-                                condition=Condition(
-                                    text=hour.get('conditions'),
-                                    icon=hour.get('icon')
-                                ),
-                                wind_kph=float(hour.get('windspeed', 0)) * 3.6,
-                                humidity=hour.get('humidity'),
-                                precip_mm=hour.get('precip'),
-                                feelslike_c=hour.get('feelslike'),
-                                uv=hour.get('uvindex')
-                            )
-                            for hour in day_data.get('hours', [])
-                        ]
-
-                        # Map day data
-                        day = Day(
-                            maxtemp_c=day_data.get('tempmax'),
-                            mintemp_c=day_data.get('tempmin'),
-                            avgtemp_c=day_data.get('temp'),
-                            condition=Condition(
-                                text=day_data.get('conditions'),
-                                icon=day_data.get('icon')
-                            ),
-                            daily_chance_of_rain=day_data.get('precipprob'),
-                            totalprecip_mm=day_data.get('precip'),
-                            maxwind_kph=float(day_data.get('windspeed', 0)) * 3.6,
-                            avghumidity=day_data.get('humidity'),
-                            uv=day_data.get('uvindex')
-                        )
-
-                        # Map astro data
-                        astro = Astro(
-                            sunrise=day_data.get('sunrise'),
-                            sunset=day_data.get('sunset')
-                        )
-
-                        forecast_day = ForecastDay(
-                            date=day_data.get('datetime'),
-                            date_epoch=day_data.get('datetimeEpoch'),
-                            day=day,
-                            astro=astro,
-                            hour=hours
-                        )
-                        forecast_days.append(forecast_day)
-
-                    forecast = Forecast(forecastday=forecast_days)
-
-                    # Create WeatherResponse
-                    weather_response = WeatherResponse(
-                        resolvedAddress=data.get('resolvedAddress', location),
-                        current=current_weather,
-                        forecast=forecast
-                    )
-
-                    logger.debug(f"Processed WeatherResponse: {weather_response.dict()}")
-                    return weather_response
-
-                except Exception as e:
-                    logger.error(f"Failed to parse weather data: {str(e)}")
-                    raise HTTPException(
-                        status_code=500,
-                        detail=f"Failed to process weather data structure for {location}: {str(e)}"
-                    )
-
+        session = await _get_session()
+        async with session.get(url) as response:
+            if response.status != 200:
+                logger.error(f"API request failed with status {response.status}: {await response.text()}")
+                raise HTTPException(
+                    status_code=response.status,
+                    detail=f"Weather API request failed with status {response.status}"
+                )
+
+            data = await response.json()
+            logger.debug(f"Received {len(data.get('days') or [])} forecast days for '{location}'")
+
+        try:
+            payload = map_weather(data, location, sections, days)
+            _validate_once(payload)
+            return serialize(payload)
+        except Exception as e:
+            logger.error(f"Failed to parse weather data: {str(e)}")
+            raise HTTPException(
+                status_code=500,
+                detail=f"Failed to process weather data structure for {location}: {str(e)}"
+            )
+
+    except HTTPException:
+        raise
     except aiohttp.ClientError as e:
         logger.error(f"Network error while fetching weather data for '{location}': {str(e)}")
         raise HTTPException(status_code=503, detail=f"Weather service unavailable: {str(e)}")
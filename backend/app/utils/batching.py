@@ -0,0 +1,173 @@
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING, Any, Callable, List
+
+if TYPE_CHECKING:
+    from app.utils.inference_pool import InferencePool
+
+logger = logging.getLogger(__name__)
+
+
+class BatchStats:
+    """Running counters for a MicroBatcher, exposed on the metrics endpoint."""
+
+    def __init__(self, max_batch_size: int):
+        self.max_batch_size = max_batch_size
+        self.batches = 0
+        self.items = 0
+        self.errors = 0
+        self.total_queue_ms = 0.0
+        self.max_queue_ms = 0.0
+        self.total_forward_ms = 0.0
+
+    def record(self, batch_size: int, queue_ms: List[float], forward_ms: float):
+        self.batches += 1
+        self.items += batch_size
+        self.total_queue_ms += sum(queue_ms)
+        self.max_queue_ms = max(self.max_queue_ms, max(queue_ms))
+        self.total_forward_ms += forward_ms
+
+    def snapshot(self) -> dict:
+        batches = self.batches or 1
+        items = self.items or 1
+        return {
+            "max_batch_size": self.max_batch_size,
+            "batches": self.batches,
+            "items": self.items,
+            "errors": self.errors,
+            "avg_batch_size": self.items / batches,
+            "fill_rate": self.items / (batches * self.max_batch_size),
+            "avg_queue_ms": self.total_queue_ms / items,
+            "max_queue_ms": self.max_queue_ms,
+            "avg_forward_ms": self.total_forward_ms / batches,
+        }
+
+
+class MicroBatcher:
+    """
+    Collects concurrent inference requests into batches.
+
+    Requests are queued by `submit`; a single background task waits for the
+    first item, keeps collecting until either `max_batch_size` items are
+    queued or `max_wait_ms` has passed, then hands the whole batch to
+    `process_batch` and resolves each caller's future with its result.
+    `process_batch` receives a list of items and must return a list of
+    results in the same order. It runs on `pool` when given, otherwise on
+    the default thread executor.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        process_batch: Callable[[List[Any]], List[Any]],
+        max_batch_size: int = 8,
+        max_wait_ms: float = 10.0,
+        pool: "InferencePool | None" = None,
+    ):
+        self.name = name
+        self.process_batch = process_batch
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+        self.pool = pool
+        self.stats = BatchStats(self.max_batch_size)
+        self._queue: asyncio.Queue | None = None
+        self._worker: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._worker is not None and not self._worker.done()
+
+    async def start(self):
+        if self.running:
+            return
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.create_task(self._run(), name=f"batcher-{self.name}")
+        logger.info(
+            f"Started batcher '{self.name}' (max_batch_size={self.max_batch_size}, "
+            f"max_wait_ms={self.max_wait * 1000:.1f})"
+        )
+
+    async def stop(self):
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+
+        while self._queue is not None and not self._queue.empty():
+            _, future, _ = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError(f"Batcher '{self.name}' stopped"))
+        logger.info(f"Stopped batcher '{self.name}'")
+
+    async def submit(self, item: Any) -> Any:
+        # Started lazily so the batcher also works outside the app lifespan.
+        if not self.running:
+            await self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future, time.perf_counter()))
+        return await future
+
+    def queue_depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def _collect(self) -> list:
+        batch = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self):
+        while True:
+            batch = await self._collect()
+            # Drop requests whose caller has already gone away.
+            batch = [entry for entry in batch if not entry[1].done()]
+            if batch:
+                await self._dispatch(batch)
+
+    async def _dispatch(self, batch: list):
+        started = time.perf_counter()
+        queue_ms = [(started - enqueued) * 1000 for _, _, enqueued in batch]
+        items = [item for item, _, _ in batch]
+
+        try:
+            if self.pool is not None:
+                results = await self.pool.run(f"{self.name}.forward", self.process_batch, items)
+            else:
+                results = await asyncio.to_thread(self.process_batch, items)
+            if len(results) != len(items):
+                raise RuntimeError(
+                    f"Batch of {len(items)} items produced {len(results)} results"
+                )
+        except Exception as e:
+            self.stats.errors += 1
+            logger.error(f"Batcher '{self.name}' failed on batch of {len(items)}: {e}")
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        forward_ms = (time.perf_counter() - started) * 1000
+        self.stats.record(len(items), queue_ms, forward_ms)
+        logger.debug(
+            f"Batcher '{self.name}' ran batch of {len(items)} in {forward_ms:.1f} ms "
+            f"(max queue wait {max(queue_ms):.1f} ms)"
+        )
+        for (_, future, _), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
@@ -0,0 +1,206 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_registry: dict[str, "ResultCache"] = {}
+
+
+class TTLCache:
+    """Thread-safe, size-bounded LRU cache whose entries expire after a TTL."""
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 3600):
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= time.time():
+                del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any, ttl_seconds: float | None = None):
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        with self._lock:
+            self._data[key] = (time.time() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def snapshot(self) -> dict:
+        return {
+            "entries": len(self._data),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class ResultCache:
+    """
+    Two-tier cache for model results keyed on the hash of the input bytes.
+
+    The first tier is an in-process TTLCache. When `disk_dir` is set, values
+    (which must be JSON-serializable) are also written there as one file per
+    key and read back on a memory miss, so results survive restarts and are
+    shared between workers on the same node.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int = 1024,
+        ttl_seconds: float = 86400,
+        disk_dir: str | None = None,
+        max_disk_entries: int = 10000,
+    ):
+        self.name = name
+        self.memory = TTLCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self.disk_dir = os.path.join(disk_dir, name) if disk_dir else None
+        self.max_disk_entries = max_disk_entries
+        self.disk_hits = 0
+        self.disk_misses = 0
+        self._disk_writes = 0
+        if self.disk_dir:
+            os.makedirs(self.disk_dir, exist_ok=True)
+        _registry[name] = self
+
+    @staticmethod
+    def key_for(data: bytes, version: str) -> str:
+        digest = hashlib.sha256()
+        digest.update(version.encode())
+        digest.update(b"\0")
+        digest.update(data)
+        return digest.hexdigest()
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, f"{key}.json")
+
+    def _disk_get(self, key: str) -> Any | None:
+        path = self._disk_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            self.disk_misses += 1
+            return None
+        except Exception as e:
+            logger.warning(f"Dropping unreadable cache entry {path}: {e}")
+            self._disk_delete(key)
+            self.disk_misses += 1
+            return None
+
+        if entry.get("expires_at", 0) <= time.time():
+            self._disk_delete(key)
+            self.disk_misses += 1
+            return None
+        self.disk_hits += 1
+        return entry["value"]
+
+    def _disk_set(self, key: str, value: Any):
+        path = self._disk_path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        entry = {"expires_at": time.time() + self.memory.ttl_seconds, "value": value}
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Failed to write cache entry {path}: {e}")
+            return
+
+        self._disk_writes += 1
+        if self._disk_writes % 100 == 0:
+            self._prune_disk()
+
+    def _disk_delete(self, key: str):
+        try:
+            os.remove(self._disk_path(key))
+        except OSError:
+            pass
+
+    def _prune_disk(self):
+        entries = [e for e in os.scandir(self.disk_dir) if e.name.endswith(".json")]
+        excess = len(entries) - self.max_disk_entries
+        if excess <= 0:
+            return
+        entries.sort(key=lambda e: e.stat().st_mtime)
+        for entry in entries[:excess]:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+        logger.info(f"Pruned {excess} entries from '{self.name}' disk cache")
+
+    def get(self, key: str) -> Any | None:
+        value = self.memory.get(key)
+        if value is None and self.disk_dir:
+            value = self._disk_get(key)
+            if value is not None:
+                self.memory.set(key, value)
+        return value
+
+    def set(self, key: str, value: Any):
+        self.memory.set(key, value)
+        if self.disk_dir:
+            self._disk_set(key, value)
+
+    async def aget(self, key: str) -> Any | None:
+        value = self.memory.get(key)
+        if value is None and self.disk_dir:
+            value = await asyncio.to_thread(self._disk_get, key)
+            if value is not None:
+                self.memory.set(key, value)
+        return value
+
+    async def aset(self, key: str, value: Any):
+        self.memory.set(key, value)
+        if self.disk_dir:
+            await asyncio.to_thread(self._disk_set, key, value)
+
+    def snapshot(self) -> dict:
+        return {
+            **self.memory.snapshot(),
+            "ttl_seconds": self.memory.ttl_seconds,
+            "disk_enabled": self.disk_dir is not None,
+            "disk_hits": self.disk_hits,
+            "disk_misses": self.disk_misses,
+        }
+
+
+def all_cache_stats() -> dict[str, dict]:
+    return {name: cache.snapshot() for name, cache in _registry.items()}
@@ -0,0 +1,164 @@
+"""
+Pre-compiled feature encoding for the pickled market price pipeline.
+
+The model is a `Pipeline([("pre", ColumnTransformer([...])), ("reg", ...)])`
+trained on a DataFrame. For one-row requests, building that DataFrame and
+letting the ColumnTransformer encode it costs far more than the regressor.
+`compile_pipeline` reads the fitted transformer once (scaler statistics,
+one-hot vocabularies) and produces a `CompiledPipeline` that encodes plain
+column lists straight into a NumPy matrix and calls the remaining steps.
+
+Only the transformer types the training notebooks use are supported
+(StandardScaler, dense OneHotEncoder, passthrough/drop). Anything else makes
+`compile_pipeline` return None and callers keep using the pandas path.
+"""
+import logging
+from typing import Any, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class UnsupportedPipeline(Exception):
+    pass
+
+
+class _Block:
+    width = 0
+
+    def encode(self, columns: dict[str, Sequence], n_rows: int, out: np.ndarray, start: int):
+        raise NotImplementedError
+
+
+class _NumericBlock(_Block):
+    """StandardScaler (or passthrough when mean/scale are None) over numeric columns."""
+
+    def __init__(self, names: list[str], mean: np.ndarray | None, scale: np.ndarray | None):
+        self.names = names
+        self.mean = mean
+        self.scale = scale
+        self.width = len(names)
+
+    def encode(self, columns, n_rows, out, start):
+        block = out[:, start:start + self.width]
+        for j, name in enumerate(self.names):
+            block[:, j] = np.asarray(columns[name], dtype=np.float64)
+        # Same in-place operation order as StandardScaler.transform.
+        if self.mean is not None:
+            block -= self.mean
+        if self.scale is not None:
+            block /= self.scale
+
+
+class _OneHotBlock(_Block):
+    """Dense OneHotEncoder with interned vocabularies."""
+
+    def __init__(self, names: list[str], categories: list[np.ndarray], ignore_unknown: bool):
+        self.names = names
+        self.vocab: list[dict[Any, int]] = []
+        offset = 0
+        for cats in categories:
+            self.vocab.append({cat: offset + i for i, cat in enumerate(cats.tolist())})
+            offset += len(cats)
+        self.ignore_unknown = ignore_unknown
+        self.width = offset
+
+    def encode(self, columns, n_rows, out, start):
+        rows = np.arange(n_rows)
+        for name, vocab in zip(self.names, self.vocab):
+            positions = np.fromiter((vocab.get(v, -1) for v in columns[name]), dtype=np.int64, count=n_rows)
+            known = positions >= 0
+            if not known.all() and not self.ignore_unknown:
+                raise ValueError(f"Found unknown categories in column '{name}' during transform")
+            out[rows[known], start + positions[known]] = 1.0
+
+
+def _column_names(selector, feature_names: list[str]) -> list[str]:
+    if isinstance(selector, str):
+        return [selector]
+    names = []
+    for item in selector:
+        if isinstance(item, str):
+            names.append(item)
+        elif isinstance(item, (int, np.integer)):
+            names.append(feature_names[item])
+        else:
+            raise UnsupportedPipeline(f"Unsupported column selector {selector!r}")
+    return names
+
+
+def _compile_transformer(transformer, names: list[str]) -> _Block | None:
+    from sklearn.preprocessing import FunctionTransformer, OneHotEncoder, StandardScaler
+
+    if isinstance(transformer, str) and transformer == "drop" or not names:
+        return None
+    # Fitted ColumnTransformers store "passthrough" as an identity FunctionTransformer.
+    if isinstance(transformer, str) and transformer == "passthrough" or (
+        isinstance(transformer, FunctionTransformer) and transformer.func is None
+    ):
+        return _NumericBlock(names, None, None)
+    if isinstance(transformer, StandardScaler):
+        return _NumericBlock(names, transformer.mean_, transformer.scale_)
+    if isinstance(transformer, OneHotEncoder):
+        if getattr(transformer, "sparse_output", getattr(transformer, "sparse", False)):
+            raise UnsupportedPipeline("sparse OneHotEncoder output")
+        if getattr(transformer, "drop_idx_", None) is not None:
+            raise UnsupportedPipeline("OneHotEncoder with drop")
+        if getattr(transformer, "_infrequent_enabled", False):
+            raise UnsupportedPipeline("OneHotEncoder with infrequent categories")
+        if transformer.handle_unknown not in ("ignore", "error"):
+            raise UnsupportedPipeline(f"OneHotEncoder handle_unknown={transformer.handle_unknown}")
+        return _OneHotBlock(names, transformer.categories_, transformer.handle_unknown == "ignore")
+    raise UnsupportedPipeline(f"Unsupported transformer {type(transformer).__name__}")
+
+
+class CompiledPipeline:
+    def __init__(self, blocks: list[_Block], estimator):
+        self.blocks = blocks
+        self.estimator = estimator
+        self.width = sum(block.width for block in blocks)
+
+    def encode(self, columns: dict[str, Sequence]) -> np.ndarray:
+        n_rows = len(next(iter(columns.values())))
+        out = np.zeros((n_rows, self.width), dtype=np.float64)
+        start = 0
+        for block in self.blocks:
+            block.encode(columns, n_rows, out, start)
+            start += block.width
+        return out
+
+    def predict(self, columns: dict[str, Sequence]) -> np.ndarray:
+        return self.estimator.predict(self.encode(columns))
+
+
+def compile_pipeline(model) -> CompiledPipeline | None:
+    """Compiles a fitted Pipeline whose first step is a ColumnTransformer, or returns None."""
+    try:
+        from sklearn.compose import ColumnTransformer
+        from sklearn.pipeline import Pipeline
+
+        if not isinstance(model, Pipeline) or len(model.steps) < 2:
+            raise UnsupportedPipeline(f"{type(model).__name__} is not a multi-step Pipeline")
+        pre = model.steps[0][1]
+        if not isinstance(pre, ColumnTransformer):
+            raise UnsupportedPipeline("first pipeline step is not a ColumnTransformer")
+        if getattr(pre, "sparse_output_", False):
+            raise UnsupportedPipeline("ColumnTransformer produces sparse output")
+        if not hasattr(pre, "feature_names_in_"):
+            raise UnsupportedPipeline("ColumnTransformer was not fitted on named columns")
+
+        feature_names = list(pre.feature_names_in_)
+        blocks = []
+        for name, transformer, selector in pre.transformers_:
+            block = _compile_transformer(transformer, _column_names(selector, feature_names))
+            if block is not None:
+                blocks.append(block)
+
+        estimator = model[1:] if len(model.steps) > 2 else model.steps[-1][1]
+        return CompiledPipeline(blocks, estimator)
+    except UnsupportedPipeline as e:
+        logger.info(f"Using pandas feature encoding: {e}")
+    except Exception as e:
+        logger.warning(f"Could not compile feature encoding, using pandas path: {e}")
+    return None
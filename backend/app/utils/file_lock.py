@@ -0,0 +1,43 @@
+import asyncio
+import os
+from contextlib import asynccontextmanager, contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: single-process development only
+    fcntl = None
+
+
+@contextmanager
+def file_lock(path: str):
+    """
+    Exclusive advisory lock on `path` (created if missing), shared by every
+    process on the host. Blocks until acquired; a no-op where fcntl is unavailable.
+    """
+    if fcntl is None:
+        yield
+        return
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)
+
+
+@asynccontextmanager
+async def async_file_lock(path: str):
+    """`file_lock` for coroutines: waits for the lock in a thread, not on the event loop."""
+    lock = file_lock(path)
+    acquiring = asyncio.ensure_future(asyncio.to_thread(lock.__enter__))
+    try:
+        await asyncio.shield(acquiring)
+    except asyncio.CancelledError:
+        # The thread may still get the lock; release it then instead of never.
+        acquiring.add_done_callback(lambda _: lock.__exit__(None, None, None))
+        raise
+    try:
+        yield
+    finally:
+        lock.__exit__(None, None, None)
@@ -1,22 +1,40 @@
+import hashlib 
 import os 
 from fastapi import UploadFile, HTTPException 
 
 UPLOAD_FOLDER = os.path.join(os.getcwd(), "static", "uploads") 
 ALLOWED_EXTENSIONS = {"png", "jpg", "jpeg"} 
 
-os.makedirs(UPLOAD_FOLDER, exist_ok=True) 
-
 def allowed_file(filename: str) -> bool: 
     return (
         "." in filename
         and filename.rsplit(".", 1)[1].lower() in ALLOWED_EXTENSIONS 
     )
 
-async def save_upload_file(upload_file: UploadFile) -> str: 
-    if not allowed_file(upload_file.filename):
+async def read_upload_file(upload_file: UploadFile) -> bytes: 
+    """Validates an upload and returns its raw bytes without touching the disk."""
+    if not upload_file.filename or not allowed_file(upload_file.filename):
         raise HTTPException(status_code=400, detail="Invalid file type")
 
-    destination = os.path.join(UPLOAD_FOLDER, upload_file.filename) 
-    with open(destination, "wb") as f:
-        f.write(await upload_file.read()) 
-    return destination
\ No newline at end of file
+    data = await upload_file.read() 
+    if not data: 
+        raise HTTPException(status_code=400, detail="Uploaded file is empty")
+    return data 
+
+def persist_upload(data: bytes, filename: str) -> str: 
+    """
+    Stores upload bytes under a content-addressed name (sha256 of the bytes),
+    so identical uploads share one file and concurrent uploads with the same
+    filename never overwrite each other.
+    """
+    ext = filename.rsplit(".", 1)[1].lower() if "." in filename else "bin" 
+    digest = hashlib.sha256(data).hexdigest() 
+    os.makedirs(UPLOAD_FOLDER, exist_ok=True) 
+
+    destination = os.path.join(UPLOAD_FOLDER, f"{digest}.{ext}") 
+    if not os.path.exists(destination): 
+        tmp_path = f"{destination}.{os.getpid()}.tmp" 
+        with open(tmp_path, "wb") as f:
+            f.write(data) 
+        os.replace(tmp_path, destination) 
+    return destination 
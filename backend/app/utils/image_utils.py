@@ -1,8 +1,39 @@
-import albumentations as A 
-from albumentations.pytorch.transforms import ToTensorV2 
+import io
+from functools import lru_cache
 
-def valid_transform(): 
+import albumentations as A
+import numpy as np
+from albumentations.pytorch.transforms import ToTensorV2
+from PIL import Image
+
+def valid_transform():
     return A.Compose([
         A.Resize(224, 224),
         ToTensorV2()
-    ])
\ No newline at end of file
+    ])
+
+@lru_cache(maxsize=None)
+def resize_transform(width: int, height: int) -> A.Compose:
+    """Same resize as `valid_transform`, built once and kept as an HWC uint8 array."""
+    return A.Compose([A.Resize(height, width)])
+
+def decode_resized(data: bytes, size: tuple[int, int]) -> np.ndarray:
+    """
+    Decodes image bytes straight to an RGB uint8 array of `size` (width, height).
+
+    JPEGs are decoded in draft mode, which lets libjpeg scale by 1/2 to 1/8
+    during decoding while staying at least `size`, and the remaining resize
+    happens on the PIL image. A 12 MP photo therefore never exists as a
+    full-resolution array.
+    """
+    image = Image.open(io.BytesIO(data))
+    image.draft("RGB", size)
+    image = image.convert("RGB")
+    if image.size != size:
+        image = image.resize(size, Image.Resampling.BILINEAR)
+    return np.array(image)
+
+def decode_full(data: bytes, size: tuple[int, int]) -> np.ndarray:
+    """Full-resolution decode followed by the albumentations resize (the original path)."""
+    image = np.array(Image.open(io.BytesIO(data)).convert("RGB"))
+    return resize_transform(*size)(image=image)["image"]
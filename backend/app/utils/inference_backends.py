@@ -0,0 +1,80 @@
+"""
+Interchangeable CPU inference backends for image classifiers.
+
+Every backend is called with a float32 batch tensor (N, C, H, W) and returns
+the logits as a NumPy array, so services can switch between them through
+configuration:
+
+- `TorchBackend`: the eager PyTorch module (fp32, or int8 after
+  `quantize_int8`).
+- `OnnxBackend`: an exported ONNX graph run by ONNX Runtime. onnxruntime is
+  an optional dependency and only imported when this backend is used.
+"""
+import logging
+import os
+
+import numpy as np
+import torch
+
+logger = logging.getLogger(__name__)
+
+
+class TorchBackend:
+    def __init__(self, name: str, module: torch.nn.Module, device: torch.device):
+        self.name = name
+        self.module = module
+        self.device = device
+
+    def __call__(self, batch: torch.Tensor) -> np.ndarray:
+        with torch.inference_mode():
+            logits = self.module(batch.to(self.device, non_blocking=True))
+        return logits.float().cpu().numpy()
+
+
+class OnnxBackend:
+    name = "onnx"
+
+    def __init__(self, path: str, threads: int = 0):
+        try:
+            import onnxruntime as ort
+        except ImportError as e:
+            raise RuntimeError("onnxruntime is not installed (pip install onnxruntime)") from e
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if threads > 0:
+            options.intra_op_num_threads = threads
+        self.session = ort.InferenceSession(path, options, providers=["CPUExecutionProvider"])
+        self.input_name = self.session.get_inputs()[0].name
+        logger.info(f"ONNX Runtime session ready for {os.path.basename(path)}")
+
+    def __call__(self, batch: torch.Tensor) -> np.ndarray:
+        inputs = np.ascontiguousarray(batch.numpy(), dtype=np.float32)
+        return self.session.run(None, {self.input_name: inputs})[0]
+
+
+def quantize_int8(module: torch.nn.Module) -> torch.nn.Module:
+    """
+    Dynamic int8 quantization of the Linear layers, which hold nearly all
+    of a ViT's weights and FLOPs. Activations are quantized on the fly, so
+    no calibration data is needed. CPU only. Converts `module` in place to
+    avoid holding a second fp32 copy.
+    """
+    return torch.ao.quantization.quantize_dynamic(module.cpu(), {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+
+
+def export_onnx(module: torch.nn.Module, path: str, input_shape: tuple[int, ...], opset: int = 17):
+    """Exports `module` with a dynamic batch dimension (input "input", output "logits")."""
+    module = module.cpu().eval()
+    dummy = torch.zeros((1, *input_shape), dtype=torch.float32)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    torch.onnx.export(
+        module,
+        dummy,
+        path,
+        input_names=["input"],
+        output_names=["logits"],
+        dynamic_axes={"input": {0: "batch"}, "logits": {0: "batch"}},
+        opset_version=opset,
+    )
+    logger.info(f"Exported ONNX model to {path}")
@@ -0,0 +1,156 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Callable
+
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _call_timed(fn: Callable, args: tuple, submitted_at: float):
+    # Top-level so it can be pickled into a process pool worker.
+    started_at = time.time()
+    result = fn(*args)
+    return result, (started_at - submitted_at) * 1000, (time.time() - started_at) * 1000
+
+
+class StageTiming:
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.total_wait_ms = 0.0
+
+    def record(self, run_ms: float, wait_ms: float = 0.0):
+        self.count += 1
+        self.total_ms += run_ms
+        self.max_ms = max(self.max_ms, run_ms)
+        self.total_wait_ms += wait_ms
+
+    def snapshot(self) -> dict:
+        count = self.count or 1
+        return {
+            "count": self.count,
+            "avg_ms": self.total_ms / count,
+            "max_ms": self.max_ms,
+            "avg_wait_ms": self.total_wait_ms / count,
+        }
+
+
+class InferencePool:
+    """
+    Bounded executor for CPU-heavy model work (image decoding, forward passes).
+
+    Requests enter through `admission()`, which rejects with 429 once
+    `max_workers + max_pending` requests are already in flight, so a burst
+    of uploads cannot pile up unbounded work or starve the event loop.
+    Blocking calls are then dispatched with `run()`. Time spent in each named
+    stage is recorded and exposed on the metrics endpoint.
+    """
+
+    def __init__(self, kind: str = "thread", max_workers: int = 2, max_pending: int = 16, name: str = "inference"):
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unknown inference executor kind: {kind}")
+        self.name = name
+        self.kind = kind
+        self.max_workers = max(1, max_workers)
+        self.max_in_flight = self.max_workers + max(0, max_pending)
+        self.in_flight = 0
+        self.rejected = 0
+        self._stages: dict[str, StageTiming] = {}
+        self._lock = threading.Lock()
+        self._executor: Executor | None = None
+
+    def _get_executor(self) -> Executor:
+        # Created lazily so importing this module (e.g. inside a process pool
+        # worker) never spawns an executor of its own.
+        if self._executor is None:
+            if self.kind == "process":
+                initializer, initargs = None, ()
+                if settings.MODEL_WARMUP:
+                    from app.utils.model_registry import model_registry, warm_up_worker
+
+                    names = [n.strip() for n in settings.MODEL_WARMUP_MODELS.split(",") if n.strip()]
+                    initializer, initargs = warm_up_worker, (model_registry.loader_modules(), names)
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=initializer,
+                    initargs=initargs,
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix=self.name
+                )
+            logger.info(f"Started {self.kind} {self.name} pool with {self.max_workers} workers")
+        return self._executor
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            logger.info(f"{self.name.capitalize()} pool shut down")
+
+    @asynccontextmanager
+    async def admission(self):
+        if self.in_flight >= self.max_in_flight:
+            self.rejected += 1
+            logger.warning(f"{self.name.capitalize()} pool saturated ({self.in_flight} in flight), rejecting request")
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=f"{self.name.capitalize()} service is busy, please retry shortly",
+                headers={"Retry-After": "1"},
+            )
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+
+    async def run(self, stage: str, fn: Callable, *args: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        result, wait_ms, run_ms = await loop.run_in_executor(
+            self._get_executor(), _call_timed, fn, args, time.time()
+        )
+        self.record(stage, run_ms, wait_ms)
+        return result
+
+    def record(self, stage: str, run_ms: float, wait_ms: float = 0.0):
+        with self._lock:
+            self._stages.setdefault(stage, StageTiming()).record(run_ms, wait_ms)
+
+    @contextmanager
+    def timed(self, stage: str):
+        """Times a sub-stage running inside a worker (only visible for the thread executor)."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, (time.perf_counter() - started) * 1000)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            stages = {name: timing.snapshot() for name, timing in self._stages.items()}
+        return {
+            "kind": self.kind,
+            "workers": self.max_workers,
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "rejected": self.rejected,
+            "stages": stages,
+        }
+
+
+inference_pool = InferencePool(
+    kind=settings.INFERENCE_EXECUTOR,
+    max_workers=settings.INFERENCE_WORKERS or os.cpu_count() or 1,
+    max_pending=settings.INFERENCE_MAX_PENDING,
+)
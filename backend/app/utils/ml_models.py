@@ -1,10 +1,15 @@
+import os 
 import joblib 
 
-def load_model(MODEL_PATH):
+def load_model(MODEL_PATH, mmap_mode=None):
     try:
-        model = joblib.load(MODEL_PATH)
+        model = joblib.load(MODEL_PATH, mmap_mode=mmap_mode)
         return model 
     except Exception as e:
         print(f"Failed to load model: {e!r} (type: {type(e)})")
-        return None 
-    
+        return None
+
+def model_version(MODEL_PATH) -> str:
+    """Cheap identifier for a model file, used to namespace cached results."""
+    stat = os.stat(MODEL_PATH)
+    return f"{os.path.basename(MODEL_PATH)}:{stat.st_size}:{int(stat.st_mtime)}"
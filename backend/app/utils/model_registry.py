@@ -0,0 +1,271 @@
+import asyncio
+import gc
+import importlib
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable
+
+import psutil
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+from app.utils.ml_models import model_version
+
+logger = logging.getLogger(__name__)
+
+
+def _rss_bytes() -> int:
+    return psutil.Process().memory_info().rss
+
+
+def models_in_worker_processes() -> bool:
+    """With INFERENCE_EXECUTOR=process, models are used (and loaded) by the pool's child processes."""
+    return settings.INFERENCE_EXECUTOR == "process"
+
+
+def _tensor_bytes(model: Any) -> int | None:
+    """Size of parameters and buffers for torch modules (YOLO models are modules too)."""
+    model = getattr(model, "module", model)
+    parameters = getattr(model, "parameters", None)
+    buffers = getattr(model, "buffers", None)
+    if not callable(parameters) or not callable(buffers):
+        return None
+    try:
+        tensors = list(parameters()) + list(buffers())
+        return sum(t.numel() * t.element_size() for t in tensors)
+    except Exception:
+        return None
+
+
+class LazyModel:
+    """
+    A model that is loaded on first use instead of at import time.
+
+    `get()` loads it once (thread-safe) and returns the cached object;
+    concurrent callers wait for the same load. A failed load is remembered
+    and only retried after `retry_seconds`, so a missing weights file does
+    not turn every request into another load attempt.
+    """
+
+    retry_seconds = 30.0
+
+    def __init__(self, name: str, path: str, loader: Callable[[str], Any]):
+        self.name = name
+        self.path = path
+        self.loader = loader
+        self.state = "pending"
+        self.error: str | None = None
+        self.load_seconds: float | None = None
+        self.loaded_pid: int | None = None
+        self.rss_delta_bytes: int | None = None
+        self.weights_bytes: int | None = None
+        self._model: Any = None
+        self._version: str | None = None
+        self._failed_at = 0.0
+        self._lock = threading.Lock()
+        # With the process executor: this model's state as reported by a pool child.
+        self.worker_state: str | None = None
+        self.worker_error: str | None = None
+
+    @property
+    def ready(self) -> bool:
+        if models_in_worker_processes():
+            return self.worker_state == "ready"
+        return self.state == "ready"
+
+    @property
+    def version(self) -> str:
+        """Identifier of the weights file, used to namespace cached results."""
+        if self._version is None:
+            if not os.path.exists(self.path):
+                return "missing"
+            self._version = model_version(self.path)
+        return self._version
+
+    def get(self) -> Any:
+        if self.state == "ready":
+            return self._model
+        with self._lock:
+            if self.state == "ready":
+                return self._model
+            if self.state == "failed" and time.monotonic() - self._failed_at < self.retry_seconds:
+                raise RuntimeError(f"Model '{self.name}' is unavailable: {self.error}")
+            self._load()
+            return self._model
+
+    def _load(self):
+        self.state = "loading"
+        started = time.perf_counter()
+        rss_before = _rss_bytes()
+        try:
+            if not os.path.exists(self.path):
+                raise FileNotFoundError(f"model file missing: {self.path}")
+            model = self.loader(self.path)
+        except Exception as e:
+            self.state = "failed"
+            self.error = str(e)
+            self._failed_at = time.monotonic()
+            logger.error(f"Failed to load model '{self.name}': {e}", exc_info=True)
+            raise RuntimeError(f"Model '{self.name}' is unavailable: {e}") from e
+
+        self._model = model
+        self.error = None
+        self.load_seconds = time.perf_counter() - started
+        # Approximate: other threads allocating during the load are counted too.
+        self.rss_delta_bytes = _rss_bytes() - rss_before
+        self.weights_bytes = _tensor_bytes(model)
+        self.loaded_pid = os.getpid()
+        self.state = "ready"
+        logger.info(f"Loaded model '{self.name}' from {self.path} in {self.load_seconds:.2f}s")
+
+    async def ensure(self):
+        """Loads the model off the event loop if needed; 503 if it cannot be loaded."""
+        if self.state == "ready" or models_in_worker_processes():
+            # Process pool children load their own copy on first use; one here would never run.
+            return
+        try:
+            await asyncio.to_thread(self.get)
+        except RuntimeError as e:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=str(e),
+                headers={"Retry-After": str(int(self.retry_seconds))},
+            )
+
+    def snapshot(self) -> dict:
+        if models_in_worker_processes():
+            return {
+                "state": self.worker_state or "pending",
+                "path": os.path.basename(self.path),
+                "load_seconds": self.load_seconds,
+                "error": self.worker_error,
+            }
+        return {
+            "state": self.state,
+            "path": os.path.basename(self.path),
+            "load_seconds": self.load_seconds,
+            "error": self.error,
+        }
+
+    def memory_snapshot(self) -> dict:
+        return {
+            "state": self.state,
+            "weights_bytes": self.weights_bytes,
+            "rss_delta_bytes": self.rss_delta_bytes,
+            # Loaded by a parent process before fork, so the pages are shared copy-on-write.
+            "inherited": self.loaded_pid is not None and self.loaded_pid != os.getpid(),
+        }
+
+
+class ModelRegistry:
+    """Named LazyModels, warmed up in the background during the app lifespan."""
+
+    def __init__(self):
+        self._models: dict[str, LazyModel] = {}
+
+    def register(self, name: str, path: str, loader: Callable[[str], Any]) -> LazyModel:
+        model = LazyModel(name, path, loader)
+        self._models[name] = model
+        return model
+
+    def __getitem__(self, name: str) -> LazyModel:
+        return self._models[name]
+
+    async def warm_up(self, names: list[str] | None = None):
+        """Loads models one at a time in a worker thread; failures are logged, not raised."""
+        if models_in_worker_processes():
+            await self.probe_workers(names)
+            return
+        for name in names or list(self._models):
+            model = self._models.get(name)
+            if model is None:
+                logger.warning(f"Cannot warm up unknown model '{name}'")
+                continue
+            try:
+                await asyncio.to_thread(model.get)
+            except RuntimeError:
+                pass
+        logger.info("Model warm-up finished")
+
+    async def probe_workers(self, names: list[str] | None = None):
+        """
+        Process executor: loads `names` in an inference worker process and
+        records the states it reports, which is what `ready` then reflects.
+        Every child loads the same files, so one probe stands for all of them.
+        """
+        from app.utils.inference_pool import inference_pool
+
+        try:
+            states = await inference_pool.run("models.warmup", warm_up_worker, self.loader_modules(), names or [])
+        except Exception as e:
+            logger.error(f"Model warm-up in the inference worker processes failed: {e}")
+            for model in self._models.values():
+                model.worker_state, model.worker_error = "failed", str(e)
+            return
+        for name, state in states.items():
+            model = self._models.get(name)
+            if model is not None:
+                model.worker_state, model.worker_error = state["state"], state["error"]
+                model.load_seconds = state["load_seconds"]
+        logger.info(f"Model warm-up in the inference worker processes finished: {self.snapshot()}")
+
+    def preload(self, names: list[str] | None = None):
+        """
+        Loads models synchronously in the current process, meant for a
+        pre-fork server master (see gunicorn.conf.py). Workers forked
+        afterwards share the weight pages copy-on-write; `gc.freeze()` moves
+        everything loaded so far out of the collector's reach so collections
+        in the workers do not touch (and thereby copy) those pages.
+        """
+        if models_in_worker_processes():
+            # Inference children are spawned, not forked, so they could not share these pages.
+            logger.info("Skipping model preload, models are loaded by the inference worker processes")
+            return
+        for name in names or list(self._models):
+            try:
+                self._models[name].get()
+            except (KeyError, RuntimeError) as e:
+                logger.warning(f"Could not preload model '{name}': {e}")
+        gc.collect()
+        gc.freeze()
+        logger.info(f"Preloaded models in pid {os.getpid()}, froze {gc.get_freeze_count()} objects")
+
+    def loader_modules(self) -> list[str]:
+        """Modules that register the models, for importing them in a fresh process."""
+        return sorted({model.loader.__module__ for model in self._models.values()})
+
+    def all_ready(self) -> bool:
+        return all(model.ready for model in self._models.values())
+
+    def snapshot(self) -> dict[str, dict]:
+        return {name: model.snapshot() for name, model in self._models.items()}
+
+    def memory_snapshot(self) -> dict[str, dict]:
+        return {name: model.memory_snapshot() for name, model in self._models.items()}
+
+
+model_registry = ModelRegistry()
+
+
+def warm_up_worker(modules: list[str], names: list[str]) -> dict[str, dict]:
+    """
+    Process pool initializer (and warm-up probe): registers the models in
+    the (spawned) child by importing their modules, then loads `names` (all
+    when empty) so the first request routed to this child does not pay for
+    it. Returns the child's view of the loaded models.
+    """
+    for module in modules:
+        importlib.import_module(module)
+    names = names or list(model_registry._models)
+    for name in names:
+        try:
+            model_registry[name].get()
+        except (KeyError, RuntimeError) as e:
+            logger.warning(f"Could not warm up model '{name}' in pid {os.getpid()}: {e}")
+    return {
+        name: {"state": model.state, "error": model.error, "load_seconds": model.load_seconds}
+        for name, model in model_registry._models.items()
+        if name in names
+    }
@@ -1,44 +0,0 @@
-pest_name = {
-
-'1': "Dolycoris baccarum",
-'2': "Lycorma delicatula",
-'3': "Eurydema dominulus",
-'4': "Pieris rapae",
-'5': "Halyomorpha halys",
-'6': "Spilosoma obliqua",
-'7': "Graphosoma rubrolineata",
-'8': "Luperomorpha suturalis",
-'9': "Leptocorisa acuta",
-'10': "Sesamiya inferens",
-'11': "Cicadella viridis",
-'12': "Callitettix versicolor",
-'13': "Scotinophara lurida",
-'14': "Cletus punctiger",
-'15': "Nezara viridula",
-'16': "Dicladispa armigera",
-'17': "Riptortus pedestris",
-'18': "Maruca testulalis",
-'19': "Chauliops fallax",
-'20': "Chilo supperssalis",
-'21': "Stollia ventralis",
-'22': "Nilaparvata lugens",
-'23': "Diostrombus politus",
-'24': "Phyllotreta striolata",
-'25': "Aulacophora indica",
-'26': "Laodelphax striatellus",
-'27': "Ceroplastes ceriferus",
-'28': "Corythucha marmorata",
-'29': "Dryocosmus kuriphilus",
-'30': "Porthesia taiwana",
-'31': "Chromatomyia horticola",
-'32': "Iscadia inexacta",
-'33': "Plutella xylostella",
-'34': "Empoasca flavescens",
-'35': "Dolerus tritici",
-'36': "Spodoptera litura",
-'37': "Corythucha ciliata",
-'38': "Bemisia tabaci",
-'39': "Ceutorhynchus asper",
-'40': "Strongyllodes variegatus"
-
-}
\ No newline at end of file
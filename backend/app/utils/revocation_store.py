@@ -0,0 +1,183 @@
+import hashlib
+import logging
+import os
+import threading
+import time
+
+from app.utils.file_lock import file_lock
+
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over string keys (no false negatives, no deletes)."""
+
+    def __init__(self, bits: int = 1 << 20, hashes: int = 7):
+        self.bits = max(64, bits)
+        self.hashes = max(1, hashes)
+        self._array = bytearray((self.bits + 7) // 8)
+
+    def _positions(self, key: str):
+        # Double hashing: k positions from two 64-bit halves of one digest.
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.bits
+
+    def add(self, key: str):
+        for position in self._positions(key):
+            self._array[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._array[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class RevocationStore:
+    """
+    Keys (token ids, token families) that are revoked until a given time.
+
+    Lookups go through a Bloom filter first, so the common case, a key that
+    was never revoked, is answered without touching the entry map. Entries
+    are dropped once expired and the filter is rebuilt from the survivors.
+
+    With `path` set, every revocation is also appended to that file as one
+    `<key> <expires_at>` line, so all worker processes of a host share the
+    same revocations. Writers hold an exclusive `flock` on `<path>.lock`
+    while they read what others appended, check and append, which makes
+    `add_if_absent` single-use across processes. The same lock guards the
+    occasional compaction that rewrites the file with only live entries.
+    `contains` reads new lines without the lock, at most every
+    `sync_interval_seconds`.
+    """
+
+    prune_interval_seconds = 60.0
+    sync_interval_seconds = 1.0
+    # Rewrite the file once it holds this many lines and more than twice the live entries.
+    compact_min_lines = 10000
+
+    def __init__(self, path: str | None = None, bloom_bits: int = 1 << 20):
+        self.path = path or None
+        self.bloom_bits = bloom_bits
+        self._entries: dict[str, float] = {}
+        self._bloom = BloomFilter(bloom_bits)
+        self._lock = threading.Lock()
+        self._offset = 0
+        self._lines = 0
+        self._inode: int | None = None
+        self._pruned_at = time.time()
+        self._synced_at = 0.0
+        if self.path:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with self._lock, self._file_lock():
+                self._read_new_lines()
+            logger.info(f"Loaded {len(self._entries)} token revocations from {self.path}")
+
+    def _file_lock(self):
+        # A separate lock file, since compaction replaces the data file's inode.
+        return file_lock(f"{self.path}.lock")
+
+    def _remember(self, key: str, expires_at: float):
+        if expires_at > self._entries.get(key, 0.0):
+            self._entries[key] = expires_at
+            self._bloom.add(key)
+
+    def _read_new_lines(self):
+        """Picks up revocations appended by other processes (caller holds the lock)."""
+        self._synced_at = time.time()
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return
+        if stat.st_ino != self._inode:
+            # Compacted and replaced by another process: read it from the start.
+            self._inode, self._offset, self._lines = stat.st_ino, 0, 0
+        if stat.st_size <= self._offset:
+            return
+        with open(self.path, "rb") as f:
+            f.seek(self._offset)
+            chunk = f.read()
+        # Only consume complete lines; a partial line is read again next time.
+        end = chunk.rfind(b"\n") + 1
+        self._offset += end
+        for line in chunk[:end].splitlines():
+            self._lines += 1
+            try:
+                key, expires_at = line.decode().rsplit(" ", 1)
+                self._remember(key, float(expires_at))
+            except ValueError:
+                logger.warning(f"Skipping malformed revocation line in {self.path}: {line[:80]!r}")
+
+    def _append(self, key: str, expires_at: float):
+        line = f"{key} {expires_at:.0f}\n".encode()
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+        try:
+            os.write(fd, line)
+        finally:
+            os.close(fd)
+        # Our own line: skip it on the next read instead of parsing it again.
+        stat = os.stat(self.path)
+        if stat.st_ino == self._inode and stat.st_size == self._offset + len(line):
+            self._offset, self._lines = stat.st_size, self._lines + 1
+
+    def _maybe_compact(self):
+        """Rewrites the file with only the live entries (caller holds both locks)."""
+        if self._lines < self.compact_min_lines or self._lines < 2 * len(self._entries):
+            return
+        now = time.time()
+        self._rebuild({key: expires_at for key, expires_at in self._entries.items() if expires_at > now})
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.writelines(f"{key} {expires_at:.0f}\n" for key, expires_at in self._entries.items())
+        os.replace(tmp_path, self.path)
+        stat = os.stat(self.path)
+        self._inode, self._offset, self._lines = stat.st_ino, stat.st_size, len(self._entries)
+        logger.info(f"Compacted {self.path} to {len(self._entries)} token revocations")
+
+    def _rebuild(self, entries: dict[str, float]):
+        bloom = BloomFilter(self.bloom_bits)
+        for key in entries:
+            bloom.add(key)
+        self._entries, self._bloom = entries, bloom
+
+    def _maybe_prune(self):
+        now = time.time()
+        if now - self._pruned_at < self.prune_interval_seconds:
+            return
+        self._pruned_at = now
+        self._rebuild({key: expires_at for key, expires_at in self._entries.items() if expires_at > now})
+
+    def _is_revoked(self, key: str) -> bool:
+        return key in self._bloom and self._entries.get(key, 0.0) > time.time()
+
+    def contains(self, key: str) -> bool:
+        with self._lock:
+            if self.path and time.time() - self._synced_at >= self.sync_interval_seconds:
+                self._read_new_lines()
+            return self._is_revoked(key)
+
+    def add(self, key: str, expires_at: float):
+        self.add_if_absent(key, expires_at, check=False)
+
+    def add_if_absent(self, key: str, expires_at: float, check: bool = True) -> bool:
+        """Revokes `key`; False (and nothing written) if it was already revoked by any process."""
+        if not self.path:
+            with self._lock:
+                return self._write(key, expires_at, check)
+        with self._lock, self._file_lock():
+            self._read_new_lines()
+            written = self._write(key, expires_at, check)
+            self._maybe_compact()
+            return written
+
+    def _write(self, key: str, expires_at: float, check: bool) -> bool:
+        if check and self._is_revoked(key):
+            return False
+        self._maybe_prune()
+        self._remember(key, expires_at)
+        if self.path:
+            self._append(key, expires_at)
+        return True
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,31 @@
+import asyncio
+from typing import Any, Awaitable, Callable
+
+
+class SingleFlight:
+    """
+    Collapses concurrent calls that share a key into one execution.
+
+    The first caller for a key starts `fn` as its own task; every caller that
+    arrives while it is running awaits the same task. The work is shielded, so
+    a caller disconnecting does not cancel it for the others.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.shared = 0
+        self._inflight: dict[str, asyncio.Task] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._inflight.get(key)
+        if task is None:
+            self.calls += 1
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.shared += 1
+        return await asyncio.shield(task)
+
+    def snapshot(self) -> dict:
+        return {"calls": self.calls, "shared": self.shared, "in_flight": len(self._inflight)}
@@ -0,0 +1,126 @@
+"""
+Maps Visual Crossing timeline JSON straight to the `WeatherResponse` wire format.
+
+Building ~360 `Hour` models per request (plus `Day`, `Condition`, `Astro`)
+and then dumping them again dominated CPU on the weather route, so the
+mapping here works on plain dicts in the same key order and with the same
+aliases as `WeatherResponse.model_dump(by_alias=True)`, and serializes with
+pydantic-core's JSON encoder.
+
+`sections` selects which parts are filled in ("current", "day", "astro",
+"hour"); unselected parts are returned as null.
+"""
+from typing import Any
+
+import pydantic_core
+
+MPH_TO_KPH = 3.6
+
+FORECAST_SECTIONS = ("day", "astro", "hour")
+ALL_SECTIONS = frozenset(("current",) + FORECAST_SECTIONS)
+
+
+def _float(value: Any) -> float | None:
+    return None if value is None else float(value)
+
+
+def _wind_kph(src: dict) -> float:
+    return float(src.get("windspeed") or 0) * MPH_TO_KPH
+
+
+def _fahrenheit(celsius: Any) -> float | None:
+    return None if celsius is None else celsius * 9 / 5 + 32
+
+
+def _condition(src: dict) -> dict:
+    return {"text": src.get("conditions"), "icon": src.get("icon")}
+
+
+def map_current(src: dict) -> dict:
+    temp = src.get("temp")
+    feelslike = src.get("feelslike")
+    return {
+        "last_updated_epoch": src.get("datetimeEpoch"),
+        "last_updated": src.get("datetime"),
+        "temp_c": _float(temp),
+        "feelslike_c": _float(feelslike),
+        "condition": _condition(src),
+        "wind_kph": _wind_kph(src),
+        "wind_dir": _float(src.get("winddir")),
+        "humidity": _float(src.get("humidity")),
+        "precip_mm": _float(src.get("precip")),
+        "uv": _float(src.get("uvindex")),
+        "temp_f": _fahrenheit(temp),
+        "feelslike_f": _fahrenheit(feelslike),
+    }
+
+
+def map_hour(src: dict) -> dict:
+    return {
+        "time_epoch": src.get("datetimeEpoch"),
+        "time": src.get("datetime"),
+        "temp_c": _float(src.get("temp")),
+        "is_day": 1 if (src.get("icon") or "").endswith("-day") else 0,
+        "condition": _condition(src),
+        "wind_kph": _wind_kph(src),
+        "humidity": _float(src.get("humidity")),
+        "precip_mm": _float(src.get("precip")),
+        "feelslike_c": _float(src.get("feelslike")),
+        "uv": _float(src.get("uvindex")),
+    }
+
+
+def map_day(src: dict, sections: frozenset[str] = ALL_SECTIONS) -> dict:
+    day = astro = hour = None
+    if "day" in sections:
+        day = {
+            "maxtemp_c": _float(src.get("tempmax")),
+            "mintemp_c": _float(src.get("tempmin")),
+            "avgtemp_c": _float(src.get("temp")),
+            "condition": _condition(src),
+            "daily_chance_of_rain": _float(src.get("precipprob")),
+            "totalprecip_mm": _float(src.get("precip")),
+            "maxwind_kph": _wind_kph(src),
+            "avghumidity": _float(src.get("humidity")),
+            "uv": _float(src.get("uvindex")),
+        }
+    if "astro" in sections:
+        astro = {"sunrise": src.get("sunrise"), "sunset": src.get("sunset")}
+    if "hour" in sections:
+        hour = [map_hour(h) for h in src.get("hours") or []]
+    return {
+        "date": src.get("datetime"),
+        "date_epoch": src.get("datetimeEpoch"),
+        "day": day,
+        "astro": astro,
+        "hour": hour,
+    }
+
+
+def map_weather(
+    data: dict,
+    location: str,
+    sections: frozenset[str] = ALL_SECTIONS,
+    days: int | None = None,
+) -> dict:
+    """Returns the `WeatherResponse` payload (by alias) for a Visual Crossing response."""
+    current = None
+    if "current" in sections:
+        current = map_current(data.get("currentConditions") or {})
+
+    forecast = None
+    if sections & set(FORECAST_SECTIONS):
+        day_data = data.get("days") or []
+        if days is not None:
+            day_data = day_data[:days]
+        forecast = {"forecastday": [map_day(day, sections) for day in day_data]}
+
+    return {
+        "resolvedAddress": data.get("resolvedAddress", location),
+        "current": current,
+        "forecast": forecast,
+    }
+
+
+def serialize(payload: dict) -> bytes:
+    return pydantic_core.to_json(payload)
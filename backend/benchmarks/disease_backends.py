@@ -0,0 +1,104 @@
+"""
+Regression harness for the disease detector backends.
+
+Runs a fixed set of images through the original path (best.pt on a
+1280x720 resize, as the service did before backends were configurable) and
+through each backend with the single-resize preprocessing at --imgsz
+(default: what the service would use for that backend). It
+reports per-image differences in detection counts and the median latency.
+Exits with status 1 when more than --max-mismatch images disagree, so it
+can gate a backend or imgsz change.
+
+Run from the backend directory (exports come from `python export_models.py disease`):
+
+    python -m benchmarks.disease_backends --images path/to/field_images --backends torch,onnx,openvino
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import cv2
+import supervision as sv
+
+from app.services.disease_detect_service import DETECT_FRAME, MODEL_PATH, backend_path, count_detections, detection_imgsz
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp")
+
+
+def load_images(images_dir: str) -> dict[str, "cv2.Mat"]:
+    images = {}
+    for name in sorted(os.listdir(images_dir)):
+        if name.lower().endswith(IMAGE_EXTENSIONS):
+            image = cv2.imread(os.path.join(images_dir, name))
+            if image is not None:
+                images[name] = image
+    if not images:
+        raise SystemExit(f"No images found in {images_dir}")
+    return images
+
+
+def legacy_counts(model, image) -> dict[str, int]:
+    results = model.predict(cv2.resize(image, DETECT_FRAME), verbose=False)[0]
+    counts: dict[str, int] = {}
+    for cid in sv.Detections.from_ultralytics(results).class_id:
+        name = results.names[cid]
+        counts[name] = counts.get(name, 0) + 1
+    return counts
+
+
+def timed(fn, *args) -> tuple[dict, float]:
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, (time.perf_counter() - started) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--images", required=True, help="directory of test images")
+    parser.add_argument("--backends", default="torch,onnx,openvino")
+    parser.add_argument("--imgsz", type=int, default=None)
+    parser.add_argument("--max-mismatch", type=int, default=0, help="images allowed to differ per backend")
+    args = parser.parse_args()
+
+    from ultralytics import YOLO
+
+    images = load_images(args.images)
+    reference_model = YOLO(MODEL_PATH, task="detect")
+    legacy_counts(reference_model, next(iter(images.values())))  # warm-up
+
+    reference, reference_ms = {}, []
+    for name, image in images.items():
+        reference[name], ms = timed(legacy_counts, reference_model, image)
+        reference_ms.append(ms)
+    print(f"{len(images)} images; original path: {statistics.median(reference_ms):.1f} ms/image (median)")
+
+    failed = False
+    for backend in args.backends.split(","):
+        path = backend_path(backend)
+        if not os.path.exists(path):
+            print(f"\n[{backend}] skipped: {path} not found")
+            continue
+        model = reference_model if backend == "torch" else YOLO(path, task="detect")
+        imgsz = args.imgsz or detection_imgsz(model, backend)
+        count_detections(model, next(iter(images.values())), imgsz)  # warm-up
+
+        mismatches, latencies = [], []
+        for name, image in images.items():
+            counts, ms = timed(count_detections, model, image, imgsz)
+            latencies.append(ms)
+            if counts != reference[name]:
+                mismatches.append((name, reference[name], counts))
+
+        print(f"\n[{backend} @ {imgsz}] {statistics.median(latencies):.1f} ms/image (median), "
+              f"{len(images) - len(mismatches)}/{len(images)} images with identical counts")
+        for name, expected, actual in mismatches:
+            print(f"  {name}: expected {expected}, got {actual}")
+        failed = failed or len(mismatches) > args.max_mismatch
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Concurrent logins with bcrypt on the event loop vs. on the password pool.
+
+Runs N logins concurrently (password verification only, no database) and
+reports throughput, p50/p95 login latency, and how late a 10 ms ticker
+task on the same loop ran, which shows how long other requests would have
+been stalled.
+
+    BCRYPT_ROUNDS=12 python -m benchmarks.login [--logins 32]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from app.core.config import settings
+from app.core.security import password_pool, pwd_context, verify_and_update_password
+
+TICK = 0.01
+
+
+def percentile(values: list[float], q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+async def ticker(lags: list[float], stop: asyncio.Event):
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(TICK)
+        lags.append((time.perf_counter() - started - TICK) * 1000)
+
+
+async def run(label: str, login, logins: int):
+    lags: list[float] = []
+    stop = asyncio.Event()
+    tick_task = asyncio.create_task(ticker(lags, stop))
+    await asyncio.sleep(TICK * 2)
+
+    async def timed_login():
+        started = time.perf_counter()
+        await login()
+        return (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    latencies = await asyncio.gather(*(timed_login() for _ in range(logins)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await tick_task
+
+    print(
+        f"{label:<10} {logins / elapsed:7.1f} logins/s  "
+        f"p50 {statistics.median(latencies):7.0f} ms  p95 {percentile(latencies, 0.95):7.0f} ms  "
+        f"max loop lag {max(lags or [0]):7.0f} ms"
+    )
+
+
+async def main(logins: int):
+    password = "correct horse battery staple"
+    hashed = pwd_context.hash(password)
+
+    async def inline_login():
+        # The original behaviour: a blocking verify inside the coroutine.
+        assert pwd_context.verify(password, hashed)
+
+    async def pooled_login():
+        valid, _ = await verify_and_update_password(password, hashed)
+        assert valid
+
+    print(f"{logins} concurrent logins, bcrypt rounds={settings.BCRYPT_ROUNDS}, pool workers={password_pool.max_workers}")
+    await run("inline", inline_login, logins)
+    await run("pool", pooled_login, logins)
+    password_pool.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--logins", type=int, default=32)
+    args = parser.parse_args()
+    asyncio.run(main(args.logins))
@@ -0,0 +1,122 @@
+"""
+Parity check and micro-benchmark for the compiled market feature encoder.
+
+Uses ml_models/market_price_model.pkl when present; otherwise fits small
+pipelines with the same structure as the training notebooks
+(StandardScaler on numeric columns + dense OneHotEncoder on categories).
+Predictions of the compiled path must match the pandas pipeline path.
+
+Run from the backend directory:
+
+    python -m benchmarks.market_encoding [--rows 1000] [--repeat 200]
+"""
+import argparse
+import os
+import random
+import timeit
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+from sklearn.compose import ColumnTransformer
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.linear_model import Ridge
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import OneHotEncoder, StandardScaler
+from sklearn.tree import DecisionTreeRegressor
+
+from app.utils.feature_encoding import compile_pipeline
+from app.utils.ml_models import load_model
+
+NUMERIC = ["year", "month", "day_of_week", "day_of_month"]
+CATEGORICAL = ["State", "District", "Commodity", "Variety", "Grade"]
+MODEL_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "ml_models", "market_price_model.pkl")
+
+
+def random_columns(n: int, rng: random.Random, vocab: dict[str, list[str]], unknown_rate: float = 0.05) -> dict:
+    dates = [date(2023, 1, 1) + timedelta(days=rng.randint(0, 900)) for _ in range(n)]
+    columns = {
+        "year": [d.year for d in dates],
+        "month": [d.month for d in dates],
+        "day_of_week": [d.weekday() for d in dates],
+        "day_of_month": [d.day for d in dates],
+    }
+    for name in CATEGORICAL:
+        columns[name] = [
+            "__unknown__" if rng.random() < unknown_rate else rng.choice(vocab[name])
+            for _ in range(n)
+        ]
+    return columns
+
+
+def synthetic_models(rng: random.Random) -> tuple[dict, dict[str, list[str]]]:
+    vocab = {name: [f"{name}-{i}" for i in range(rng.randint(3, 40))] for name in CATEGORICAL}
+    train = pd.DataFrame(random_columns(3000, rng, vocab, unknown_rate=0))
+    target = np.asarray([rng.uniform(500, 9000) for _ in range(len(train))])
+
+    def pipeline(estimator):
+        pre = ColumnTransformer([
+            ("num", StandardScaler(), NUMERIC),
+            ("cat", OneHotEncoder(handle_unknown="ignore", sparse_output=False), CATEGORICAL),
+        ])
+        return Pipeline([("pre", pre), ("reg", estimator)]).fit(train, target)
+
+    models = {
+        "Ridge": pipeline(Ridge(alpha=1.0)),
+        "DecisionTree": pipeline(DecisionTreeRegressor(max_depth=10, random_state=42)),
+        "RandomForest": pipeline(RandomForestRegressor(n_estimators=50, random_state=42)),
+    }
+    return models, vocab
+
+
+def vocab_from(model) -> dict[str, list[str]]:
+    compiled = compile_pipeline(model)
+    vocab = {name: ["__unknown__"] for name in CATEGORICAL}
+    for block in compiled.blocks:
+        for name, cats in zip(getattr(block, "names", []), getattr(block, "vocab", [])):
+            vocab[name] = list(cats)
+    return vocab
+
+
+def check(name: str, model, vocab: dict, rows: int, repeat: int, rng: random.Random):
+    compiled = compile_pipeline(model)
+    if compiled is None:
+        print(f"{name}: pipeline cannot be compiled, nothing to compare")
+        return
+
+    columns = random_columns(rows, rng, vocab)
+    expected = model.predict(pd.DataFrame(columns))
+    actual = compiled.predict(columns)
+    max_diff = float(np.max(np.abs(expected - actual)))
+    assert np.allclose(actual, expected, rtol=1e-9, atol=1e-9), f"{name}: max abs diff {max_diff}"
+    print(f"{name}: parity OK on {rows} rows (exact={np.array_equal(actual, expected)}, max abs diff {max_diff:.3g})")
+
+    one_row = {k: v[:1] for k, v in columns.items()}
+    for label, cols in (("1 row", one_row), (f"{rows} rows", columns)):
+        number = repeat if label == "1 row" else max(1, repeat // 20)
+        t_pandas = timeit.timeit(lambda: model.predict(pd.DataFrame(cols)), number=number) / number
+        t_compiled = timeit.timeit(lambda: compiled.predict(cols), number=number) / number
+        print(f"  {label:>10s}: pandas {t_pandas * 1000:8.3f} ms   compiled {t_compiled * 1000:8.3f} ms   "
+              f"({t_pandas / t_compiled:4.1f}x)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+    rng = random.Random(0)
+
+    model = load_model(MODEL_PATH) if os.path.exists(MODEL_PATH) else None
+    if model is not None:
+        check("market_price_model.pkl", model, vocab_from(model), args.rows, args.repeat, rng)
+        return
+
+    print(f"{MODEL_PATH} not found, using synthetic pipelines")
+    models, vocab = synthetic_models(rng)
+    for name, model in models.items():
+        check(name, model, vocab, args.rows, args.repeat, rng)
+
+
+if __name__ == "__main__":
+    main()
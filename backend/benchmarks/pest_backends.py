@@ -0,0 +1,92 @@
+"""
+Accuracy parity and latency/throughput of the pest classifier backends.
+
+Each backend is compared with the fp32 PyTorch model on the same inputs
+(top-1 agreement and max logit difference), then timed per batch size.
+Uses the images in --images when given (the parity numbers are only
+meaningful on real images), otherwise random tensors.
+
+Run from the backend directory (ml_models/pest_model.pth must exist; the
+onnx backend also needs onnxruntime and `python export_models.py pest`):
+
+    python -m benchmarks.pest_backends --images path/to/pest_images --backends torch,int8,onnx
+"""
+import argparse
+import os
+import statistics
+import time
+
+import numpy as np
+import torch
+
+from app.services.pest_detect_service import _preprocess, backend_path, load_backend, samples_to_batch
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp")
+
+
+def load_inputs(images_dir: str | None, count: int) -> torch.Tensor:
+    if not images_dir:
+        return torch.rand((count, 3, 224, 224))
+    samples = []
+    for root, _, files in os.walk(images_dir):
+        for name in sorted(files):
+            if name.lower().endswith(IMAGE_EXTENSIONS):
+                with open(os.path.join(root, name), "rb") as f:
+                    samples.append(_preprocess(f.read()))
+    if not samples:
+        raise SystemExit(f"No images found in {images_dir}")
+    return samples_to_batch(samples)
+
+
+def run_all(backend, inputs: torch.Tensor, batch_size: int) -> np.ndarray:
+    return np.concatenate([backend(inputs[i:i + batch_size]) for i in range(0, len(inputs), batch_size)])
+
+
+def time_batches(backend, inputs: torch.Tensor, batch_size: int, repeat: int) -> tuple[float, float]:
+    batch = inputs[:batch_size]
+    if len(batch) < batch_size:
+        batch = batch.repeat((batch_size + len(batch) - 1) // len(batch), 1, 1, 1)[:batch_size]
+    backend(batch)  # warm-up
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        backend(batch)
+        timings.append(time.perf_counter() - started)
+    median = statistics.median(timings)
+    return median * 1000, batch_size / median
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--images", help="directory of test images")
+    parser.add_argument("--count", type=int, default=32, help="random inputs when --images is not given")
+    parser.add_argument("--backends", default="torch,int8,onnx")
+    parser.add_argument("--batch-sizes", default="1,8")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    inputs = load_inputs(args.images, args.count)
+    batch_sizes = [int(b) for b in args.batch_sizes.split(",")]
+    print(f"{len(inputs)} inputs, torch threads: {torch.get_num_threads()}")
+
+    reference = load_backend("torch", backend_path("torch"))
+    expected = run_all(reference, inputs, max(batch_sizes))
+
+    for name in args.backends.split(","):
+        try:
+            backend = reference if name == "torch" else load_backend(name, backend_path(name))
+        except (RuntimeError, FileNotFoundError, ValueError) as e:
+            print(f"\n[{name}] skipped: {e}")
+            continue
+
+        actual = run_all(backend, inputs, max(batch_sizes))
+        agreement = float((actual.argmax(1) == expected.argmax(1)).mean())
+        max_diff = float(np.abs(actual - expected).max())
+        print(f"\n[{name}] top-1 agreement with torch fp32: {agreement:.2%}, max |logit diff| {max_diff:.3g}")
+        for batch_size in batch_sizes:
+            latency_ms, throughput = time_batches(backend, inputs, batch_size, args.repeat)
+            print(f"  batch {batch_size:>3}: {latency_ms:8.1f} ms/batch  {throughput:7.1f} img/s")
+
+
+if __name__ == "__main__":
+    main()
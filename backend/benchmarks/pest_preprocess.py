@@ -0,0 +1,106 @@
+"""
+Memory and time of pest image preprocessing, original path vs. draft decoding.
+
+For a synthetic phone-sized JPEG (12 MP by default) each variant is run in
+a fresh process and reports:
+- peak RSS growth (ru_maxrss), which includes the decoder's buffers;
+- the tracemalloc peak (NumPy/torch allocations made from Python);
+- the median time per image.
+
+The draft output is also compared with the original one pixel by pixel.
+
+    python -m benchmarks.pest_preprocess [--width 4032 --height 3024 --repeat 20]
+"""
+import argparse
+import io
+import multiprocessing
+import resource
+import statistics
+import time
+import tracemalloc
+
+import numpy as np
+from PIL import Image
+
+from app.utils.image_utils import decode_full, decode_resized, valid_transform
+
+SIZE = (224, 224)
+
+
+def synthetic_jpeg(width: int, height: int) -> bytes:
+    rng = np.random.default_rng(0)
+    x = np.linspace(0, 255, width, dtype=np.float32)
+    y = np.linspace(0, 255, height, dtype=np.float32)[:, None]
+    base = np.stack([x + 0 * y, y + 0 * x, (x + y) / 2], axis=-1)
+    noisy = np.clip(base + rng.normal(0, 20, base.shape), 0, 255).astype(np.uint8)
+    buffer = io.BytesIO()
+    Image.fromarray(noisy).save(buffer, format="JPEG", quality=90)
+    return buffer.getvalue()
+
+
+def legacy(data: bytes) -> np.ndarray:
+    # The code path before the preprocessing stage was introduced.
+    image = Image.open(io.BytesIO(data)).convert("RGB")
+    arr = np.array(image)
+    sample = valid_transform()(image=arr)["image"]
+    return (sample.float() / 255.0).numpy()
+
+
+def full(data: bytes) -> np.ndarray:
+    return decode_full(data, SIZE).transpose(2, 0, 1) / np.float32(255.0)
+
+
+def draft(data: bytes) -> np.ndarray:
+    return decode_resized(data, SIZE).transpose(2, 0, 1) / np.float32(255.0)
+
+
+VARIANTS = {"legacy": legacy, "full": full, "draft": draft}
+
+
+def measure(name: str, data: bytes, repeat: int, results):
+    fn = VARIANTS[name]
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    tracemalloc.start()
+    fn(data)
+    _, traced_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    peak_growth = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline
+
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(data)
+        timings.append(time.perf_counter() - started)
+    # ru_maxrss is in KiB on Linux.
+    results.put((name, peak_growth * 1024, traced_peak, statistics.median(timings) * 1000))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--width", type=int, default=4032)
+    parser.add_argument("--height", type=int, default=3024)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--variants", default="legacy,full,draft")
+    args = parser.parse_args()
+
+    data = synthetic_jpeg(args.width, args.height)
+    print(f"{args.width}x{args.height} JPEG, {len(data) / 1e6:.1f} MB encoded")
+
+    ctx = multiprocessing.get_context("spawn")
+    results = ctx.Queue()
+    names = args.variants.split(",")
+    for name in names:
+        process = ctx.Process(target=measure, args=(name, data, args.repeat, results))
+        process.start()
+        process.join()
+        name, rss_growth, traced_peak, median_ms = results.get()
+        print(f"  {name:>6}: peak RSS +{rss_growth / 1e6:7.1f} MB   traced peak {traced_peak / 1e6:7.1f} MB   "
+              f"{median_ms:7.1f} ms/image")
+
+    if "draft" in names and "full" in names:
+        diff = np.abs(draft(data) - full(data))
+        print(f"draft vs full decode: mean |diff| {diff.mean():.4f}, max {diff.max():.4f} (pixel values in [0, 1])")
+
+
+if __name__ == "__main__":
+    main()
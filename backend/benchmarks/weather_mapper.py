@@ -0,0 +1,139 @@
+"""
+Compares the dict-based weather mapper against the original per-model mapper.
+
+Run from the backend directory:
+
+    python -m benchmarks.weather_mapper [--days 15] [--repeat 50]
+"""
+import argparse
+import json
+import random
+import timeit
+
+from app.schemas.weather import WeatherResponse, CurrentWeather, Forecast, ForecastDay, Hour, Day, Condition, Astro
+from app.utils.weather_mapper import map_weather, serialize
+
+ICONS = ["clear-day", "clear-night", "rain", "partly-cloudy-day", "partly-cloudy-night", "cloudy"]
+
+
+def synthetic_payload(days: int, seed: int = 0) -> dict:
+    rng = random.Random(seed)
+
+    def conditions() -> dict:
+        return {
+            "datetimeEpoch": rng.randint(1_700_000_000, 1_800_000_000),
+            "temp": round(rng.uniform(5, 45), 1),
+            "feelslike": round(rng.uniform(5, 45), 1),
+            "humidity": round(rng.uniform(10, 100), 1),
+            "precip": round(rng.uniform(0, 20), 1),
+            "precipprob": rng.choice([0, 10.5, 50, 100]),
+            "windspeed": round(rng.uniform(0, 40), 1),
+            "winddir": round(rng.uniform(0, 360), 1),
+            "uvindex": rng.randint(0, 11),
+            "conditions": "Partially cloudy",
+            "icon": rng.choice(ICONS),
+        }
+
+    return {
+        "resolvedAddress": "Delhi, India",
+        "currentConditions": {**conditions(), "datetime": "12:00:00"},
+        "days": [
+            {
+                **conditions(),
+                "datetime": f"2025-05-{i + 1:02d}",
+                "tempmax": 41.0,
+                "tempmin": 28.5,
+                "sunrise": "05:30:00",
+                "sunset": "19:10:00",
+                "hours": [{**conditions(), "datetime": f"{h:02d}:00:00"} for h in range(24)],
+            }
+            for i in range(days)
+        ],
+    }
+
+
+def legacy_map(data: dict, location: str) -> bytes:
+    """The mapper as it was in weather_service before the dict-based rewrite."""
+    current_conditions = data.get('currentConditions', {})
+    current_weather = CurrentWeather(
+        last_updated=current_conditions.get('datetime'),
+        last_updated_epoch=current_conditions.get('datetimeEpoch'),
+        temp_c=current_conditions.get('temp'),
+        feelslike_c=current_conditions.get('feelslike'),
+        condition=Condition(text=current_conditions.get('conditions'), icon=current_conditions.get('icon')),
+        wind_kph=float(current_conditions.get('windspeed', 0)) * 3.6,
+        wind_dir=current_conditions.get('winddir'),
+        humidity=current_conditions.get('humidity'),
+        precip_mm=current_conditions.get('precip'),
+        uv=current_conditions.get('uvindex'),
+        temp_f=current_conditions.get('temp') * 9/5 + 32 if current_conditions.get('temp') else None,
+        feelslike_f=current_conditions.get('feelslike') * 9/5 + 32 if current_conditions.get('feelslike') else None
+    )
+    forecast_days = []
+    for day_data in data.get('days', []):
+        hours = [
+            Hour(
+                time_epoch=hour.get('datetimeEpoch'),
+                time=hour.get('datetime'),
+                temp_c=hour.get('temp'),
+                is_day=1 if hour.get('icon').endswith('-day') else 0,
+                condition=Condition(text=hour.get('conditions'), icon=hour.get('icon')),
+                wind_kph=float(hour.get('windspeed', 0)) * 3.6,
+                humidity=hour.get('humidity'),
+                precip_mm=hour.get('precip'),
+                feelslike_c=hour.get('feelslike'),
+                uv=hour.get('uvindex')
+            )
+            for hour in day_data.get('hours', [])
+        ]
+        day = Day(
+            maxtemp_c=day_data.get('tempmax'),
+            mintemp_c=day_data.get('tempmin'),
+            avgtemp_c=day_data.get('temp'),
+            condition=Condition(text=day_data.get('conditions'), icon=day_data.get('icon')),
+            daily_chance_of_rain=day_data.get('precipprob'),
+            totalprecip_mm=day_data.get('precip'),
+            maxwind_kph=float(day_data.get('windspeed', 0)) * 3.6,
+            avghumidity=day_data.get('humidity'),
+            uv=day_data.get('uvindex')
+        )
+        astro = Astro(sunrise=day_data.get('sunrise'), sunset=day_data.get('sunset'))
+        forecast_days.append(ForecastDay(
+            date=day_data.get('datetime'),
+            date_epoch=day_data.get('datetimeEpoch'),
+            day=day,
+            astro=astro,
+            hour=hours
+        ))
+    weather_response = WeatherResponse(
+        resolvedAddress=data.get('resolvedAddress', location),
+        current=current_weather,
+        forecast=Forecast(forecastday=forecast_days)
+    )
+    # FastAPI serializes response models by alias.
+    return weather_response.model_dump_json(by_alias=True).encode()
+
+
+def fast_map(data: dict, location: str) -> bytes:
+    return serialize(map_weather(data, location))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type=int, default=15)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    data = synthetic_payload(args.days)
+    legacy = json.loads(legacy_map(data, "Delhi"))
+    fast = json.loads(fast_map(data, "Delhi"))
+    assert legacy == fast, "fast mapper output differs from the legacy mapper"
+    print(f"Parity OK ({args.days} days x 24 hours, {len(fast_map(data, 'Delhi'))} bytes)")
+
+    for name, fn in (("legacy (pydantic models)", legacy_map), ("fast (dict + pydantic-core json)", fast_map)):
+        seconds = timeit.timeit(lambda: fn(data, "Delhi"), number=args.repeat)
+        print(f"{name:34s} {seconds / args.repeat * 1000:8.2f} ms/response")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Exports the trained models to formats used by the optional inference backends.
+
+    python export_models.py pest [--output ml_models/pest_model.onnx] [--opset 17]
+    python export_models.py disease --format onnx|openvino [--imgsz 640]
+
+Run after setup_models.py; the exported files are picked up through the
+settings in app/core/config.py (e.g. PEST_BACKEND=onnx, PEST_ONNX_PATH).
+"""
+import argparse
+import logging
+import os
+import shutil
+
+import numpy as np
+import torch
+
+from app.core.config import settings
+from app.services import disease_detect_service
+from app.services.pest_detect_service import MODEL_PATH, load_torch_model
+from app.utils.inference_backends import OnnxBackend, export_onnx
+
+PEST_INPUT_SHAPE = (3, 224, 224)
+
+
+def export_pest(output: str, opset: int):
+    model = load_torch_model(MODEL_PATH, torch.device("cpu"))
+    export_onnx(model, output, PEST_INPUT_SHAPE, opset=opset)
+
+    # Quick sanity check on random input; benchmarks/pest_backends.py does the real parity run.
+    try:
+        session = OnnxBackend(output)
+    except RuntimeError as e:
+        print(f"Exported {output}; skipping check: {e}")
+        return
+    batch = torch.rand((4, *PEST_INPUT_SHAPE))
+    with torch.inference_mode():
+        expected = model(batch).numpy()
+    actual = session(batch)
+    print(f"Exported {output}: max |logit diff| {np.abs(expected - actual).max():.2e}, "
+          f"top-1 agreement {(expected.argmax(1) == actual.argmax(1)).mean():.0%}")
+
+
+def export_disease(fmt: str, imgsz: int):
+    from ultralytics import YOLO
+
+    target = disease_detect_service.backend_path(fmt)
+    # Static input shape: the service must run with the same DISEASE_IMGSZ.
+    exported = YOLO(disease_detect_service.MODEL_PATH).export(format=fmt, imgsz=imgsz, dynamic=False)
+    if os.path.abspath(exported) != os.path.abspath(target):
+        if os.path.isdir(target):
+            shutil.rmtree(target)
+        shutil.move(exported, target)
+    print(f"Exported {target} (imgsz={imgsz}); run with DISEASE_BACKEND={fmt} DISEASE_IMGSZ={imgsz}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="model", required=True)
+    pest = sub.add_parser("pest", help="export the pest classifier to ONNX")
+    pest.add_argument("--output", default=settings.PEST_ONNX_PATH)
+    pest.add_argument("--opset", type=int, default=17)
+    disease = sub.add_parser("disease", help="export the YOLO disease detector")
+    disease.add_argument("--format", choices=["onnx", "openvino"], default="onnx")
+    disease.add_argument("--imgsz", type=int, default=settings.DISEASE_IMGSZ or disease_detect_service.EXPORT_IMGSZ)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    if args.model == "pest":
+        export_pest(args.output, args.opset)
+    elif args.model == "disease":
+        export_disease(args.format, args.imgsz)
+
+
+if __name__ == "__main__":
+    main()
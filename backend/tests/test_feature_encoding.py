@@ -0,0 +1,123 @@
+"""
+Parity between the compiled market feature encoder and the sklearn pipeline.
+
+Fits small pipelines with the same structure as the training notebooks
+(StandardScaler on numeric columns + dense OneHotEncoder on categories) and
+checks that `compile_pipeline` encodes and predicts exactly like
+`Pipeline.predict` on a DataFrame. Run from the backend directory:
+
+    python -m pytest tests
+"""
+import random
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.compose import ColumnTransformer
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.linear_model import Ridge
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import MinMaxScaler, OneHotEncoder, StandardScaler
+from sklearn.tree import DecisionTreeRegressor
+
+from app.utils.feature_encoding import compile_pipeline
+
+NUMERIC = ["year", "month", "day_of_week", "day_of_month"]
+CATEGORICAL = ["State", "District", "Commodity", "Variety", "Grade"]
+UNKNOWN = "__unknown__"
+
+ESTIMATORS = {
+    "ridge": lambda: Ridge(alpha=1.0),
+    "decision_tree": lambda: DecisionTreeRegressor(max_depth=10, random_state=42),
+    "random_forest": lambda: RandomForestRegressor(n_estimators=20, random_state=42),
+}
+
+
+def random_columns(n: int, rng: random.Random, vocab: dict[str, list[str]], unknown_rate: float) -> dict:
+    dates = [date(2023, 1, 1) + timedelta(days=rng.randint(0, 900)) for _ in range(n)]
+    columns = {
+        "year": [d.year for d in dates],
+        "month": [d.month for d in dates],
+        "day_of_week": [d.weekday() for d in dates],
+        "day_of_month": [d.day for d in dates],
+    }
+    for name in CATEGORICAL:
+        columns[name] = [UNKNOWN if rng.random() < unknown_rate else rng.choice(vocab[name]) for _ in range(n)]
+    return columns
+
+
+@pytest.fixture(scope="module")
+def vocab() -> dict[str, list[str]]:
+    rng = random.Random(1)
+    return {name: [f"{name}-{i}" for i in range(rng.randint(3, 40))] for name in CATEGORICAL}
+
+
+@pytest.fixture(scope="module")
+def training_data(vocab):
+    rng = random.Random(2)
+    train = pd.DataFrame(random_columns(2000, rng, vocab, unknown_rate=0))
+    target = np.asarray([rng.uniform(500, 9000) for _ in range(len(train))])
+    return train, target
+
+
+def fit(training_data, estimator, numeric=None, categorical=None, **transformer_kwargs) -> Pipeline:
+    train, target = training_data
+    pre = ColumnTransformer([
+        ("num", numeric if numeric is not None else StandardScaler(), NUMERIC),
+        ("cat", categorical or OneHotEncoder(handle_unknown="ignore", sparse_output=False), CATEGORICAL),
+    ], **transformer_kwargs)
+    return Pipeline([("pre", pre), ("reg", estimator)]).fit(train, target)
+
+
+@pytest.mark.parametrize("estimator", sorted(ESTIMATORS))
+@pytest.mark.parametrize("rows", [1, 500])
+def test_predictions_match_pipeline(training_data, vocab, estimator, rows):
+    model = fit(training_data, ESTIMATORS[estimator]())
+    compiled = compile_pipeline(model)
+    assert compiled is not None
+
+    columns = random_columns(rows, random.Random(rows), vocab, unknown_rate=0.05)
+    expected = model.predict(pd.DataFrame(columns))
+    np.testing.assert_array_equal(compiled.predict(columns), expected)
+
+
+def test_encoding_matches_column_transformer(training_data, vocab):
+    model = fit(training_data, Ridge())
+    columns = random_columns(300, random.Random(3), vocab, unknown_rate=0.1)
+
+    expected = model.named_steps["pre"].transform(pd.DataFrame(columns))
+    np.testing.assert_array_equal(compile_pipeline(model).encode(columns), expected)
+
+
+def test_passthrough_and_dropped_columns(training_data, vocab):
+    train, target = training_data
+    train = train.assign(extra=1.0)
+    model = fit((train, target), Ridge(), numeric="passthrough", remainder="drop")
+    compiled = compile_pipeline(model)
+    assert compiled is not None
+
+    columns = random_columns(200, random.Random(4), vocab, unknown_rate=0.05)
+    columns["extra"] = [2.0] * 200
+    np.testing.assert_array_equal(compiled.predict(columns), model.predict(pd.DataFrame(columns)))
+
+
+def test_unknown_category_raises_like_pipeline(training_data, vocab):
+    model = fit(training_data, Ridge(), categorical=OneHotEncoder(handle_unknown="error", sparse_output=False))
+    columns = random_columns(5, random.Random(5), vocab, unknown_rate=0)
+    columns["Grade"][2] = UNKNOWN
+
+    with pytest.raises(ValueError):
+        model.predict(pd.DataFrame(columns))
+    with pytest.raises(ValueError):
+        compile_pipeline(model).predict(columns)
+
+
+@pytest.mark.parametrize("numeric, categorical", [
+    (MinMaxScaler(), None),
+    (None, OneHotEncoder(handle_unknown="ignore", sparse_output=True)),
+    (None, OneHotEncoder(handle_unknown="ignore", sparse_output=False, drop="first")),
+])
+def test_unsupported_pipelines_fall_back(training_data, numeric, categorical):
+    model = fit(training_data, Ridge(), numeric=numeric, categorical=categorical)
+    assert compile_pipeline(model) is None
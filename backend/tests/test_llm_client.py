@@ -0,0 +1,116 @@
+"""
+LLMClient against a local stub of the Groq chat completions endpoint
+(GROQ_BASE_URL), checking request coalescing and the concurrency cap.
+"""
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.services.llm_client import LLMClient
+
+
+class StubGroq(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, delay_seconds: float):
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.delay_seconds = delay_seconds
+        self.calls = 0
+        self.in_flight = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        server: StubGroq = self.server
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with server.lock:
+            server.calls += 1
+            server.in_flight += 1
+            server.peak = max(server.peak, server.in_flight)
+        time.sleep(server.delay_seconds)
+        with server.lock:
+            server.in_flight -= 1
+
+        body = json.dumps({
+            "id": f"stub-{server.calls}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request["model"],
+            "choices": [{
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": request["messages"][-1]["content"]},
+            }],
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    server = StubGroq(delay_seconds=0.2)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(settings, "GROQ_API_KEY", "test-key")
+    monkeypatch.setattr(settings, "GROQ_BASE_URL", server.url)
+    monkeypatch.setenv("NO_PROXY", "127.0.0.1")
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def ask(client: LLMClient, content: str):
+    return client.chat_completion(model="stub", messages=[{"role": "user", "content": content}])
+
+
+async def run_calls(client: LLMClient, contents: list[str]) -> list[str]:
+    try:
+        return await asyncio.gather(*(ask(client, content) for content in contents))
+    finally:
+        await client.shutdown()
+
+
+def test_identical_calls_share_one_upstream_call(stub):
+    client = LLMClient(max_concurrency=4, timeout_seconds=10, max_retries=0)
+    results = asyncio.run(run_calls(client, ["same question"] * 10))
+
+    assert results == ["same question"] * 10
+    assert stub.calls == 1
+
+
+def test_concurrency_is_capped(stub):
+    client = LLMClient(max_concurrency=2, timeout_seconds=10, max_retries=0)
+    contents = [f"question {i}" for i in range(6)]
+    results = asyncio.run(run_calls(client, contents))
+
+    assert results == contents
+    assert stub.calls == 6
+    assert stub.peak <= 2
+
+
+def test_missing_api_key_answers_503(stub, monkeypatch):
+    monkeypatch.setattr(settings, "GROQ_API_KEY", None)
+    client = LLMClient(max_concurrency=2, timeout_seconds=10, max_retries=0)
+
+    with pytest.raises(HTTPException) as excinfo:
+        asyncio.run(run_calls(client, ["question"]))
+    assert excinfo.value.status_code == 503
+    assert stub.calls == 0